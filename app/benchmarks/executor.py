@@ -0,0 +1,45 @@
+# run from the app directory: python -m benchmarks.executor --workers 4
+from src.haze.core import Haze
+from src.config.core import Config
+from src.encoder.core import NumericEncoder
+from src.decoder.core import ArgMax
+from src.haze.models import IdeaModel, DecoderModel
+from src.executor.core import Executor
+from src.executor.enums import ExecutorType
+from src.injector.core import Injector
+from src.injector.enums import GlobalTypes
+import argparse
+import random
+import time
+
+def measure(executor: Executor, features: int, repeats: int) -> float:
+    haze = Haze(persist=False, config=Config(signal_threshold=0.1, neuron_firing_threshold=0.1))
+    haze.load(aperature_size=32, nexus_size=64, terminus_size=16)
+    Injector.register(name=GlobalTypes.EXECUTOR, instance=executor)
+    encoder = NumericEncoder()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=ArgMax(), outputs=["a", "b"])])])
+    input_data = [random.random() for _ in range(features)]
+    haze.observe(input_data=input_data, encoder=encoder)
+
+    started = time.perf_counter()
+    for _ in range(repeats):
+        encoder.propogate(input_data)
+    return (time.perf_counter() - started) / repeats
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--features", type=int, nargs="+", default=[8, 64, 256, 1024])
+    args = parser.parse_args()
+
+    inline = Executor(type=ExecutorType.INLINE)
+    threads = Executor(type=ExecutorType.THREAD, workers=args.workers, inline_below=0)
+    print(f"{'features':>8} {'inline':>10} {'thread':>10} {'ratio':>6}")
+    for features in args.features:
+        random.seed(features)
+        inline_time = measure(inline, features, args.repeats)
+        random.seed(features)
+        thread_time = measure(threads, features, args.repeats)
+        print(f"{features:>8} {inline_time * 1e3:>8.2f}ms {thread_time * 1e3:>8.2f}ms {inline_time / thread_time:>5.2f}x")
+    threads.shutdown()
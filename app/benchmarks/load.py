@@ -0,0 +1,73 @@
+# run from the app directory: python -m benchmarks.load --connectors 100000 --workers 8
+from src.haze.core import Haze
+from src.core_io.enums import StorageType
+from uuid import uuid4
+import argparse
+import tempfile
+import random
+import shutil
+import json
+import time
+import os
+
+def write_directory(path: str, connectors: int, fan_out: int = 20, seed: int = 42):
+    random.seed(seed)
+    inter_count = max(connectors // fan_out, fan_out + 1)
+    meshes = ["aperture", "nexus", "terminus"]
+    inters = [(meshes[x % len(meshes)], str(uuid4())) for x in range(inter_count)]
+    motors = [str(uuid4()) for _ in range(4)]
+    sensors = [str(uuid4()) for _ in range(8)]
+
+    def write(data: dict, *parts: str):
+        file_path = os.path.join(path, *parts)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(f"{file_path}.json", "w") as file:
+            json.dump(data, file, indent=4)
+
+    def connect(dendrites: list[str]) -> list[str]:
+        connection_ids = []
+        for dendrite in dendrites:
+            connection_id = str(uuid4())
+            write({"dendrite_id": dendrite, "is_default": False, "epsilon": 0.7, "strength": random.uniform(0.4, 0.9), "id": connection_id}, "connections", connection_id)
+            connection_ids.append(connection_id)
+        return connection_ids
+
+    targets = [inter_id for _, inter_id in inters] + motors
+    for mesh, inter_id in inters:
+        dendrites = random.sample([t for t in targets if t != inter_id][:fan_out * 4], fan_out)
+        write({"type": "inter", "id": inter_id, "connections": connect(dendrites)}, "meshes", mesh, inter_id)
+
+    for sensor_id in sensors:
+        dendrites = random.sample([inter_id for _, inter_id in inters], fan_out)
+        write({"type": "sensor", "id": sensor_id, "connections": connect(dendrites)}, "encoders", "numeric", sensor_id)
+
+    for x, motor_id in enumerate(motors):
+        write({"id": motor_id, "answer": str(x), "connections": []}, "decoders", "argmax", motor_id)
+
+def measure(path: str, workers: int) -> float:
+    haze = Haze(model_path=path, persist=True, storage=StorageType.DIRECTORY)
+    haze.load(workers=workers)
+    report = haze.get_load_report()
+    print(f"workers={workers:<3} total={report.total:.3f}s " + " ".join(f"{phase}={seconds:.3f}s" for phase, seconds in report.phases.items()))
+    return report.total
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--connectors", type=int, default=100000)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--path", type=str, default=None)
+    args = parser.parse_args()
+
+    path = args.path or tempfile.mkdtemp(prefix="haze-load-")
+    if not os.path.exists(os.path.join(path, "connections")):
+        started = time.perf_counter()
+        write_directory(path, args.connectors)
+        print(f"wrote {args.connectors} connectors to {path} in {time.perf_counter() - started:.1f}s")
+
+    try:
+        serial = measure(path, workers=1)
+        parallel = measure(path, workers=args.workers)
+        print(f"speedup={serial / parallel:.2f}x")
+    finally:
+        if args.path is None:
+            shutil.rmtree(path)
@@ -0,0 +1,89 @@
+# run from the app directory: python -m benchmarks.serving --clients 32
+from src.haze.core import Haze
+from src.encoder.core import NumericEncoder
+from src.decoder.core import ArgMax
+from src.haze.models import IdeaModel, DecoderModel
+from src.serving.core import AsyncHaze
+from src.engine.enums import EngineType
+from typing import Awaitable, Callable
+import numpy as np
+import argparse
+import asyncio
+import random
+import time
+
+# batches are only propogated in a single pass on a compiled engine.
+def build(engine: EngineType) -> tuple[Haze, NumericEncoder]:
+    random.seed(7)
+    haze = Haze(persist=False, engine=engine)
+    haze.load()
+    encoder = NumericEncoder()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=ArgMax(), outputs=["a", "b", "c"])])])
+    return haze, encoder
+
+# every client sends requests at fixed arrival times, latency is counted from the arrival so time spent
+# waiting on a blocked event loop is included.
+async def drive(handle: Callable[[list[float]], Awaitable], clients: int, requests: int, features: int, interval: float) -> tuple[np.ndarray, float]:
+    latencies: list[float] = []
+    origin = time.perf_counter()
+
+    async def client(seed: int):
+        rng = random.Random(seed)
+        for x in range(requests):
+            arrival = origin + (x + rng.random()) * interval
+            await asyncio.sleep(max(arrival - time.perf_counter(), 0))
+            await handle([rng.random() for _ in range(features)])
+            latencies.append(time.perf_counter() - arrival)
+
+    # a ticker that should wake every millisecond, its worst overshoot is how long the loop was blocked.
+    async def ticker(done: asyncio.Event):
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.001)
+            stalls.append(time.perf_counter() - started - 0.001)
+
+    stalls: list[float] = []
+    done = asyncio.Event()
+    ticking = asyncio.create_task(ticker(done))
+    await asyncio.gather(*[client(seed) for seed in range(clients)])
+    done.set()
+    await ticking
+    return np.array(latencies), max(stalls)
+
+def report(name: str, latencies: np.ndarray, stall: float, elapsed: float) -> None:
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    print(f"{name:>8} {p50:>8.2f}ms {p99:>8.2f}ms {stall * 1e3:>8.2f}ms {latencies.size / elapsed:>8.0f}/s")
+
+async def main(args: argparse.Namespace) -> None:
+    haze, encoder = build(EngineType(args.engine))
+
+    # the synchronous path runs propogation directly on the event loop.
+    async def blocking(input_data: list[float]):
+        haze.observe(input_data=input_data, encoder=encoder)
+        return haze.predict()
+
+    started = time.perf_counter()
+    latencies, stall = await drive(blocking, args.clients, args.requests, args.features, args.interval)
+    print(f"{'path':>8} {'p50':>10} {'p99':>10} {'stall':>10} {'rate':>10}")
+    report("sync", latencies, stall, time.perf_counter() - started)
+
+    # a fresh model so both paths start from the same network.
+    haze, encoder = build(EngineType(args.engine))
+    serving = AsyncHaze(haze, window=args.window, max_batch=args.max_batch)
+    started = time.perf_counter()
+    latencies, stall = await drive(lambda input_data: serving.observe_and_predict(input_data, encoder=encoder), args.clients, args.requests, args.features, args.interval)
+    report("async", latencies, stall, time.perf_counter() - started)
+    stats = serving.get_stats()
+    print(f"batches {stats.batches} ({stats.combined_batches} in one pass), mean size {stats.get_mean_batch_size():.1f}, max size {stats.max_batch_size}")
+    await serving.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--features", type=int, default=16)
+    parser.add_argument("--interval", type=float, default=0.05)
+    parser.add_argument("--window", type=float, default=0.002)
+    parser.add_argument("--max-batch", type=int, default=32)
+    parser.add_argument("--engine", default=EngineType.COMPILED.value, choices=[e.value for e in EngineType])
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,57 @@
+# run from the app directory: python -m benchmarks.shard --workers 4
+# a single observation is one connected component and always runs in process, so this times a batch of observations,
+# propogated as one compiled pass or split over the worker processes by the sharded engine.
+from src.haze.core import Haze
+from src.config.core import Config
+from src.encoder.core import NumericEncoder
+from src.decoder.core import ArgMax
+from src.haze.models import IdeaModel, DecoderModel
+from src.engine.core import Engine
+from src.engine.enums import EngineType
+from src.injector.core import Injector
+from src.injector.enums import GlobalTypes
+from src.executor.enums import ExecutorType
+import argparse
+import random
+import time
+
+def measure(engine: EngineType, executor: ExecutorType, workers: int, features: int, batch: int, repeats: int) -> float:
+    haze = Haze(
+        persist=False,
+        config=Config(signal_threshold=0.1, neuron_firing_threshold=0.1),
+        engine=engine,
+        executor=executor,
+        workers=workers
+    )
+    haze.load(aperature_size=32, nexus_size=64, terminus_size=16)
+    encoder = NumericEncoder()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=ArgMax(), outputs=["a", "b"])])])
+    rows = [[random.random() for _ in range(features)] for _ in range(batch)]
+    haze.observe(input_data=rows[0], encoder=encoder)
+    engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+    staged = [encoder.stage(row) for row in rows]
+
+    # the first sharded call starts the pool and shares the graph.
+    engine.propogate_batch(staged)
+    started = time.perf_counter()
+    for _ in range(repeats):
+        engine.propogate_batch(staged)
+    elapsed = (time.perf_counter() - started) / repeats
+    haze.close()
+    return elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--features", type=int, nargs="+", default=[64, 1024, 8192])
+    args = parser.parse_args()
+
+    print(f"{'features':>8} {'compiled':>10} {'sharded':>10} {'ratio':>6}")
+    for features in args.features:
+        random.seed(features)
+        compiled_time = measure(EngineType.COMPILED, ExecutorType.INLINE, 1, features, args.batch, args.repeats)
+        random.seed(features)
+        sharded_time = measure(EngineType.SHARDED, ExecutorType.PROCESS, args.workers, features, args.batch, args.repeats)
+        print(f"{features:>8} {compiled_time * 1e3:>8.2f}ms {sharded_time * 1e3:>8.2f}ms {compiled_time / sharded_time:>5.2f}x")
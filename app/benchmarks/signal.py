@@ -0,0 +1,36 @@
+# run from the app directory: python -m benchmarks.signal --hops 200000
+from src.signal.core import Signal
+from src.transmission.core import Transmission
+from src.context.core import Context
+import argparse
+import tracemalloc
+import time
+
+def hop(context: Context, value: float) -> Transmission:
+    signal = Signal(value=value)
+    signal.propogate(0.8)
+    signal.get_actual()
+    return Transmission(context=context, signal=signal)
+
+def measure(hops: int) -> tuple[float, float]:
+    context = Context()
+    started = time.perf_counter()
+    for _ in range(hops):
+        hop(context, 0.9)
+    elapsed = time.perf_counter() - started
+
+    # live bytes per hop while every transmission of an observation is still referenced.
+    tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    kept = [hop(context, 0.9) for _ in range(min(hops, 10000))]
+    grown = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(snapshot, "filename"))
+    tracemalloc.stop()
+    return elapsed / hops * 1e9, grown / len(kept)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hops", type=int, default=200000)
+    args = parser.parse_args()
+
+    ns, size = measure(args.hops)
+    print(f"hops={args.hops} {ns:.0f}ns/hop {size:.0f}B/hop")
@@ -0,0 +1,253 @@
+# run from the app directory: python -m benchmarks.suite --sizes small medium --output results.json
+# compare against an earlier run: python -m benchmarks.suite --baseline results.json --tolerance 0.2
+from src.haze.core import Haze
+from src.haze.models import IdeaModel, DecoderModel
+from src.config.core import Config
+from src.context.core import Context
+from src.signal.core import Signal
+from src.transmission.core import Transmission
+from src.encoder.core import NumericEncoder
+from src.decoder.core import Decoder, ArgMax, Regressor, SoftMax, Binary, Vector, TopK, Bitmask
+from src.registry.core import Registry
+from src.core_io.core import CoreIO
+from src.core_io.enums import StorageType
+from src.injector.core import Injector
+from src.injector.enums import GlobalTypes
+from dataclasses import dataclass
+from typing import Any, Callable
+import numpy as np
+import argparse
+import platform
+import tempfile
+import random
+import shutil
+import json
+import gc
+import time
+import sys
+
+@dataclass
+class SizeModel:
+    aperature_size: int
+    nexus_size: int
+    terminus_size: int
+    features: int
+    outputs: int
+    # inters added through Mesh.add_neurons on top of create_network.
+    grown: int
+
+SIZES: dict[str, SizeModel] = {
+    "small": SizeModel(aperature_size=4, nexus_size=8, terminus_size=4, features=8, outputs=4, grown=4),
+    "medium": SizeModel(aperature_size=16, nexus_size=32, terminus_size=16, features=32, outputs=16, grown=16),
+    "large": SizeModel(aperature_size=48, nexus_size=96, terminus_size=48, features=128, outputs=64, grown=48)
+}
+
+# each repeat runs `number` operations after an untimed setup.
+# like timeit, the garbage collector is paused while a repeat is timed.
+def measure(run: Callable[[Any], None], setup: Callable[[], Any] = None, repeats: int = 5, number: int = 1) -> dict[str, float]:
+    samples: list[float] = []
+    for _ in range(repeats):
+        state = setup() if setup is not None else None
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run(state)
+            samples.append((time.perf_counter() - started) / number)
+        finally:
+            gc.enable()
+    return {
+        "median_us": float(np.median(samples) * 1e6),
+        "min_us": float(np.min(samples) * 1e6),
+        "repeats": repeats,
+        "number": number
+    }
+
+def build(size: SizeModel, seed: int = 42, **kwargs) -> tuple[Haze, NumericEncoder, ArgMax]:
+    random.seed(seed)
+    haze = Haze(config=Config(signal_threshold=0.1, neuron_firing_threshold=0.1), seed=seed, **kwargs)
+    haze.load(aperature_size=size.aperature_size, nexus_size=size.nexus_size, terminus_size=size.terminus_size)
+    grown = haze.network.mesh.nexus.add_neurons(size.grown)
+    haze.network.connect_mesh(grown, haze.network.mesh.terminus.get_inters())
+    encoder = NumericEncoder()
+    decoder = ArgMax()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=decoder, outputs=list(range(size.outputs)))])])
+    decoder.set_outputs(list(range(size.outputs)))
+    encoder.check_sensors([0.0] * size.features)
+    return haze, encoder, decoder
+
+def bench_propogation(size: SizeModel, repeats: int) -> dict[str, dict]:
+    haze, encoder, decoder = build(size, persist=False)
+    input_data = [random.random() for _ in range(size.features)]
+    results: dict[str, dict] = {}
+
+    results["encoder_propogate"] = measure(
+        lambda _: encoder.propogate(input_data),
+        setup=lambda: decoder._reset_motors(),
+        repeats=repeats
+    )
+
+    inter = haze.network.mesh.aperature.get_inters()[0]
+    connector = inter.get_connections()[0]
+    number = 1000
+    results["connector_transmit"] = measure(
+        lambda contexts: [connector.transmit(Transmission(context=c, signal=Signal(value=0.9))) for c in contexts],
+        setup=lambda: [Context() for _ in range(number)],
+        repeats=repeats,
+        number=number
+    )
+
+    # transmit buffers the signal and the context run fires the inter into its connectors.
+    def fire(contexts: list[Context]):
+        for c in contexts:
+            inter.transmit(Transmission(context=c, signal=Signal(value=0.9)))
+            c.run()
+
+    number = 200
+    results["inter_transmit"] = measure(fire, setup=lambda: [Context() for _ in range(number)], repeats=repeats, number=number)
+    return results
+
+def bench_decoders(size: SizeModel, repeats: int) -> dict[str, dict]:
+    build(size, persist=False)
+    decoders: list[tuple[Decoder, list, dict]] = [
+        (ArgMax(), list(range(size.outputs)), {}),
+        (Regressor(), [float(x) for x in range(size.outputs)], {}),
+        (SoftMax(), list(range(size.outputs)), {}),
+        (Binary(), None, {}),
+        (Vector(), [[float(x), float(x + 1)] for x in range(size.outputs)], {}),
+        (TopK(), list(range(size.outputs)), {"k": 3}),
+        (Bitmask(), list(range(size.outputs)), {"threshold": 0.5})
+    ]
+    results: dict[str, dict] = {}
+    number = 100
+
+    for decoder, outputs, kwargs in decoders:
+        if outputs is None:
+            decoder.set_outputs()
+        else:
+            decoder.set_outputs(outputs)
+
+        # predict resets the motors, so every call is given fresh signals first.
+        def predict(_, decoder: Decoder = decoder, kwargs: dict = kwargs):
+            for _ in range(number):
+                for m in decoder.get_motors():
+                    m.accumulate(np.random.random(4))
+                decoder.predict(**kwargs)
+
+        results[f"decoder_predict_{decoder.get_type()}"] = measure(predict, repeats=repeats, number=number)
+    return results
+
+def bench_learning(size: SizeModel, repeats: int) -> dict[str, dict]:
+    haze, encoder, decoder = build(size, persist=False)
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    config: Config = Injector.resolve(GlobalTypes.CONFIG)
+    results: dict[str, dict] = {}
+
+    def activate():
+        registry._status[np.random.random(registry.get_size()) < 0.5] = 1
+
+    results["registry_learn"] = measure(lambda _: registry.learn(confidence=0.5, reward=0.6), setup=activate, repeats=repeats)
+
+    # the pruning loop of Haze.learn, the mask is rebuilt each time so no connection has to be removed.
+    def prune(_):
+        mask = registry.get_pruning_mask(config.signal_threshold)
+        for n in haze.network.get_all_neurons():
+            n.prune_connections(mask)
+
+    results["haze_prune"] = measure(prune, repeats=repeats)
+
+    input_data = [random.random() for _ in range(size.features)]
+
+    def observe():
+        haze.observe(input_data=input_data, encoder=encoder)
+        haze.predict(limit=3)
+
+    results["haze_learn"] = measure(lambda _: haze.learn(reward=0.6), setup=observe, repeats=repeats)
+    return results
+
+def bench_storage(size: SizeModel, repeats: int) -> dict[str, dict]:
+    path = tempfile.mkdtemp()
+    results: dict[str, dict] = {}
+    try:
+        haze, _, _ = build(size, model_path=path, persist=True)
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+        files = [c.get_state_file() for c in registry._connectors if c is not None]
+        results["core_save_files"] = measure(lambda _: core.save_files(files), repeats=repeats)
+        snapshot = haze._build_snapshot()
+        results["core_save_snapshot"] = measure(lambda _: core.save_snapshot(snapshot), repeats=repeats)
+
+        results["haze_load_directory"] = measure(
+            lambda _: Haze(model_path=path, persist=True).load(),
+            repeats=repeats
+        )
+        results["haze_load_snapshot"] = measure(
+            lambda _: Haze(model_path=path, persist=True, storage=StorageType.SNAPSHOT).load(),
+            repeats=repeats
+        )
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+    return results
+
+BENCHMARKS: list[Callable[[SizeModel, int], dict[str, dict]]] = [bench_propogation, bench_decoders, bench_learning, bench_storage]
+
+def run(sizes: list[str], repeats: int) -> dict:
+    results: dict[str, dict] = {}
+    for name in sizes:
+        results[name] = {}
+        for bench in BENCHMARKS:
+            results[name].update(bench(SIZES[name], repeats))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "created": time.time(),
+            "repeats": repeats
+        },
+        "results": results
+    }
+
+# a benchmark regresses when the metric grows by more than the tolerance, missing entries are skipped.
+# the fastest repeat is the default metric since it is the least disturbed by other load on the machine.
+def compare(current: dict, baseline: dict, tolerance: float, metric: str = "min_us") -> list[str]:
+    regressions: list[str] = []
+    print(f"{'size':>8} {'benchmark':<36} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for size, benches in current["results"].items():
+        for name, result in benches.items():
+            previous = baseline["results"].get(size, {}).get(name)
+            if previous is None:
+                continue
+            ratio = result[metric] / max(previous[metric], 1e-9)
+            flag = ""
+            if ratio > 1 + tolerance:
+                flag = " !"
+                regressions.append(f"{size}/{name}")
+            print(f"{size:>8} {name:<36} {previous[metric]:>10.1f}us {result[metric]:>10.1f}us {ratio:>6.2f}x{flag}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", nargs="+", default=["small", "medium"], choices=list(SIZES.keys()))
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", type=str, default=None)
+    parser.add_argument("--baseline", type=str, default=None)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--metric", type=str, default="min_us", choices=["min_us", "median_us"])
+    args = parser.parse_args()
+
+    current = run(args.sizes, args.repeats)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(current, file, indent=4)
+
+    if args.baseline is None:
+        print(json.dumps(current, indent=4))
+        sys.exit(0)
+
+    with open(args.baseline, "r") as file:
+        baseline = json.load(file)
+    regressions = compare(current, baseline, args.tolerance, args.metric)
+    if len(regressions) > 0:
+        print(f"regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
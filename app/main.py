@@ -2,7 +2,9 @@ from src.haze.core import Haze
 from src.haze.models import IdeaModel, DecoderModel
 from src.encoder.core import NumericEncoder
 from src.decoder.core import ArgMax
-from src.dataset.core import generate_binary_sequence
+from src.dataset.core import generate, iter_rows
+from src.dataset.enums import DatasetType
+from src.trainer.core import Trainer
 
 def main():
     haze = Haze(sequential=True, persist=False)
@@ -16,27 +18,20 @@ def main():
     haze.set_lexical_chain(lexical_chain=lexical_set)
     row_size = 8
     dataset_size = 10000
-    dataset = generate_binary_sequence(dataset_size=dataset_size, row_size=row_size)
-    reward_scoring = []
-    for row in dataset:
-        haze.observe(input_data=row, encoder=lexical_set[0].encoders[0])
-        decoder_id = lexical_set[0].decoders[0].decoder.get_id(as_string=True)
-        prediction = haze.predict(row_size)
+    decoder_id = lexical_set[0].decoders[0].decoder.get_id(as_string=True)
+
+    def score(expected: list[int], prediction: dict[str, list]) -> float:
         result = prediction[decoder_id]
-        reward = 0
-        if len(result) == row_size:
-            for answer, problem in zip(row, result):
-                if answer == problem:
-                    reward += 1
-        reward = reward/row_size
-        print(row)
-        print(result)
-        print(reward)
-        reward_scoring.append(reward)
-        haze.learn(reward=reward)
+        if len(result) != row_size:
+            return 0
+        return sum(answer == problem for answer, problem in zip(expected, result)) / row_size
 
-    print(reward_scoring)
+    # the sequence task asks the model to reproduce its input.
+    rows = iter_rows(generate(DatasetType.COPY, rows=dataset_size, width=row_size))
+    trainer = Trainer(haze=haze, encoder=lexical_set[0].encoders[0], reward=score, limit=row_size, verbose=True)
+    report = trainer.practice(rows)
+    print(f"mean reward {report.get_mean_reward():.3f} over {report.rows} rows at {report.get_rows_per_second():.1f} rows/s")
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
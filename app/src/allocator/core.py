@@ -0,0 +1,17 @@
+from threading import Lock
+
+# hands out dense integer indices to neurons, uuids are only kept for persistence.
+# every model registers its own allocator, so indices of one model never shift when another is created.
+class Allocator:
+    def __init__(self):
+        self._next: int = 0
+        self._lock = Lock()
+
+    def allocate(self) -> int:
+        with self._lock:
+            index = self._next
+            self._next += 1
+            return index
+
+    def get_size(self) -> int:
+        return self._next
@@ -14,7 +14,9 @@ class Config:
             growth_threshold: float = 0.5,
             audit_window: int = 10,
             relearn_limit: int = 100,
-            neuron_firing_threshold: float = 0.5
+            neuron_firing_threshold: float = 0.5,
+            journal_limit: int = 100000,
+            compact_ratio: float = 0.25
         ):
         self.signal_threshold = signal_threshold
         self.epsilon_decay = epsilon_decay
@@ -30,6 +32,8 @@ class Config:
         self.audit_window = audit_window
         self.relearn_limit = relearn_limit
         self.neuron_firing_threshold = neuron_firing_threshold
+        self.journal_limit = journal_limit
+        self.compact_ratio = compact_ratio
         self._check_config()
 
     def get_threshold(self):
@@ -67,4 +71,10 @@ class Config:
             raise Exception("Value must be between 0.1 and 0.9")
         
         if self.neuron_firing_threshold > 0.9 or self.neuron_firing_threshold < 0.1:
-            raise Exception("Value must be between 0.1 and 0.9")
\ No newline at end of file
+            raise Exception("Value must be between 0.1 and 0.9")
+        
+        if self.journal_limit < 1:
+            raise Exception("Value must be greater than 0")
+        
+        if self.compact_ratio > 1 or self.compact_ratio < 0:
+            raise Exception("Value must be between 0 and 1")
\ No newline at end of file
@@ -1,38 +1,56 @@
 from uuid import UUID
 from ..neuron.interface import INeuron
 from ..neuron.enums import NeuronType
-from ..threader.core import Threader
 from ..entity.core import Entity
 from .errors import DendriteAlreadyExistsError, NoIndexSetError
 from ..context.core import Context
 from ..transmission.core import Transmission
 from ..core_io.core import CoreIO
+from ..core_io.models import FileModel
 from ..registry.interface import IRegistry
 from ..injector.core import Injector
 from ..injector.enums import GlobalTypes
 from ..config.core import Config
 import os
 
-class Connector(Threader, Entity):
+# a thin view over a row of the registry's connector table, it owns no lock or queue.
+# registered views keep the registry that owns their row, so a hop never goes through the injector.
+class Connector(Entity):
     def __init__(
             self, 
             dendrite: INeuron = None, 
             id: UUID = None, 
             is_default: bool =False
         ):
-        Threader.__init__(self)
         Entity.__init__(self, id)
         self._dendrite: INeuron = dendrite
-        self._history: list[UUID] = []
-        self.is_default = is_default
-        self.core: CoreIO = Injector.resolve(GlobalTypes.CORE)
-        self._registry: IRegistry = Injector.resolve(GlobalTypes.REGISTRY)
-        self._config: Config = Injector.resolve(GlobalTypes.CONFIG)
+        self._is_default: bool = is_default
         self._index = None
+        self._registry: IRegistry = None
+
+    @property
+    def is_default(self) -> bool:
+        if self._index is None:
+            return self._is_default
+        
+        return self._registry.get_table().get_default(self._index)
+
+    @is_default.setter
+    def is_default(self, value: bool) -> None:
+        if self._index is None:
+            self._is_default = value
+            return
+        
+        self._registry.get_table().set_default(self._index, value)
+
+    def set_axon(self, axon: int) -> None:
+        if self._index is None:
+            return
+        
+        self._registry.get_table().set_axon(self._index, axon)
 
     def reset(self, dendrite: INeuron):
         self._dendrite = dendrite
-        self._registry
     
     def get_decay(self):
         if self._index is None:
@@ -40,8 +58,9 @@ class Connector(Threader, Entity):
         
         return self._registry.get_decay()
 
-    def set_index(self, index: int):
+    def set_index(self, index: int, registry: IRegistry):
         self._index = index
+        self._registry = registry
 
     def get_strength(self):
         if self._index is None:
@@ -62,10 +81,17 @@ class Connector(Threader, Entity):
         
         return self._registry.get_epsilon(self._index)
     
+    def get_state_file(self) -> FileModel:
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        return FileModel(
+            path=os.path.join(core._connection_path, self.get_id(as_string=True)),
+            data=self.record()
+        )
+
     def save_state(self):
-        state = self.record()
-        path = os.path.join(self.core._connection_path, self.get_id(as_string=True))
-        self.core.save_to_file(state, path)
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        file = self.get_state_file()
+        core.save_to_file(file.data, file.path)
     
     def get_dendrite(self):
         return self._dendrite
@@ -80,25 +106,21 @@ class Connector(Threader, Entity):
             if not self._dendrite.get_active():
                 return 
             
-        self.enqueue(ingress)
-
-        while not self._queue.empty():
-            with self._lock:
-                egress: Transmission = self.dequeue()
-            context: Context = egress.get_context()
-            if context.get_id() not in self._history:
-                self._history.append(context.get_id())
-                signal = egress.get_signal()
-                signal.propogate(self.get_strength())
+        context: Context = ingress.get_context()
+        # registered connectors are keyed by their registry row, loose ones by identity.
+        if not context.visit(self if self._index is None else self._index):
+            return
 
-                if signal.get_actual() > self._config.get_threshold():
-                    if self._index is not None:
-                        self._registry.activate_connector(self._index) 
+        # loose connectors have no registry to read the config through.
+        config: Config = Injector.resolve(GlobalTypes.CONFIG) if self._registry is None else self._registry.get_config()
+        signal = ingress.get_signal()
+        signal.propogate(self.get_strength())
 
-                    context.enqueue(self._dendrite.transmit, egress)
+        if signal.get_actual() > config.get_threshold():
+            if self._registry is not None:
+                self._registry.activate_connector(self._index) 
 
-    def clear_history(self):
-        self._history = []
+            context.enqueue(self._dendrite.transmit, ingress)
 
     def record(self):
         connector = {
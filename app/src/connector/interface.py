@@ -6,8 +6,8 @@ from ..transmission.core import Transmission
 
 class IConnector(ABC):
     @abstractmethod
-    def set_index(self, index: int) -> None:
-        """Sets the location in the registry memory that the connector stores its strength and epsilon values."""
+    def set_index(self, index: int, registry) -> None:
+        """Sets the location in the registry memory that the connector stores its strength and epsilon values, and the registry that holds it."""
         pass
     
     @abstractmethod
@@ -55,11 +55,6 @@ class IConnector(ABC):
         """Handles the transmission of a signal through the connector."""
         pass
 
-    @abstractmethod
-    def clear_history(self) -> None:
-        """Clears the history of processed transmissions."""
-        pass
-
     @abstractmethod
     def record(self) -> dict:
         """Returns a dictionary representation of the connector's state."""
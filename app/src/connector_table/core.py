@@ -0,0 +1,67 @@
+import numpy as np
+from numpy.typing import NDArray
+
+# connectors stored as rows instead of objects, a row lines up with the connector's registry index.
+# axons and dendrites hold neuron indices, an axon of -1 means the connector is not posted to a neuron.
+class ConnectorTable:
+    def __init__(self):
+        self._size: int = 0
+        self._axon_store: NDArray = np.zeros(0, dtype=np.int64)
+        self._dendrite_store: NDArray = np.zeros(0, dtype=np.int64)
+        self._default_store: NDArray = np.zeros(0, dtype=bool)
+        self._set_size(0)
+
+    def get_size(self) -> int:
+        return self._size
+
+    def get_capacity(self) -> int:
+        return self._axon_store.size
+
+    def _reserve(self, count: int) -> None:
+        required = self._size + count
+        capacity = self._axon_store.size
+        if required <= capacity:
+            return
+
+        capacity = max(required, capacity * 2, 16)
+        self._axon_store = self._grow(self._axon_store, capacity)
+        self._dendrite_store = self._grow(self._dendrite_store, capacity)
+        self._default_store = self._grow(self._default_store, capacity)
+
+    def _grow(self, store: NDArray, capacity: int) -> NDArray:
+        grown = np.zeros(capacity, dtype=store.dtype)
+        grown[:self._size] = store[:self._size]
+        return grown
+
+    def _set_size(self, size: int) -> None:
+        self._size = size
+        self.axons = self._axon_store[:size]
+        self.dendrites = self._dendrite_store[:size]
+        self.defaults = self._default_store[:size]
+
+    def append(self, dendrites: list[int], defaults: list[bool]) -> int:
+        count = len(dendrites)
+        start = self._size
+        self._reserve(count)
+        self._axon_store[start:start + count] = -1
+        self._dendrite_store[start:start + count] = dendrites
+        self._default_store[start:start + count] = defaults
+        self._set_size(start + count)
+        return start
+
+    def set_axon(self, row: int, axon: int) -> None:
+        self.axons[row] = axon
+
+    def get_default(self, row: int) -> bool:
+        return bool(self.defaults[row])
+
+    def set_default(self, row: int, value: bool) -> None:
+        self.defaults[row] = value
+
+    # keeps only the given rows, in order, so row i of the result was row keep[i].
+    def compact(self, keep: NDArray) -> None:
+        count = keep.size
+        self._axon_store[:count] = self.axons[keep]
+        self._dendrite_store[:count] = self.dendrites[keep]
+        self._default_store[:count] = self.defaults[keep]
+        self._set_size(count)
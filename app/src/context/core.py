@@ -1,5 +1,5 @@
 from uuid import UUID, uuid4
-from typing import Callable
+from typing import Any, Callable
 from ..threader.core import Threader
 from ..entity.core import Entity
 
@@ -14,10 +14,35 @@ class Context(Threader, Entity):
         self.active = True
         self.energy_log = []
         self.on_finish = on_finish
+        # connectors already crossed in this propogation, released with the context.
+        self._visited: set[Any] = set()
+        # signals waiting at a neuron until it fires.
+        self._buffers: dict[Any, list] = {}
 
     def enqueue(self, func: Callable, *args: tuple, **kwargs: dict):
         super().enqueue((func, args, kwargs))
 
+    # returns False when the key was already visited.
+    def visit(self, key: Any) -> bool:
+        if key in self._visited:
+            return False
+        
+        self._visited.add(key)
+        return True
+
+    # returns True for the first signal to reach the neuron since it last fired.
+    def buffer(self, neuron: Any, signal: Any) -> bool:
+        signals = self._buffers.get(neuron)
+        if signals is None:
+            self._buffers[neuron] = [signal]
+            return True
+        
+        signals.append(signal)
+        return False
+
+    def drain(self, neuron: Any) -> list:
+        return self._buffers.pop(neuron, [])
+
     def run(self):
         while not self._queue.empty():
             func, args, kwargs = self._queue.get()
@@ -1,3 +1,11 @@
+from .models import FileModel, SnapshotModel
+from .enums import StorageType
+from uuid import UUID
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from numpy.typing import NDArray
+import zipfile
+import struct
 import json
 import os
 
@@ -16,9 +24,24 @@ import os
 # --/--/terminus
 # --/connections
 # --/--/<connection_id>.json
+#
+# snapshot storage keeps the whole model in a single file instead
+# /core
+# --/model.npz
+#
+# journal storage appends every change to a log that is periodically folded into the snapshot
+# /core
+# --/model.npz
+# --/journal.log
 
 class CoreIO:
-    def __init__(self, path: str = None, persist: bool = False):
+    def __init__(
+            self, 
+            path: str = None, 
+            persist: bool = False, 
+            storage: StorageType = StorageType.DIRECTORY,
+            compact_after: int = 100000
+        ):
         self._path = path or os.path.join(os.getcwd(), 'app', 'core')
         self._connection_path = os.path.join(self._path, "connections")
         self._mesh_path = os.path.join(self._path, 'meshes')
@@ -27,14 +50,44 @@ class CoreIO:
         self._terminus_path = os.path.join(self._mesh_path, 'terminus')
         self._encoder_path = os.path.join(self._path, 'encoders')
         self._decoder_path = os.path.join(self._path, 'decoders')
+        self._snapshot_path = os.path.join(self._path, 'model.npz')
+        self._journal_path = os.path.join(self._path, 'journal.log')
         self._persist = persist
+        self._storage = storage
+        self._compact_after = compact_after
+        self._journal_size = 0
+
+    def is_persistent(self) -> bool:
+        return self._persist
+
+    # incremental storage writes every neuron and connector as it changes.
+    def is_incremental(self) -> bool:
+        return self._persist and self._storage in [StorageType.DIRECTORY, StorageType.JOURNAL]
 
-    def get_neuron_data(self, path: str) -> list[dict]:
-        neuron_files = os.listdir(path)
-        return [self.load_from_file(os.path.join(path, neuron)) for neuron in neuron_files]
+    def get_storage(self) -> StorageType:
+        return self._storage
+
+    def get_neuron_data(self, path: str, workers: int = 1) -> list[dict]:
+        return self.get_neuron_groups([path], workers=workers)[0]
+
+    # every file across the groups goes through one pool instead of one pool per directory.
+    def get_neuron_groups(self, paths: list[str], workers: int = 1) -> list[list[dict]]:
+        files = [[os.path.join(path, neuron) for neuron in os.listdir(path)] for path in paths]
+        data = self.load_files([file for group in files for file in group], workers=workers)
+        groups: list[list[dict]] = []
+        x = 0
+        for group in files:
+            groups.append(data[x:x + len(group)])
+            x += len(group)
+        return groups
 
     def get_connection_data(self, connection_id: str) -> dict:
         return self.load_from_file(os.path.join(self._connection_path, f"{connection_id}.json"))
+
+    def get_connections_data(self, connection_ids: list[str], workers: int = 1) -> dict[str, dict]:
+        connection_ids = list(dict.fromkeys(connection_ids))
+        paths = [os.path.join(self._connection_path, f"{connection_id}.json") for connection_id in connection_ids]
+        return dict(zip(connection_ids, self.load_files(paths, workers=workers)))
     
     def _create_directory(self, path: str):
         path, filename = os.path.split(path)
@@ -47,17 +100,57 @@ class CoreIO:
             with open(path, 'r') as file:
                 return json.load(file)
 
+    def _load_chunk(self, paths: list[str]) -> list[dict]:
+        return [self.load_from_file(path) for path in paths]
+
+    # results keep the order of paths, the pool size bounds how many files are open at once.
+    def load_files(self, paths: list[str], workers: int = 1) -> list[dict]:
+        if workers <= 1 or len(paths) < 2:
+            return self._load_chunk(paths)
+
+        # files are handed out in chunks so task overhead does not outweigh the read itself.
+        size = -(-len(paths) // (workers * 4))
+        chunks = [paths[x:x + size] for x in range(0, len(paths), size)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [data for chunk in executor.map(self._load_chunk, chunks) for data in chunk]
+
     def save_to_file(self, data: dict, path: str):
-        if not self._persist:
+        if not self.is_incremental():
             return 
+
+        if self._storage == StorageType.JOURNAL:
+            self._append([{"op": "put", "key": self._get_key(path), "data": data}])
+            return
         
         self._create_directory(path)
         with open(f"{path}.json", "w") as file:
             json.dump(data, file, indent=4)
 
+    def save_files(self, files: list[FileModel]):
+        if not self.is_incremental():
+            return
+
+        if self._storage == StorageType.JOURNAL:
+            self._append([{"op": "put", "key": self._get_key(file.path), "data": file.data} for file in files])
+            return
+
+        directories = set()
+        for file in files:
+            directory = os.path.dirname(file.path)
+            if directory not in directories:
+                self._create_directory(file.path)
+                directories.add(directory)
+
+            with open(f"{file.path}.json", "w") as handle:
+                json.dump(file.data, handle, indent=4)
+
     def remove_from_file(self, file_name: str, path: str):
-        if not self._persist:
+        if not self.is_incremental():
             return 
+
+        if self._storage == StorageType.JOURNAL:
+            self._append([{"op": "del", "key": self._get_key(os.path.join(path, file_name))}])
+            return
         
         file_path = os.path.join(path, f"{file_name}.json")
         if os.path.exists(file_path):
@@ -73,10 +166,239 @@ class CoreIO:
     def _is_dir_empty(self, path) -> bool:
         return any(os.path.isfile(os.path.join(path, f)) for f in os.listdir(path))
 
+    def has_snapshot(self) -> bool:
+        return os.path.exists(self._snapshot_path)
+
+    def pack_ids(self, ids: list[str]) -> NDArray:
+        packed = b"".join(UUID(str(i)).bytes for i in ids)
+        return np.frombuffer(packed, dtype=np.uint8).reshape(-1, 16)
+
+    def unpack_ids(self, packed: NDArray) -> list[UUID]:
+        return [UUID(bytes=row.tobytes()) for row in packed]
+
+    def save_snapshot(self, snapshot: SnapshotModel):
+        if not self._persist:
+            return
+
+        # written next to the old snapshot and swapped in so a crash never leaves a partial model behind.
+        self._create_directory(self._snapshot_path)
+        temp_path = f"{self._snapshot_path}.tmp"
+        with open(temp_path, "wb") as file:
+            np.savez(file, **vars(snapshot))
+        os.replace(temp_path, self._snapshot_path)
+
+        if self._storage == StorageType.JOURNAL:
+            open(self._journal_path, "w").close()
+            self._journal_size = 0
+
+    def load_snapshot(self) -> SnapshotModel:
+        with np.load(self._snapshot_path) as data:
+            return SnapshotModel(**{key: data[key] for key in data.files})
+
+    # snapshots are stored uncompressed, so every column can be mapped straight out of the archive.
+    def map_snapshot(self, mode: str = "r") -> SnapshotModel:
+        columns: dict[str, NDArray] = {}
+        with zipfile.ZipFile(self._snapshot_path) as archive, open(self._snapshot_path, "rb") as file:
+            for info in archive.infolist():
+                with archive.open(info) as member:
+                    version = np.lib.format.read_magic(member)
+                    if version == (1, 0):
+                        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(member)
+                    else:
+                        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(member)
+                    header_size = member.tell()
+
+                file.seek(info.header_offset)
+                local_header = file.read(30)
+                name_size, extra_size = struct.unpack("<HH", local_header[26:30])
+                offset = info.header_offset + 30 + name_size + extra_size + header_size
+                name = info.filename.removesuffix(".npy")
+
+                if int(np.prod(shape)) == 0:
+                    columns[name] = np.empty(shape, dtype=dtype)
+                else:
+                    columns[name] = np.memmap(
+                        self._snapshot_path,
+                        dtype=dtype,
+                        mode=mode,
+                        offset=offset,
+                        shape=shape,
+                        order="F" if fortran_order else "C"
+                    )
+
+        return SnapshotModel(**columns)
+
+    def _get_key(self, path: str) -> str:
+        return os.path.relpath(path, self._path).replace(os.sep, "/")
+
+    def read_directory(self, workers: int = 1) -> SnapshotModel:
+        group_paths = [
+            os.path.join(root, group)
+            for root in [self._mesh_path, self._encoder_path, self._decoder_path] if os.path.exists(root)
+            for group in sorted(os.listdir(root))
+        ]
+        records: dict[str, dict] = {}
+        for group_path, neuron_data in zip(group_paths, self.get_neuron_groups(group_paths, workers=workers)):
+            for data in neuron_data:
+                records[self._get_key(os.path.join(group_path, data["id"]))] = data
+
+        # connections are read through the neurons that own them, so orphaned connection files are ignored.
+        connection_ids = [
+            connection_id
+            for data in records.values()
+            for connection_id in data["connections"]
+            if os.path.exists(os.path.join(self._connection_path, f"{connection_id}.json"))
+        ]
+        for connection_id, data in self.get_connections_data(connection_ids, workers=workers).items():
+            records[f"connections/{connection_id}"] = data
+
+        return self.snapshot_from_records(records)
+
+    # records are keyed the same way as the directory layout, e.g. "meshes/nexus/<inter_id>" or "connections/<connection_id>".
+    def snapshot_from_records(self, records: dict[str, dict]) -> SnapshotModel:
+        groups: dict[tuple[str, str], list[dict]] = {}
+        for key, data in records.items():
+            root, *group, _ = key.split("/")
+            if root != "connections":
+                groups.setdefault((root, group[0]), []).append(data)
+
+        neurons: list[tuple[str, str, dict]] = []
+        for mesh in ["terminus", "nexus", "aperture"]:
+            neurons.extend(("inter", mesh, data) for data in groups.get(("meshes", mesh), []))
+
+        for root, neuron_type in [("encoders", "sensor"), ("decoders", "motor")]:
+            for group in sorted(group for r, group in groups.keys() if r == root):
+                neurons.extend((neuron_type, group, data) for data in groups[(root, group)])
+
+        lookup = {data["id"]: x for x, (_, _, data) in enumerate(neurons)}
+        connector_ids: list[str] = []
+        axons: list[int] = []
+        dendrites: list[int] = []
+        defaults: list[bool] = []
+        strength: list[float] = []
+        epsilon: list[float] = []
+
+        for x, (_, _, data) in enumerate(neurons):
+            for connection_id in data["connections"]:
+                connection = records.get(f"connections/{connection_id}")
+                if connection is None or connection["dendrite_id"] not in lookup:
+                    continue
+
+                connector_ids.append(connection["id"])
+                axons.append(x)
+                dendrites.append(lookup[connection["dendrite_id"]])
+                defaults.append(bool(connection["is_default"]))
+                strength.append(connection["strength"])
+                epsilon.append(connection["epsilon"])
+
+        return SnapshotModel(
+            neuron_ids=self.pack_ids([data["id"] for _, _, data in neurons]),
+            neuron_types=np.array([neuron_type for neuron_type, _, _ in neurons], dtype=str),
+            neuron_groups=np.array([group for _, group, _ in neurons], dtype=str),
+            neuron_answers=np.array([json.dumps(data["answer"]) if "answer" in data else "" for _, _, data in neurons], dtype=str),
+            connector_ids=self.pack_ids(connector_ids),
+            connector_axons=np.array(axons, dtype=np.int64),
+            connector_dendrites=np.array(dendrites, dtype=np.int64),
+            connector_defaults=np.array(defaults, dtype=bool),
+            strength=np.array(strength, dtype=float),
+            epsilon=np.array(epsilon, dtype=float)
+        )
+
+    def records_from_snapshot(self, snapshot: SnapshotModel) -> dict[str, dict]:
+        roots = {"inter": "meshes", "sensor": "encoders", "motor": "decoders"}
+        neuron_ids = [str(neuron_id) for neuron_id in self.unpack_ids(snapshot.neuron_ids)]
+        connector_ids = [str(connector_id) for connector_id in self.unpack_ids(snapshot.connector_ids)]
+        connections: list[list[str]] = [[] for _ in neuron_ids]
+        records: dict[str, dict] = {}
+
+        connector_data = zip(
+            connector_ids,
+            snapshot.connector_axons.tolist(),
+            snapshot.connector_dendrites.tolist(),
+            snapshot.connector_defaults.tolist(),
+            snapshot.strength.tolist(),
+            snapshot.epsilon.tolist()
+        )
+        for connector_id, axon, dendrite, is_default, strength, epsilon in connector_data:
+            connections[axon].append(connector_id)
+            records[f"connections/{connector_id}"] = {
+                "dendrite_id": neuron_ids[dendrite],
+                "is_default": is_default,
+                "epsilon": epsilon,
+                "strength": strength,
+                "id": connector_id
+            }
+
+        neuron_data = zip(
+            neuron_ids,
+            snapshot.neuron_types.tolist(),
+            snapshot.neuron_groups.tolist(),
+            snapshot.neuron_answers.tolist(),
+            connections
+        )
+        for neuron_id, neuron_type, group, answer, connection_ids in neuron_data:
+            if neuron_type == "motor":
+                data = {"id": neuron_id, "answer": json.loads(answer), "connections": connection_ids}
+            else:
+                data = {"type": neuron_type, "id": neuron_id, "connections": connection_ids}
+            records[f"{roots[neuron_type]}/{group}/{neuron_id}"] = data
+
+        return records
+
+    # one time migration from the directory layout into a single snapshot file.
+    def convert_to_snapshot(self, workers: int = 1) -> SnapshotModel:
+        snapshot = self.read_directory(workers=workers)
+        self.save_snapshot(snapshot)
+        return snapshot
+
+    def has_journal(self) -> bool:
+        return os.path.exists(self._journal_path) and os.path.getsize(self._journal_path) > 0
+
+    def should_compact(self) -> bool:
+        return self._storage == StorageType.JOURNAL and self._journal_size >= self._compact_after
+
+    def _append(self, entries: list[dict]):
+        if len(entries) == 0:
+            return
+
+        self._create_directory(self._journal_path)
+        lines = "".join(json.dumps(entry, separators=(",", ":")) + "\n" for entry in entries)
+        with open(self._journal_path, "a") as file:
+            file.write(lines)
+        self._journal_size += len(entries)
+
+    def _replay(self, records: dict[str, dict]):
+        if not os.path.exists(self._journal_path):
+            return
+
+        with open(self._journal_path, "r") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # a torn final line from a crash mid append, everything before it is intact.
+                    break
+
+                if entry["op"] == "put":
+                    records[entry["key"]] = entry["data"]
+                else:
+                    records.pop(entry["key"], None)
+
+    # folds the journal into the base snapshot, the journal is truncated once the new snapshot is in place.
+    def compact(self) -> SnapshotModel:
+        records = self.records_from_snapshot(self.load_snapshot()) if self.has_snapshot() else {}
+        self._replay(records)
+        snapshot = self.snapshot_from_records(records)
+        self.save_snapshot(snapshot)
+        return snapshot
+
     # check if file exists
     def is_empty(self) -> bool:
         if not self._persist:
             return True
+
+        if self._storage != StorageType.DIRECTORY and (self.has_snapshot() or self.has_journal()):
+            return False
         
         if os.path.exists(self._connection_path) and self._is_dir_empty(self._connection_path):
             return False
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+class StorageType(StrEnum):
+    DIRECTORY = "directory"
+    SNAPSHOT = "snapshot"
+    JOURNAL = "journal"
@@ -1,6 +1,21 @@
 from dataclasses import dataclass
+from numpy.typing import NDArray
 
 @dataclass
 class FileModel:
     path: str
-    data: dict
\ No newline at end of file
+    data: dict
+
+# ids are stored as raw 16 byte uuids, connectors reference neurons by their row in the neuron arrays.
+@dataclass
+class SnapshotModel:
+    neuron_ids: NDArray
+    neuron_types: NDArray
+    neuron_groups: NDArray
+    neuron_answers: NDArray
+    connector_ids: NDArray
+    connector_axons: NDArray
+    connector_dendrites: NDArray
+    connector_defaults: NDArray
+    strength: NDArray
+    epsilon: NDArray
@@ -1,12 +1,116 @@
-import random
-
-def generate_binary_sequence(dataset_size, row_size):
-    dataset = []
-    for _ in range(dataset_size):
-        row = []
-        for i in range(row_size):
-            row.append(random.randint(0, 1))
-        
-        dataset.append(row)
-    
-    return dataset
\ No newline at end of file
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Callable, Iterator, Iterable
+from .enums import DatasetType
+from .models import DatasetChunkModel
+from .errors import EmptyDatasetError
+import os
+
+# every generator yields chunks lazily and never holds more than memory_limit bytes of rows at once.
+# chunk k is drawn from its own stream seeded by (seed, k), so the same seed and memory limit always give the same rows.
+MEMORY_LIMIT = 64 * 1024 * 1024
+
+def get_chunk_rows(row_bytes: int, memory_limit: int = MEMORY_LIMIT) -> int:
+    return max(1, memory_limit // max(row_bytes, 1))
+
+def _chunks(
+        rows: int,
+        row_bytes: int,
+        seed: int,
+        memory_limit: int,
+        draw: Callable[[np.random.Generator, int], DatasetChunkModel]
+    ) -> Iterator[DatasetChunkModel]:
+    chunk_rows = get_chunk_rows(row_bytes, memory_limit)
+    for chunk, start in enumerate(range(0, rows, chunk_rows)):
+        yield draw(np.random.default_rng([seed, chunk]), min(chunk_rows, rows - start))
+
+# random bits labelled 1 when more than half of them are set.
+def binary_chunks(rows: int, width: int, seed: int = 0, memory_limit: int = MEMORY_LIMIT) -> Iterator[DatasetChunkModel]:
+    def draw(rng: np.random.Generator, count: int) -> DatasetChunkModel:
+        inputs = rng.integers(0, 2, size=(count, width), dtype=np.int8)
+        return DatasetChunkModel(inputs=inputs, targets=(inputs.sum(axis=1) * 2 > width).astype(np.int8))
+    return _chunks(rows, width * 2, seed, memory_limit, draw)
+
+def parity_chunks(rows: int, width: int, seed: int = 0, memory_limit: int = MEMORY_LIMIT) -> Iterator[DatasetChunkModel]:
+    def draw(rng: np.random.Generator, count: int) -> DatasetChunkModel:
+        inputs = rng.integers(0, 2, size=(count, width), dtype=np.int8)
+        return DatasetChunkModel(inputs=inputs, targets=(inputs.sum(axis=1) % 2).astype(np.int8))
+    return _chunks(rows, width * 2, seed, memory_limit, draw)
+
+# the sequence task, the target is the input itself.
+def copy_chunks(rows: int, width: int, seed: int = 0, memory_limit: int = MEMORY_LIMIT) -> Iterator[DatasetChunkModel]:
+    def draw(rng: np.random.Generator, count: int) -> DatasetChunkModel:
+        inputs = rng.integers(0, 2, size=(count, width), dtype=np.int8)
+        return DatasetChunkModel(inputs=inputs, targets=inputs)
+    return _chunks(rows, width, seed, memory_limit, draw)
+
+# a fixed random linear function of the inputs plus gaussian noise, the weights depend only on the seed.
+def regression_chunks(rows: int, width: int, seed: int = 0, noise: float = 0.1, memory_limit: int = MEMORY_LIMIT) -> Iterator[DatasetChunkModel]:
+    weights = np.random.default_rng(seed).normal(size=width)
+
+    def draw(rng: np.random.Generator, count: int) -> DatasetChunkModel:
+        inputs = rng.random((count, width))
+        return DatasetChunkModel(inputs=inputs, targets=inputs @ weights + rng.normal(scale=noise, size=count))
+    return _chunks(rows, (width + 1) * 8, seed, memory_limit, draw)
+
+# gaussian clusters around one random center per class.
+def multiclass_chunks(rows: int, width: int, classes: int = 4, seed: int = 0, spread: float = 0.1, memory_limit: int = MEMORY_LIMIT) -> Iterator[DatasetChunkModel]:
+    centers = np.random.default_rng(seed).random((classes, width))
+
+    def draw(rng: np.random.Generator, count: int) -> DatasetChunkModel:
+        targets = rng.integers(0, classes, size=count)
+        inputs = centers[targets] + rng.normal(scale=spread, size=(count, width))
+        return DatasetChunkModel(inputs=inputs, targets=targets)
+    return _chunks(rows, (width + 1) * 8, seed, memory_limit, draw)
+
+GENERATORS: dict[DatasetType, Callable[..., Iterator[DatasetChunkModel]]] = {
+    DatasetType.BINARY: binary_chunks,
+    DatasetType.PARITY: parity_chunks,
+    DatasetType.COPY: copy_chunks,
+    DatasetType.REGRESSION: regression_chunks,
+    DatasetType.MULTICLASS: multiclass_chunks
+}
+
+def generate(type: DatasetType, rows: int, width: int, seed: int = 0, **kwargs) -> Iterator[DatasetChunkModel]:
+    return GENERATORS[type](rows=rows, width=width, seed=seed, **kwargs)
+
+# flattens chunks into the (input, expected) rows the trainer reads, one chunk is converted at a time.
+def iter_rows(chunks: Iterable[DatasetChunkModel]) -> Iterator[tuple[list[Any], Any]]:
+    for chunk in chunks:
+        yield from zip(chunk.inputs.tolist(), chunk.targets.tolist())
+
+# writes inputs.npy and targets.npy into a directory, chunk by chunk through memory mapped files.
+def write_npy(path: str, chunks: Iterable[DatasetChunkModel], rows: int) -> int:
+    os.makedirs(path, exist_ok=True)
+    inputs: np.memmap = None
+    targets: np.memmap = None
+    written = 0
+    for chunk in chunks:
+        if inputs is None:
+            inputs = np.lib.format.open_memmap(os.path.join(path, "inputs.npy"), mode="w+", dtype=chunk.inputs.dtype, shape=(rows,) + chunk.inputs.shape[1:])
+            targets = np.lib.format.open_memmap(os.path.join(path, "targets.npy"), mode="w+", dtype=chunk.targets.dtype, shape=(rows,) + chunk.targets.shape[1:])
+        count = min(chunk.inputs.shape[0], rows - written)
+        inputs[written:written + count] = chunk.inputs[:count]
+        targets[written:written + count] = chunk.targets[:count]
+        written += count
+        if written == rows:
+            break
+
+    if inputs is None:
+        raise EmptyDatasetError()
+
+    inputs.flush()
+    targets.flush()
+    return written
+
+# replays a written dataset as read only views of the mapped files.
+def read_npy(path: str, memory_limit: int = MEMORY_LIMIT) -> Iterator[DatasetChunkModel]:
+    inputs: NDArray = np.load(os.path.join(path, "inputs.npy"), mmap_mode="r")
+    targets: NDArray = np.load(os.path.join(path, "targets.npy"), mmap_mode="r")
+    row_bytes = inputs[:1].nbytes + targets[:1].nbytes
+    chunk_rows = get_chunk_rows(row_bytes, memory_limit)
+    for start in range(0, inputs.shape[0], chunk_rows):
+        yield DatasetChunkModel(inputs=inputs[start:start + chunk_rows], targets=targets[start:start + chunk_rows])
+
+def generate_binary_sequence(dataset_size, row_size, seed: int = 0):
+    return [row for chunk in copy_chunks(rows=dataset_size, width=row_size, seed=seed) for row in chunk.inputs.tolist()]
@@ -0,0 +1,8 @@
+from enum import StrEnum
+
+class DatasetType(StrEnum):
+    BINARY = "binary"
+    PARITY = "parity"
+    COPY = "copy"
+    REGRESSION = "regression"
+    MULTICLASS = "multiclass"
@@ -0,0 +1,3 @@
+class EmptyDatasetError(Exception):
+    def __init__(self):
+        super().__init__("The dataset produced no chunks to write.")
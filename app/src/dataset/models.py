@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from numpy.typing import NDArray
+
+# a block of consecutive rows, targets line up with inputs along the first axis.
+@dataclass
+class DatasetChunkModel:
+    inputs: NDArray
+    targets: NDArray
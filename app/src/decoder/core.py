@@ -7,14 +7,13 @@ from ..injector.core import Injector
 from ..injector.enums import GlobalTypes
 from ..auditor.core import Auditor
 from ..network.core import Network
-from ..connector.core import Connector
 from ..entity.core import Entity
 from ..neuron_io.core import NeuronIO
 from ..neuron_io.enums import TransformerTypes
 import numpy as np
+from numpy.typing import NDArray
 import math
 from typing import Union
-from ..terminal.errors import IdenticalConnectionError
 
 # decoder doesn't need to know about stuff
 class Decoder(Entity):
@@ -32,6 +31,17 @@ class Decoder(Entity):
         self._network: Network = Injector.resolve(GlobalTypes.NETWORK)
         self._io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
         self._confidence: float = 0.1
+        # answer key -> position in the motor list, and which of those positions are in the current outputs.
+        self._answers: dict[Any, int] = {}
+        self._active_mask: NDArray = np.zeros(0, dtype=bool)
+        self._indexed: list[Motor] = None
+        self._indexed_count: int = 0
+        self._active_motors: list[Motor] = None
+        self._active_slots: NDArray = None
+        # the terminus generation and motor list the motors were last wired against.
+        self._wired: list[Motor] = None
+        self._wired_count: int = 0
+        self._wired_generation: int = -1
 
     def get_last_confidence(self):
         return self._confidence
@@ -46,24 +56,65 @@ class Decoder(Entity):
         return self._io.get_neurons(self._type)
 
     def get_active_motors(self) -> list[Motor]:
-        motors = self.get_motors()
-        return [motor for motor in motors if motor.get_active()]
+        self._index_motors()
+        if self._active_motors is None:
+            motors = self.get_motors()
+            self._active_motors = [motors[x] for x in np.flatnonzero(self._active_mask).tolist()]
+            self._active_slots = np.fromiter((m.get_slot() for m in self._active_motors), dtype=np.int64, count=len(self._active_motors))
+        return self._active_motors
+
+    # the states of the active motors as one vector, read from the decoder's motor bank in a single pass.
+    def get_active_states(self) -> tuple[list[Motor], NDArray]:
+        motors = self.get_active_motors()
+        return motors, self._io.get_bank(self._type).get_states(self._active_slots)
 
     def get_outputs(self) -> None:
         return self._outputs
-    
-    def add_motor(self, answer: Any) -> None:
+
+    # answers are hashed for the index, subclasses with unhashable answers convert them here.
+    def _get_key(self, answer: Any) -> Any:
+        return answer
+
+    def get_motor(self, answer: Any) -> Union[Motor, None]:
+        self._index_motors()
+        position = self._answers.get(self._get_key(answer))
+        if position is None:
+            return None
+        return self.get_motors()[position]
+
+    # keeps the index in step with the registered motor list, returns True when it had to catch up.
+    # appended motors are indexed incrementally, a replaced list (for example after a load) is indexed again.
+    def _index_motors(self) -> bool:
         motors = self.get_motors()
-        existing_answers = len([motor.answer for motor in motors if motor.answer == answer])
-        if existing_answers > 0:
+        if motors is self._indexed and self._indexed_count == len(motors):
+            return False
+
+        start = self._indexed_count if motors is self._indexed else 0
+        if start == 0:
+            self._answers = {}
+        for x in range(start, len(motors)):
+            self._answers[self._get_key(motors[x].answer)] = x
+
+        added = np.fromiter((m.get_active() for m in motors[start:]), dtype=bool, count=len(motors) - start)
+        self._active_mask = np.concatenate([self._active_mask[:start], added])
+        self._indexed = motors
+        self._indexed_count = len(motors)
+        self._active_motors = None
+        return True
+
+    def add_motor(self, answer: Any) -> None:
+        if self.get_motor(answer) is not None:
             print("motor already exists in decoder")
             return 
         
-        new_motor = Motor(answer=answer, decoder=self._type)
-        motors.append(new_motor)
-        self._io.set_neurons(neuron_list=motors, transformer_name=self._type, transformer_type=TransformerTypes.DECODER)
-        self._network.connect_motor(new_motor)
+        self._add_motors([answer])
 
+    # registers all new motors with the neuron io in one call instead of re-setting the whole list per motor.
+    def _add_motors(self, answers: list[Any]) -> None:
+        motors = [Motor(answer=answer, decoder=self._type) for answer in answers]
+        self._io.add_neurons(neuron_list=motors, transformer_name=self._type, transformer_type=TransformerTypes.DECODER)
+        self._network.connect_motors(motors)
+        self._index_motors()
 
     def _check_output_type(self, outputs: list[Any]) -> bool:
         if len([output for output in outputs if type(output) not in self._data_types]) > 0:
@@ -72,21 +123,34 @@ class Decoder(Entity):
         return True
     
     def set_outputs(self, outputs: list[Any]) -> None:
+        # observe sets the outputs on every call, an unchanged list against an up to date index skips straight to the terminus.
+        # the outputs are compared by value against a copy, so a list edited in place by the caller is still noticed.
+        changed = outputs != self._outputs
+        if not self._index_motors() and not changed:
+            self.check_terminus()
+            return
+
         if not self._check_output_type(outputs):
             raise IncorrectOutputType("Mistmatch between output types and decoder types.")
-        
-        self._reset_motors()
+
+        if changed:
+            self._reset_motors()
+        keys = [self._get_key(output) for output in outputs]
+        new_answers = list({key: output for key, output in zip(keys, outputs) if key not in self._answers}.values())
+        if len(new_answers) > 0:
+            self._add_motors(new_answers)
+            self._auditor.activity.new_motors += len(new_answers)
+
+        # only motors whose membership flipped are touched, the engine and connectors still read the per motor flag.
+        mask = np.zeros(self._indexed_count, dtype=bool)
+        mask[[self._answers[key] for key in keys]] = True
         motors = self.get_motors()
-        existing_answers = [motor.answer for motor in motors]
-        for output in outputs:
-            if output not in existing_answers:
-                self.add_motor(answer=output)
-                self._auditor.activity.new_motors += 1
-
-        for motor in motors:
-            motor.set_active(motor.answer in outputs)
+        for x in np.flatnonzero(mask != self._active_mask).tolist():
+            motors[x].set_active(bool(mask[x]))
+        self._active_mask = mask
+        self._active_motors = None
         
-        self._outputs = outputs
+        self._outputs = list(outputs)
 
         self.check_terminus()
 
@@ -94,8 +158,8 @@ class Decoder(Entity):
         if len(self._outputs) == 0:
             raise IncorrectOutputCount("Outputs must be set before prediction can be made.")
         
-        active_motors = self.get_active_motors()
-        if all(motor.get_state() == 0 for motor in active_motors):
+        _, states = self.get_active_states()
+        if not np.any(states != 0):
             raise ValueError("No signal reached the motors. All active motors have a state of 0. This can be because signal did not reach motors, or no data was fed to the network.")
     
     def predict(self, *args, **kwargs):
@@ -109,29 +173,33 @@ class Decoder(Entity):
     def _predict_impl(self, *args, **kwargs):
         raise NotImplementedError("Method must be implemented by a subclass.")
     
+    # clears every motor of the decoder at once, signals never carry over into the next step.
     def _reset_motors(self):
-        motors = self.get_motors()
-        for m in motors:
-            m.reset_state()
+        self._io.get_bank(self._type).reset()
     
     def confidence(self):
         raise NotImplementedError("Method must be implemented by a subclass")
     
+    # only the delta is wired, motors appended since the last check or every motor once the terminus generation moved.
+    # motors have no outgoing connections, the inters already wired to one are read from its reverse index.
     def check_terminus(self):
-        terminus = self._network.mesh.terminus
-        inter_ids = [i.get_id() for i in terminus.get_inters()]
-        motors: list[Motor] = self.get_motors()
-        for m in motors:
-            dendrite_ids = [connection.get_dendrite().get_id() for connection in m.get_connections()]
-            missing_ids = list(set(inter_ids) - set(dendrite_ids))
-            for missing_id in missing_ids:
-                
-                inter = next(i for i in terminus.get_inters() if i.get_id() == missing_id)
-                connector = Connector(dendrite=m)
-                try:
-                    inter.post_connection(connector)
-                except IdenticalConnectionError:
-                    continue
+        motors = self.get_motors()
+        generation = self._network.get_terminus_generation()
+        if generation == self._wired_generation and motors is self._wired:
+            if self._wired_count == len(motors):
+                return
+            pending = motors[self._wired_count:]
+        else:
+            pending = motors
+
+        indices = [i.get_index() for i in self._network.mesh.terminus.get_inters()]
+        unwired = [m for m in pending if not all(m.has_incoming(index) for index in indices)]
+        if len(unwired) > 0:
+            self._network.connect_motors(unwired)
+
+        self._wired = motors
+        self._wired_count = len(motors)
+        self._wired_generation = self._network.get_terminus_generation()
 
 
 # this is the one that finds center of mass.
@@ -140,22 +208,17 @@ class Regressor(Decoder):
         Decoder.__init__(self, type=DecoderType.REGRESSOR, data_types=[int, float])
 
     def _predict_impl(self):
-        motors = self.get_active_motors()
-        numerator = sum(motor.get_state() * motor.answer for motor in motors)
-        denominator = sum(motor.get_state() for motor in motors)
+        motors, states = self.get_active_states()
+        denominator = states.sum()
         
         if denominator == 0:
             raise ValueError("Total activation (sum of states) is zero. Cannot compute center of mass.")
         
-        return numerator / denominator
+        return float(states @ np.array([motor.answer for motor in motors], dtype=float)) / denominator
     
     def confidence(self):
-        motors = self.get_active_motors()
-        confidence = 0
-        for m in motors:
-            confidence += m.get_state()
-
-        return confidence/len(motors) 
+        _, states = self.get_active_states()
+        return states.mean()
     
 
 
@@ -163,19 +226,19 @@ class ArgMax(Decoder):
     def __init__(self):
         Decoder.__init__(self, type=DecoderType.ARGMAX, data_types=[str, int])
 
-    def _find_max_motor(self) -> Motor:
-        active_motors = self.get_active_motors()
-        max_motor = max(active_motors, key=lambda m: m.get_state())
-        return max_motor
+    def _find_max_motor(self) -> tuple[Motor, float]:
+        motors, states = self.get_active_states()
+        index = int(np.argmax(states))
+        return motors[index], states[index]
 
     def _predict_impl(self):
-        max_motor = self._find_max_motor()
+        max_motor, _ = self._find_max_motor()
         
         return max_motor.answer
     
     def confidence(self):
-        max_motor: Motor = self._find_max_motor()
-        return max_motor.get_state()
+        _, state = self._find_max_motor()
+        return state
 
 
 
@@ -189,16 +252,12 @@ class SoftMax(Decoder):
         return [v / total for v in exps]
         
     def _predict_impl(self):
-        activations = [motor.get_state() for motor in self.get_active_motors()]
-        return self.softmax(activations)
+        _, states = self.get_active_states()
+        return self.softmax(states.tolist())
     
     def confidence(self):
-        motors = self.get_active_motors()
-        confidence = 0
-        for m in motors:
-            confidence += m.get_state()
-
-        return confidence/len(motors) 
+        _, states = self.get_active_states()
+        return states.mean()
     
 
 
@@ -210,9 +269,8 @@ class Binary(Decoder):
         super().set_outputs([True, False])
     
     def _predict_impl(self):
-        answers = [motor.get_state() for motor in self.get_active_motors()]
-        index = answers.index(max(answers))
-        return self._outputs[index]
+        _, states = self.get_active_states()
+        return self._outputs[int(np.argmax(states))]
     
     # work on this later
     def confidence(self):
@@ -231,20 +289,19 @@ class Vector(Decoder):
             
         return True
 
+    def _get_key(self, answer: list[float]) -> tuple[float, ...]:
+        return tuple(answer)
+
     def _predict_impl(self):
         self._check_decoder()
-        active_motors = self.get_active_motors()
-        result_vector = [0.0] * len(active_motors[0].answer)
+        motors, states = self.get_active_states()
+        result_vector = states @ np.array([motor.answer for motor in motors], dtype=float)
 
-        for motor in active_motors:
-            state = motor.get_state()
-            result_vector = [rv + state * ans for rv, ans in zip(result_vector, motor.answer)]
-
-        total_activation = sum(motor.get_state() for motor in active_motors)
+        total_activation = states.sum()
         if total_activation > 0:
-            result_vector = [value / total_activation for value in result_vector]
+            result_vector = result_vector / total_activation
 
-        return result_vector
+        return result_vector.tolist()
     
     # work on this sometime later
     def confidence(self):
@@ -257,22 +314,19 @@ class TopK(Decoder):
         Decoder.__init__(self, type=DecoderType.TOP_K, data_types=[str, int])
         self._k = None
 
-    def _sort_motors(self) -> list[Motor]:
-        return sorted(self.get_active_motors(), key=lambda motor: motor.get_state(), reverse=True)
+    # indices of the active motors from the strongest state down, ties keep motor order.
+    def _sort_motors(self) -> tuple[list[Motor], NDArray, NDArray]:
+        motors, states = self.get_active_states()
+        return motors, states, np.argsort(-states, kind="stable")
         
     def _predict_impl(self, k: int):
-        sorted_motors = self._sort_motors()
+        motors, _, order = self._sort_motors()
         self._k = k
-        return [motor.answer for motor in sorted_motors][:k]
+        return [motors[x].answer for x in order[:k].tolist()]
     
     def confidence(self):
-        motors = self._sort_motors()[:self._k]
-        confidence = 0
-        
-        for m in motors:
-            confidence += m.get_state()
-
-        return confidence/len(motors) 
+        _, states, order = self._sort_motors()
+        return states[order[:self._k]].mean()
 
 
 
@@ -283,14 +337,9 @@ class Bitmask(Decoder):
         
     def _predict_impl(self, threshold):
         self.threshold = threshold
-        return [motor.answer for motor in self.get_active_motors() if motor.get_state() > threshold]
+        motors, states = self.get_active_states()
+        return [motors[x].answer for x in np.flatnonzero(states > threshold).tolist()]
     
     def confidence(self):
-        motors = self.get_active_motors()
-        confidence = 0
-        for m in motors:
-            state_value = m.get_state()
-            if state_value > self.threshold:
-                confidence += m.get_state()
-
-        return confidence/len(motors) 
\ No newline at end of file
+        _, states = self.get_active_states()
+        return states[states > self.threshold].sum() / states.size
\ No newline at end of file
@@ -4,7 +4,6 @@ from .enums import EncoderType
 from ..context.core import Context
 import numpy as np
 from numpy.typing import NDArray
-from concurrent.futures import ThreadPoolExecutor, Future
 from ..injector.core import Injector
 from ..injector.enums import GlobalTypes
 from ..auditor.core import Auditor
@@ -12,6 +11,9 @@ from ..network.core import Network
 from ..entity.core import Entity
 from ..neuron_io.core import NeuronIO
 from ..neuron_io.enums import TransformerTypes
+from ..engine.core import Engine
+from ..executor.core import Executor
+from ..executor.enums import ExecutorType
 
 class Encoder(Entity):
     def __init__(
@@ -26,6 +28,8 @@ class Encoder(Entity):
         self._auditor: Auditor = Injector.resolve(GlobalTypes.AUDITOR)
         self._network: Network = Injector.resolve(GlobalTypes.NETWORK)
         self._io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        self._engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+        self._executor: Executor = Injector.resolve(GlobalTypes.EXECUTOR)
 
     def get_type(self):
         return self._type
@@ -54,24 +58,29 @@ class Encoder(Entity):
                 self.add_sensor(sensor)
                 self._auditor.activity.new_sensors += 1
     
-    def propogate(self, input_data: list[Any]):
+    # the sensors an observation seeds and the values they are seeded with, missing sensors are grown along the way.
+    def stage(self, input_data: list[Any]) -> tuple[list[Sensor], list[Any]]:
         sensors = self.get_sensors()
         self.check_sensors(input_data)
         # self._auditor.activity.total_sensors += len(sensors) - self._auditor.activity.total_sensors
         self._auditor.activity.features += len(input_data) - self._auditor.activity.features
+        return sensors, input_data
 
-        with ThreadPoolExecutor() as executor:
-            futures: list[Future] = []
+    def propogate(self, input_data: list[Any]):
+        sensors, input_data = self.stage(input_data)
+        if self._engine.is_compiled():
+            self._engine.propogate(sensors=sensors, input_data=input_data)
+            return
 
+        # one context per observation, so signals from different features meet at the same inter neurons.
+        # sensors and contexts cannot cross a process boundary, so only thread pools fan out the seeding.
+        context = Context()
+        if self._executor.get_type() == ExecutorType.PROCESS:
             for i, s in zip(input_data, sensors):
-                context = Context()
-                futures.append(executor.submit(s.transmit, context, i))
-
-            for future in futures:
-                try:
-                    future.result()
-                except Exception as e:
-                    print(f"Task raised an exception: {e}")
+                s.transmit(context, i)
+        else:
+            self._executor.map(lambda pair: pair[1].transmit(context, pair[0]), list(zip(input_data, sensors)))
+        context.run()
 
 class NumericEncoder(Encoder):
     def __init__(self):
@@ -92,10 +101,9 @@ class NumericEncoder(Encoder):
 
         return scaled
     
-    def propogate(self, input_data: list[Any]):
+    def stage(self, input_data: list[Any]) -> tuple[list[Sensor], list[Any]]:
         # this is located here because there might be things like tokenizers that need to run to allow Haze to understand input.
-        input_data = self.normalize(input_data)
-        return super().propogate(input_data)
+        return super().stage(self.normalize(input_data))
 
 class TextEncoder(Encoder):
     def __init__(self):
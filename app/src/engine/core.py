@@ -0,0 +1,392 @@
+import numpy as np
+from numpy.typing import NDArray
+from typing import Any, Optional
+from .enums import EngineType
+from .models import CompiledGraphModel, ShardTaskModel, ShardResultModel, ObservationResultModel
+from ..neuron.core import Motor, Sensor
+from ..neuron.enums import NeuronType
+from ..neuron.interface import INeuron
+from ..terminal.core import Terminal
+from ..registry.core import Registry
+from ..config.core import Config
+from ..network.core import Network
+from ..neuron_io.core import NeuronIO
+from ..neuron_io.enums import TransformerTypes
+from ..injector.core import Injector
+from ..injector.enums import GlobalTypes
+from ..executor.core import Executor
+from ..shared.core import SharedArray
+from ..shared.models import SharedArrayModel
+
+# the compiled engine flattens the object graph into CSR arrays:
+# neuron i owns the connectors dendrites[indptr[i]:indptr[i+1]] in the same order as its connection list.
+# connectors that were never registered have a registry index of -1 and propogate at full strength (0.9).
+class Engine:
+    def __init__(self, type: EngineType = EngineType.GRAPH):
+        self._type = type
+        self._registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+        self._config: Config = Injector.resolve(GlobalTypes.CONFIG)
+        self._network: Network = Injector.resolve(GlobalTypes.NETWORK)
+        self._io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        self._graph: CompiledGraphModel = None
+        self._attached: bool = False
+        self._shared: dict[str, SharedArray] = {}
+        self._shared_graph: CompiledGraphModel = None
+
+    def get_type(self) -> EngineType:
+        return self._type
+
+    def is_compiled(self) -> bool:
+        return self._type in (EngineType.COMPILED, EngineType.SHARDED)
+
+    def get_graph(self) -> CompiledGraphModel:
+        if self._attached:
+            return self._graph
+
+        if self._graph is None or self._graph.revision != Terminal.get_revision():
+            self.compile()
+
+        return self._graph
+
+    def compile(self) -> CompiledGraphModel:
+        neurons: list[INeuron] = []
+        lookup: dict[INeuron, int] = {}
+
+        def index_of(neuron: INeuron) -> int:
+            index = lookup.get(neuron)
+            if index is None:
+                index = len(neurons)
+                lookup[neuron] = index
+                neurons.append(neuron)
+            return index
+
+        for sensor in self._io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.ENCODER):
+            index_of(sensor)
+
+        if not self._network.is_empty():
+            for inter in self._network.get_all_neurons():
+                index_of(inter)
+
+        for motor in self._io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.DECODER):
+            index_of(motor)
+
+        indptr: list[int] = [0]
+        dendrites: list[int] = []
+        registry_indices: list[int] = []
+        x = 0
+
+        # neurons that are only reachable through connections are appended while walking.
+        while x < len(neurons):
+            for c in neurons[x].get_connections():
+                dendrites.append(index_of(c.get_dendrite()))
+                registry_indices.append(-1 if c._index is None else c._index)
+            indptr.append(len(dendrites))
+            x += 1
+
+        motors = [n for n in neurons if n.get_type() == NeuronType.MOTOR]
+        self._graph = CompiledGraphModel(
+            lookup=lookup,
+            size=len(neurons),
+            indptr=np.array(indptr, dtype=np.int64),
+            dendrites=np.array(dendrites, dtype=np.int64),
+            registry_indices=np.array(registry_indices, dtype=np.int64),
+            motor_slots=self._get_motor_slots(lookup, motors, len(neurons)),
+            motors=motors,
+            revision=Terminal.get_revision()
+        )
+        return self._graph
+
+    # adopts an adjacency that was never materialized as objects, connector rows double as registry rows.
+    def attach(self, lookup: dict[INeuron, int], size: int, axons: NDArray, dendrites: NDArray) -> CompiledGraphModel:
+        indptr = np.zeros(size + 1, dtype=np.int64)
+        np.cumsum(np.bincount(axons, minlength=size), out=indptr[1:])
+        motors = [n for n in lookup.keys() if n.get_type() == NeuronType.MOTOR]
+        self._graph = CompiledGraphModel(
+            lookup=lookup,
+            size=size,
+            indptr=indptr,
+            dendrites=dendrites,
+            registry_indices=None,
+            motor_slots=self._get_motor_slots(lookup, motors, size),
+            motors=motors,
+            revision=Terminal.get_revision()
+        )
+        if self._type == EngineType.GRAPH:
+            self._type = EngineType.COMPILED
+        self._attached = True
+        return self._graph
+
+    def _get_motor_slots(self, lookup: dict[INeuron, int], motors: list[INeuron], size: int) -> NDArray:
+        motor_slots = np.full(size, -1, dtype=np.int64)
+        for slot, motor in enumerate(motors):
+            motor_slots[lookup[motor]] = slot
+        return motor_slots
+
+    # a single observation is one connected component, so every compiled engine runs it in process as one exact pass.
+    def propogate(self, sensors: list[Sensor], input_data: list[Any]) -> None:
+        graph = self.get_graph()
+        seeds, seed_values = self._get_seeds(graph, sensors, input_data)
+        result = run_frontier(
+            indptr=graph.indptr,
+            dendrites=graph.dendrites,
+            registry_indices=graph.registry_indices,
+            motor_slots=graph.motor_slots,
+            strength=self._registry._strength,
+            node_open=self._get_node_open(graph),
+            seeds=seeds,
+            seed_values=seed_values,
+            threshold=self._config.get_threshold(),
+            firing_threshold=self._config.neuron_firing_threshold
+        )
+
+        if result.activated.size > 0:
+            self._registry.activate_connectors(result.activated)
+        if result.slots.size > 0:
+            self._deliver(graph.motors, result.slots, result.signals)
+
+    # independent observations share one frontier pass, each keeps its own visited connectors, merges and motor signals.
+    # the sharded engine splits the observations of a batch over the worker processes, an observation is never split.
+    # nothing reaches the motors here, each result is handed to deliver() when its observation is decoded.
+    def propogate_batch(self, observations: list[tuple[list[Sensor], list[Any]]]) -> list[ObservationResultModel]:
+        if len(observations) == 0:
+            return []
+
+        graph = self.get_graph()
+        node_open = self._get_node_open(graph)
+        seeded = [self._get_seeds(graph, sensors, input_data) for sensors, input_data in observations]
+        groups = [np.arange(len(observations))]
+        if self._type == EngineType.SHARDED and len(observations) > 1:
+            executor: Executor = Injector.resolve(GlobalTypes.EXECUTOR)
+            groups = np.array_split(groups[0], min(executor.get_workers(), len(observations)))
+
+        tasks: list[tuple[NDArray, NDArray, NDArray, int]] = []
+        for group in groups:
+            seeds = [seeded[x][0] for x in group.tolist()]
+            tasks.append((
+                np.concatenate(seeds),
+                np.concatenate([seeded[x][1] for x in group.tolist()]),
+                np.repeat(np.arange(group.size), [s.size for s in seeds]),
+                group.size
+            ))
+
+        if len(tasks) > 1:
+            results = self._propogate_shards(graph, node_open, tasks)
+        else:
+            seeds, seed_values, owners, count = tasks[0]
+            results = [run_frontier(
+                indptr=graph.indptr,
+                dendrites=graph.dendrites,
+                registry_indices=graph.registry_indices,
+                motor_slots=graph.motor_slots,
+                strength=self._registry._strength,
+                node_open=node_open,
+                seeds=seeds,
+                seed_values=seed_values,
+                threshold=self._config.get_threshold(),
+                firing_threshold=self._config.neuron_firing_threshold,
+                owners=owners,
+                observations=count
+            )]
+
+        activated = np.concatenate([r.activated for r in results])
+        if activated.size > 0:
+            self._registry.activate_connectors(activated)
+
+        # owners are local to their shard until they are mapped back to the position in the batch.
+        owners = np.concatenate([group[r.owners] for group, r in zip(groups, results)])
+        slots = np.concatenate([r.slots for r in results])
+        signals = np.concatenate([r.signals for r in results])
+        order = np.argsort(owners, kind="stable")
+        bounds = np.searchsorted(owners[order], np.arange(len(observations) + 1))
+        return [
+            ObservationResultModel(motors=graph.motors, slots=slots[order[a:b]], signals=signals[order[a:b]])
+            for a, b in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+        ]
+
+    # the motor signals of one batched observation are added to whatever the motors already hold.
+    def deliver(self, result: ObservationResultModel) -> None:
+        if result.slots.size > 0:
+            self._deliver(result.motors, result.slots, result.signals)
+
+    def _get_node_open(self, graph: CompiledGraphModel) -> NDArray:
+        node_open = np.ones(graph.size, dtype=bool)
+        motor_nodes = np.flatnonzero(graph.motor_slots >= 0)
+        node_open[motor_nodes] = [graph.motors[graph.motor_slots[n]].get_active() for n in motor_nodes]
+        return node_open
+
+    def _get_seeds(self, graph: CompiledGraphModel, sensors: list[Sensor], input_data: list[Any]) -> tuple[NDArray, NDArray]:
+        seeds: list[int] = []
+        seed_values: list[float] = []
+        for value, sensor in zip(input_data, sensors):
+            node = graph.lookup.get(sensor)
+            if node is not None:
+                seeds.append(node)
+                seed_values.append(value)
+        return np.array(seeds, dtype=np.int64), np.array(seed_values, dtype=float)
+
+    # each task is a group of whole observations, so the workers never have to exchange signals.
+    def _propogate_shards(self, graph: CompiledGraphModel, node_open: NDArray, tasks: list[tuple[NDArray, NDArray, NDArray, int]]) -> list[ShardResultModel]:
+        executor: Executor = Injector.resolve(GlobalTypes.EXECUTOR)
+        shared = self._share(graph)
+        strength = self._registry.share()["strength"]
+        return executor.map(propogate_shard, [
+            ShardTaskModel(
+                indptr=shared["indptr"],
+                dendrites=shared["dendrites"],
+                registry_indices=shared.get("registry_indices"),
+                motor_slots=shared["motor_slots"],
+                strength=strength,
+                node_open=node_open,
+                seeds=seeds,
+                seed_values=seed_values,
+                owners=owners,
+                observations=count,
+                threshold=self._config.get_threshold(),
+                firing_threshold=self._config.neuron_firing_threshold
+            )
+            for seeds, seed_values, owners, count in tasks
+        ])
+
+    # the csr arrays are copied into shared memory once per compiled revision.
+    def _share(self, graph: CompiledGraphModel) -> dict[str, SharedArrayModel]:
+        if self._shared_graph is not graph:
+            self.release()
+            self._shared = {
+                "indptr": SharedArray.from_array(graph.indptr),
+                "dendrites": SharedArray.from_array(graph.dendrites),
+                "motor_slots": SharedArray.from_array(graph.motor_slots)
+            }
+            if graph.registry_indices is not None:
+                self._shared["registry_indices"] = SharedArray.from_array(graph.registry_indices)
+            self._shared_graph = graph
+        return {name: array.describe() for name, array in self._shared.items()}
+
+    def release(self) -> None:
+        for array in self._shared.values():
+            array.release()
+        self._shared = {}
+        self._shared_graph = None
+
+    def _deliver(self, motors: list[INeuron], slots: NDArray, signals: NDArray) -> None:
+        order = np.argsort(slots, kind="stable")
+        slots, signals = slots[order], signals[order]
+        unique_slots, starts = np.unique(slots, return_index=True)
+        for slot, chunk in zip(unique_slots, np.split(signals, starts[1:])):
+            motor: Motor = motors[slot]
+            motor.accumulate(chunk)
+
+# the frontier loop is a plain function of arrays so worker processes can run it without the object graph.
+# owners tags every seed with its observation in a batch, observations never share a visited connector or a merge.
+def run_frontier(
+        indptr: NDArray,
+        dendrites: NDArray,
+        registry_indices: Optional[NDArray],
+        motor_slots: NDArray,
+        strength: NDArray,
+        node_open: NDArray,
+        seeds: NDArray,
+        seed_values: NDArray,
+        threshold: float,
+        firing_threshold: float,
+        owners: Optional[NDArray] = None,
+        observations: int = 1
+    ) -> ShardResultModel:
+    visited = np.zeros(dendrites.size * observations, dtype=bool)
+    slots: list[NDArray] = [np.zeros(0, dtype=np.int64)]
+    signals: list[NDArray] = [np.zeros(0)]
+    slot_owners: list[NDArray] = [np.zeros(0, dtype=np.int64)]
+    activated: list[NDArray] = [np.zeros(0, dtype=np.int64)]
+    if owners is None:
+        owners = np.zeros(seeds.size, dtype=np.int64)
+
+    # every sensor edge is queued on the observation's context before the first step runs.
+    edges, counts = expand(indptr, seeds)
+    values = np.repeat(seed_values, counts)
+    edge_owners = np.repeat(owners, counts)
+    sums = np.zeros(edges.size)
+    lengths = np.zeros(edges.size, dtype=np.int64)
+
+    while edges.size > 0:
+        # inactive motors reject the signal before the connector records the context.
+        keys = edge_owners * dendrites.size + edges
+        keep = np.flatnonzero(node_open[dendrites[edges]] & ~visited[keys])
+        edges, values, sums, lengths, edge_owners, keys = edges[keep], values[keep], sums[keep], lengths[keep], edge_owners[keep], keys[keep]
+
+        # only the first signal to reach a connector in a context is transmitted.
+        _, first = np.unique(keys, return_index=True)
+        first.sort()
+        edges, values, sums, lengths, edge_owners = edges[first], values[first], sums[first], lengths[first], edge_owners[first]
+        visited[keys[first]] = True
+
+        rows = edges if registry_indices is None else registry_indices[edges]
+        edge_strength = np.full(rows.size, 0.9)
+        registered = rows >= 0
+        edge_strength[registered] = strength[rows[registered]]
+        values = values * edge_strength
+        sums = sums + np.log(edge_strength)
+        lengths = lengths + 1
+        actual = values * np.exp(sums / lengths)
+
+        passed = np.flatnonzero(actual > threshold)
+        edges, values, sums, lengths, actual, edge_owners = edges[passed], values[passed], sums[passed], lengths[passed], actual[passed], edge_owners[passed]
+        rows = rows[passed]
+        activated.append(rows[rows >= 0])
+
+        targets = dendrites[edges]
+        target_slots = motor_slots[targets]
+        is_motor = target_slots >= 0
+        slots.append(target_slots[is_motor])
+        signals.append(actual[is_motor])
+        slot_owners.append(edge_owners[is_motor])
+
+        # signals reaching the same inter in a step are merged with their sum capped at 1.0, inters fire in order of their first arrival.
+        arrivals = ~is_motor
+        node_keys, first, groups = np.unique(edge_owners[arrivals] * motor_slots.size + targets[arrivals], return_index=True, return_inverse=True)
+        merged_values = np.minimum(np.bincount(groups, weights=values[arrivals], minlength=node_keys.size), 1.0)
+        merged_sums = np.bincount(groups, weights=sums[arrivals], minlength=node_keys.size) / np.bincount(groups, minlength=node_keys.size)
+        merged_lengths = np.zeros(node_keys.size, dtype=np.int64)
+        np.maximum.at(merged_lengths, groups, lengths[arrivals])
+
+        order = np.argsort(first, kind="stable")
+        fired = order[merged_values[order] >= firing_threshold]
+        edges, counts = expand(indptr, node_keys[fired] % motor_slots.size)
+        values = np.repeat(merged_values[fired], counts)
+        sums = np.repeat(merged_sums[fired], counts)
+        lengths = np.repeat(merged_lengths[fired], counts)
+        edge_owners = np.repeat(node_keys[fired] // motor_slots.size, counts)
+
+    return ShardResultModel(
+        slots=np.concatenate(slots),
+        signals=np.concatenate(signals),
+        activated=np.concatenate(activated),
+        owners=np.concatenate(slot_owners)
+    )
+
+# the outgoing edges of each node, concatenated in node order.
+def expand(indptr: NDArray, nodes: NDArray) -> tuple[NDArray, NDArray]:
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    edges = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+    return edges, counts
+
+# runs in a worker process on a group of observations, the shared arrays are opened by name and stay mapped for the next observation.
+def propogate_shard(task: ShardTaskModel) -> ShardResultModel:
+    shared = [task.indptr, task.dendrites, task.motor_slots, task.strength]
+    if task.registry_indices is not None:
+        shared.append(task.registry_indices)
+    SharedArray.detach_all(keep=set(model.name for model in shared))
+
+    return run_frontier(
+        indptr=SharedArray.attach(task.indptr),
+        dendrites=SharedArray.attach(task.dendrites),
+        registry_indices=None if task.registry_indices is None else SharedArray.attach(task.registry_indices),
+        motor_slots=SharedArray.attach(task.motor_slots),
+        strength=SharedArray.attach(task.strength),
+        node_open=task.node_open,
+        seeds=task.seeds,
+        seed_values=task.seed_values,
+        threshold=task.threshold,
+        firing_threshold=task.firing_threshold,
+        owners=task.owners,
+        observations=task.observations
+    )
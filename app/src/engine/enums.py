@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+class EngineType(StrEnum):
+    GRAPH = "graph"
+    COMPILED = "compiled"
+    SHARDED = "sharded"
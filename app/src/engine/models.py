@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from typing import Optional
+from numpy.typing import NDArray
+from ..neuron.interface import INeuron
+from ..shared.models import SharedArrayModel
+
+# registry_indices is None when connector rows and registry rows are the same, as in a mapped snapshot.
+@dataclass
+class CompiledGraphModel:
+    lookup: dict[INeuron, int]
+    size: int
+    indptr: NDArray
+    dendrites: NDArray
+    registry_indices: Optional[NDArray]
+    motor_slots: NDArray
+    motors: list[INeuron]
+    revision: int
+
+# everything a worker needs to propogate a group of observations, the large arrays travel by shared memory name.
+@dataclass
+class ShardTaskModel:
+    indptr: SharedArrayModel
+    dendrites: SharedArrayModel
+    registry_indices: Optional[SharedArrayModel]
+    motor_slots: SharedArrayModel
+    strength: SharedArrayModel
+    node_open: NDArray
+    seeds: NDArray
+    seed_values: NDArray
+    owners: NDArray
+    observations: int
+    threshold: float
+    firing_threshold: float
+
+# the motor signals of one frontier pass, owners is the observation in the batch each signal belongs to.
+@dataclass
+class ShardResultModel:
+    slots: NDArray
+    signals: NDArray
+    activated: NDArray
+    owners: NDArray
+
+# the motor signals of one observation in a batch, slots index into the motor list of the graph it was propogated on.
+@dataclass
+class ObservationResultModel:
+    motors: list[INeuron]
+    slots: NDArray
+    signals: NDArray
@@ -12,4 +12,5 @@ class Entity:
 
     def get_id(self, as_string=True):
         if as_string:
-            return str(self._id)
\ No newline at end of file
+            return str(self._id)
+        return self._id
@@ -0,0 +1,64 @@
+from concurrent.futures import Executor as PoolExecutor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Any, Callable
+from .enums import ExecutorType
+from .errors import ExecutionError
+import os
+
+# one long lived pool per model, created on first use and reused for every observation.
+# thread batches smaller than inline_below run on the calling thread since the hand off costs more than the work,
+# process batches are always sent to the pool because their items are already sized to be worth the hand off.
+class Executor:
+    def __init__(
+            self, 
+            type: ExecutorType = ExecutorType.INLINE, 
+            workers: int = None,
+            inline_below: int = 64
+        ):
+        self._type = type
+        self._workers = workers or os.cpu_count() or 1
+        self._inline_below = inline_below
+        self._pool: PoolExecutor = None
+
+    def get_type(self) -> ExecutorType:
+        return self._type
+    
+    def get_workers(self) -> int:
+        return self._workers
+    
+    def _get_pool(self) -> PoolExecutor:
+        if self._pool is None:
+            if self._type == ExecutorType.PROCESS:
+                self._pool = ProcessPoolExecutor(max_workers=self._workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self._workers)
+        return self._pool
+
+    def is_inline(self, count: int) -> bool:
+        if self._type == ExecutorType.THREAD:
+            return count < self._inline_below
+        return self._type == ExecutorType.INLINE
+    
+    # results keep the order of items, every task is awaited before the first error is raised.
+    def map(self, func: Callable[[Any], Any], items: list[Any]) -> list[Any]:
+        if self.is_inline(len(items)):
+            return [func(item) for item in items]
+        
+        pool = self._get_pool()
+        futures = [pool.submit(func, item) for item in items]
+        results: list[Any] = []
+        errors: list[Exception] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as error:
+                errors.append(error)
+
+        if len(errors) > 0:
+            raise ExecutionError(errors) from errors[0]
+        
+        return results
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -0,0 +1,6 @@
+from enum import StrEnum
+
+class ExecutorType(StrEnum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
@@ -0,0 +1,4 @@
+class ExecutionError(Exception):
+    def __init__(self, errors: list[Exception]):
+        super().__init__(f"{len(errors)} of the submitted tasks raised an exception, the first was: {errors[0]!r}")
+        self.errors = errors
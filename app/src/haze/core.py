@@ -1,9 +1,13 @@
 # this class orchestrates the network, encorders, and decoders.
 from ..network.core import Network
 from ..core_io.core import CoreIO
+from ..core_io.enums import StorageType
+from ..core_io.models import SnapshotModel
 from ..registry.core import Registry
-from ..neuron.core import Motor, Sensor, Inter
+from ..neuron.core import Neuron, Motor, Sensor, Inter
+from ..neuron.enums import NeuronType
 from ..decoder.enums import DecoderType
+from ..mesh.core import Mesh
 from ..mesh.enums import MeshType
 from dataclasses import fields
 from ..connector.core import Connector
@@ -11,18 +15,29 @@ from .models import NeuronPackageModel
 from ..encoder.enums import EncoderType
 from ..decoder.core import Decoder
 from ..encoder.core import Encoder
-from .errors import InvalidRewardError
+from .errors import InvalidRewardError, ReadOnlyModelError, UnconnectedSignalError, BatchNotSupportedError
 from ..config.core import Config
 from ..auditor.core import Auditor
 from ..injector.core import Injector
 from ..injector.enums import GlobalTypes
 from ..auditor.models import AuditResultsModel
-from .models import IdeaModel, InputModel
+from .models import IdeaModel, InputModel, LoadReportModel
 from ..utils.calculations import clamp
 from ..neuron_io.core import NeuronIO
 from ..neuron_io.enums import TransformerTypes
+from ..engine.core import Engine
+from ..engine.enums import EngineType
+from ..engine.models import ObservationResultModel
+from ..allocator.core import Allocator
+from ..executor.core import Executor
+from ..executor.enums import ExecutorType
+from ..stats.core import Stats
+from ..stats.models import StatsModel
+import numpy as np
 import random
-from typing import Any
+from typing import Any, Callable
+import json
+import time
 import os
 
 class Haze:
@@ -33,14 +48,26 @@ class Haze:
             config: Config = Config(),
             sequential: bool = False,
             end_token: str = None,
-            seed: int = 42
+            seed: int = 42,
+            engine: EngineType = EngineType.GRAPH,
+            storage: StorageType = StorageType.DIRECTORY,
+            executor: ExecutorType = ExecutorType.INLINE,
+            workers: int = None,
+            stats: bool = False
         ):
+        Injector.register(name=GlobalTypes.ALLOCATOR, instance=Allocator())
         Injector.register(name=GlobalTypes.NEURON_IO, instance=NeuronIO())
         Injector.register(name=GlobalTypes.CONFIG, instance=config)
-        Injector.register(name=GlobalTypes.CORE, instance=CoreIO(path=model_path, persist=persist))
+        Injector.register(name=GlobalTypes.STATS, instance=Stats(enabled=stats))
+        Injector.register(
+            name=GlobalTypes.CORE, 
+            instance=CoreIO(path=model_path, persist=persist, storage=storage, compact_after=config.journal_limit)
+        )
         Injector.register(name=GlobalTypes.REGISTRY, instance=Registry())
         Injector.register(name=GlobalTypes.NETWORK, instance=Network())
         Injector.register(name=GlobalTypes.AUDITOR, instance=Auditor())
+        Injector.register(name=GlobalTypes.ENGINE, instance=Engine(type=engine))
+        Injector.register(name=GlobalTypes.EXECUTOR, instance=Executor(type=executor, workers=workers))
         
         
         self.network: Network = Injector.resolve(GlobalTypes.NETWORK)
@@ -49,6 +76,9 @@ class Haze:
         self._inputs: dict[str, list[Any]] = {}
         self._current_observation: InputModel = None
         self._lexical_chain: list[IdeaModel] = None
+        self._read_only: bool = False
+        self._load_report: LoadReportModel = None
+        self._stats: Stats = Injector.resolve(GlobalTypes.STATS)
         random.seed(seed)
 
     # perhaps the end token can be added to the decoder by default and this can set the value to "active" if we need it to.
@@ -60,6 +90,7 @@ class Haze:
         self._lexical_chain = lexical_chain
 
     def observe(self, input_data: list[Any], encoder: Encoder):
+        started = self._stats.clock()
         self._current_observation = InputModel(input_data=input_data, encoder=encoder)
         encoder_id = encoder.get_id(as_string=True)
         self._inputs[encoder_id] = input_data
@@ -69,6 +100,7 @@ class Haze:
                 decoder.decoder.set_outputs(decoder.outputs)
 
         encoder.propogate(input_data)
+        started = self._stats.lap("observe.propogate", started)
 
         for i, layer in enumerate(self._lexical_chain):
 
@@ -87,20 +119,69 @@ class Haze:
                     raise Exception("The decoders of the current layer and encoders in the next layer are incompatible")
                 
                 encoder.propogate(decoder.decoder.predict())
+        self._stats.lap("observe.chain", started)
+
+    # a batch can share one compiled pass when the chain is a single layer and no output is fed back in.
+    def can_batch(self) -> bool:
+        engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+        return engine.is_compiled() and not self._sequential and self._lexical_chain is not None and len(self._lexical_chain) == 1
+
+    # propogates independent observations together, nothing reaches the motors until predict_observed() is called.
+    def observe_batch(self, observations: list[InputModel]) -> list[ObservationResultModel]:
+        if not self.can_batch():
+            raise BatchNotSupportedError()
+
+        started = self._stats.clock()
+        for decoder in self._lexical_chain[0].decoders:
+            decoder.decoder.set_outputs(decoder.outputs)
+
+        engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+        staged = [observation.encoder.stage(observation.input_data) for observation in observations]
+        results = engine.propogate_batch(staged)
+        self._stats.lap("observe.batch", started)
+        return results
+
+    # decodes one observation of a batch from its own motor signals, a retry observes it again on its own.
+    def predict_observed(self, observation: InputModel, result: ObservationResultModel, limit: int = None):
+        engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+        neuron_io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        self._current_observation = observation
+        self._inputs[observation.encoder.get_id(as_string=True)] = observation.input_data
+        for decoder in self._lexical_chain[0].decoders:
+            neuron_io.get_bank(decoder.decoder.get_type()).reset()
+
+        engine.deliver(result)
+        return self.predict(limit=limit)
+
+    # stats() is a copy of the stage timers and counters, callback receives (stage, seconds) for every recorded stage.
+    def stats(self) -> StatsModel:
+        return self._stats.snapshot()
+
+    def set_stats_callback(self, callback: Callable[[str, float], None]) -> None:
+        self._stats.set_callback(callback)
 
     def predict(self, limit: int = None, iterations=0):
         try:
             result = self.call_decoders(limit=limit)
             return result
         except ValueError:
-            if limit is not None and iterations > limit:
-                raise Exception("Network did not connect signal to motors within the iteration limit.")
+            if self._read_only:
+                raise
+
+            # motors are cleared every step, so without a cap a network that never reaches them would retry forever.
+            # the cap is separate from limit, which only bounds how many outputs a decoder returns.
+            config: Config = Injector.resolve(GlobalTypes.CONFIG)
+            if iterations >= config.relearn_limit:
+                raise UnconnectedSignalError()
             
+            started = self._stats.clock()
+            self._stats.count("predict.retries")
             self.observe(
                 encoder=self._current_observation.encoder, 
                 input_data=self._current_observation.input_data
             )
             self.learn(reverse=True)
+            self._stats.lap("predict.retry", started)
             iterations += 1
             return self.predict(limit=limit, iterations=iterations)
 
@@ -108,6 +189,7 @@ class Haze:
         if self._lexical_chain is None:
             raise Exception("No lexical chain has been set.")
 
+        started = self._stats.clock()
         iterations: int = 0
         results: dict[str, list] = {}
         stopped_decoders = set()
@@ -146,67 +228,324 @@ class Haze:
                 break
         
         self._inputs.clear()
+        self._stats.lap("call_decoders", started)
         return results
 
     def load(
             self, 
             aperature_size: int = 3,
             nexus_size: int = 3,
-            terminus_size: int = 3
+            terminus_size: int = 3,
+            mmap: bool = False,
+            workers: int = 1
         ):
         core: CoreIO = Injector.resolve(GlobalTypes.CORE)
         registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
         neuron_io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        self._load_report = LoadReportModel(storage=core.get_storage())
+        snapshot: SnapshotModel = None
+        started = time.perf_counter()
+
         if core.is_empty():
             self.network.create_network(
                 aperature_size=aperature_size, 
                 nexus_size=nexus_size, 
                 terminus_size=terminus_size
             )
+            self._lap("create", started)
+        elif core.get_storage() != StorageType.DIRECTORY:
+            if not core.has_snapshot() and not core.has_journal():
+                snapshot = core.convert_to_snapshot(workers=workers)
+            elif core.has_journal():
+                snapshot = core.compact()
+
+            if mmap:
+                snapshot = core.map_snapshot()
+            elif snapshot is None:
+                snapshot = core.load_snapshot()
+            self._lap("read", started)
+
+            if mmap:
+                self._map_snapshot(snapshot)
+            else:
+                self._load_snapshot(snapshot)
         else:
-            self.network.instantiate_mesh()
-            neurons: list[NeuronPackageModel] = []
-            terminus_neurons = core.get_neuron_data(core._terminus_path)
-            nexus_neurons = core.get_neuron_data(core._nexus_path)
-            aperture_neurons = core.get_neuron_data(core._aperture_path)
-            terminus_package = self._package_inters(terminus_neurons, MeshType.TERMINUS)
-            self.network.mesh.terminus._inters = [neuron.neuron for neuron in terminus_package]
-            nexus_package = self._package_inters(nexus_neurons, MeshType.NEXUS)
-            self.network.mesh.nexus._inters = [neuron.neuron for neuron in nexus_package]
-            aperture_package = self._package_inters(aperture_neurons, MeshType.APERTURE)
-            self.network.mesh.aperature._inters = [neuron.neuron for neuron in aperture_package]
-            neurons.extend(terminus_package)
-            neurons.extend(nexus_package)
-            neurons.extend(aperture_package)
-
-            for encoder_type in EncoderType:
-                encoder_path = os.path.join(core._encoder_path, encoder_type)
-                if os.path.exists(encoder_path):
-                    sensor_data = core.get_neuron_data(encoder_path)
-                    sensor_package = self._package_sensors(sensor_data=sensor_data, encoder_type=encoder_type)
-                    neurons.extend(sensor_package)
-                    sensor_list = [package.neuron for package in sensor_package]
-                    neuron_io.set_neurons(neuron_list=sensor_list, transformer_name=encoder_type, transformer_type=TransformerTypes.ENCODER)
-
-            for decoder_type in DecoderType:
-                decoder_path = os.path.join(core._decoder_path, decoder_type)
-                if os.path.exists(decoder_path):
-                    motor_data = core.get_neuron_data(decoder_path)
-                    motor_package = self._package_motors(motor_data=motor_data, decoder_type=decoder_type)
-                    neurons.extend(motor_package)
-                    motor_list = [package.neuron for package in motor_package]
-                    neuron_io.set_neurons(neuron_list=motor_list, transformer_name=decoder_type, transformer_type=TransformerTypes.DECODER)
-            
-            for n in neurons:
-                for c in n.connector_set:
-                    connection_data = core.get_connection_data(c)
-                    connector = Connector(
-                        dendrite = [packaged_neuron.neuron for packaged_neuron in neurons if packaged_neuron.neuron.get_id() == connection_data["dendrite_id"]][0],
-                        id=connection_data["id"],
-                        is_default=bool(connection_data["is_default"])
+            self._load_directory(workers=workers)
+
+        neurons = self.network.get_all_neurons()
+        neurons.extend(neuron_io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.ENCODER))
+        neurons.extend(neuron_io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.DECODER))
+        self._load_report.total = time.perf_counter() - started
+        self._load_report.neurons = snapshot.neuron_types.size if mmap and snapshot is not None else len(neurons)
+        self._load_report.connectors = snapshot.strength.size if mmap and snapshot is not None else registry.get_size()
+
+    # wall clock seconds spent in each phase of the last load.
+    def get_load_report(self) -> LoadReportModel:
+        return self._load_report
+
+    def _lap(self, phase: str, started: float) -> float:
+        now = time.perf_counter()
+        self._load_report.phases[phase] = self._load_report.phases.get(phase, 0.0) + now - started
+        return now
+
+    # every json file is parsed before any neuron or connector is constructed.
+    def _load_directory(self, workers: int = 1):
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+        neuron_io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        started = time.perf_counter()
+        mesh_types = [(MeshType.TERMINUS, core._terminus_path), (MeshType.NEXUS, core._nexus_path), (MeshType.APERTURE, core._aperture_path)]
+        encoder_types = [
+            (encoder_type, os.path.join(core._encoder_path, encoder_type))
+            for encoder_type in EncoderType if os.path.exists(os.path.join(core._encoder_path, encoder_type))
+        ]
+        decoder_types = [
+            (decoder_type, os.path.join(core._decoder_path, decoder_type))
+            for decoder_type in DecoderType if os.path.exists(os.path.join(core._decoder_path, decoder_type))
+        ]
+        groups = mesh_types + encoder_types + decoder_types
+        group_data = core.get_neuron_groups([path for _, path in groups], workers=workers)
+        mesh_data = [(mesh_type, data) for (mesh_type, _), data in zip(mesh_types, group_data)]
+        sensor_data = [(encoder_type, data) for (encoder_type, _), data in zip(encoder_types, group_data[len(mesh_types):])]
+        motor_data = [(decoder_type, data) for (decoder_type, _), data in zip(decoder_types, group_data[len(mesh_types) + len(encoder_types):])]
+        connection_ids = [
+            connection_id 
+            for neuron_data in group_data
+            for data in neuron_data 
+            for connection_id in data["connections"]
+        ]
+        connection_data = core.get_connections_data(connection_ids, workers=workers)
+        started = self._lap("read", started)
+
+        self.network.instantiate_mesh()
+        meshes: dict[MeshType, Mesh] = {
+            MeshType.APERTURE: self.network.mesh.aperature,
+            MeshType.NEXUS: self.network.mesh.nexus,
+            MeshType.TERMINUS: self.network.mesh.terminus
+        }
+        neurons: list[NeuronPackageModel] = []
+        for mesh_type, neuron_data in mesh_data:
+            inter_package = self._package_inters(neuron_data, mesh_type)
+            meshes[mesh_type]._inters = [package.neuron for package in inter_package]
+            neurons.extend(inter_package)
+
+        for encoder_type, neuron_data in sensor_data:
+            sensor_package = self._package_sensors(sensor_data=neuron_data, encoder_type=encoder_type)
+            neurons.extend(sensor_package)
+            sensor_list = [package.neuron for package in sensor_package]
+            neuron_io.set_neurons(neuron_list=sensor_list, transformer_name=encoder_type, transformer_type=TransformerTypes.ENCODER)
+
+        for decoder_type, neuron_data in motor_data:
+            motor_package = self._package_motors(motor_data=neuron_data, decoder_type=decoder_type)
+            neurons.extend(motor_package)
+            motor_list = [package.neuron for package in motor_package]
+            neuron_io.set_neurons(neuron_list=motor_list, transformer_name=decoder_type, transformer_type=TransformerTypes.DECODER)
+        started = self._lap("neurons", started)
+
+        neuron_index: dict[str, Neuron] = {package.neuron.get_id(): package.neuron for package in neurons}
+        connector_sets: list[list[Connector]] = []
+        strengths: list[float] = []
+        epsilons: list[float] = []
+        for n in neurons:
+            connector_set = []
+            for c in n.connector_set:
+                data = connection_data[c]
+                connector_set.append(
+                    Connector(
+                        dendrite=neuron_index[data["dendrite_id"]],
+                        id=data["id"],
+                        is_default=bool(data["is_default"])
                     )
-                    registry.add_connector(connector=connector, strength=connection_data["strength"], epsilon=connection_data["epsilon"])
-                    n.neuron.post_connection(connector)
+                )
+                strengths.append(data["strength"])
+                epsilons.append(data["epsilon"])
+            connector_sets.append(connector_set)
+
+        registry.add_connectors([c for connector_set in connector_sets for c in connector_set], strengths=strengths, epsilons=epsilons)
+        started = self._lap("connectors", started)
+
+        for n, connector_set in zip(neurons, connector_sets):
+            if len(connector_set) > 0:
+                n.neuron.post_connections(connector_set)
+        self._lap("wiring", started)
+
+    def _load_snapshot(self, snapshot: SnapshotModel):
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+        neuron_io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        started = time.perf_counter()
+        self.network.instantiate_mesh()
+        meshes: dict[MeshType, Mesh] = {
+            MeshType.APERTURE: self.network.mesh.aperature,
+            MeshType.NEXUS: self.network.mesh.nexus,
+            MeshType.TERMINUS: self.network.mesh.terminus
+        }
+        neurons: list[Neuron] = []
+        sensors: dict[EncoderType, list[Sensor]] = {}
+        motors: dict[DecoderType, list[Motor]] = {}
+        neuron_data = zip(
+            core.unpack_ids(snapshot.neuron_ids),
+            snapshot.neuron_types.tolist(),
+            snapshot.neuron_groups.tolist(),
+            snapshot.neuron_answers.tolist()
+        )
+
+        for neuron_id, neuron_type, group, answer in neuron_data:
+            if neuron_type == NeuronType.INTER:
+                neuron = Inter(mesh=MeshType(group), id=neuron_id)
+                meshes[neuron.mesh]._inters.append(neuron)
+            elif neuron_type == NeuronType.SENSOR:
+                neuron = Sensor(encoder=EncoderType(group), id=neuron_id)
+                sensors.setdefault(neuron.encoder, []).append(neuron)
+            else:
+                neuron = Motor(answer=json.loads(answer), decoder=DecoderType(group), id=neuron_id)
+                motors.setdefault(neuron.decoder, []).append(neuron)
+            neurons.append(neuron)
+
+        for encoder_type, sensor_list in sensors.items():
+            neuron_io.set_neurons(neuron_list=sensor_list, transformer_name=encoder_type, transformer_type=TransformerTypes.ENCODER)
+
+        for decoder_type, motor_list in motors.items():
+            neuron_io.set_neurons(neuron_list=motor_list, transformer_name=decoder_type, transformer_type=TransformerTypes.DECODER)
+        started = self._lap("neurons", started)
+
+        connector_data = zip(
+            core.unpack_ids(snapshot.connector_ids),
+            snapshot.connector_dendrites.tolist(),
+            snapshot.connector_defaults.tolist()
+        )
+        connectors = [
+            Connector(dendrite=neurons[dendrite], id=connector_id, is_default=is_default)
+            for connector_id, dendrite, is_default in connector_data
+        ]
+        registry.add_connectors(connectors, strengths=snapshot.strength, epsilons=snapshot.epsilon)
+        started = self._lap("connectors", started)
+
+        connector_sets: list[list[Connector]] = [[] for _ in neurons]
+        for axon, connector in zip(snapshot.connector_axons.tolist(), connectors):
+            connector_sets[axon].append(connector)
+
+        for neuron, connector_set in zip(neurons, connector_sets):
+            if len(connector_set) > 0:
+                neuron.post_connections(connector_set)
+        self._lap("wiring", started)
+
+    # only sensors and motors become objects, inters and connectors stay in the mapped file and propogate through the compiled engine.
+    def _map_snapshot(self, snapshot: SnapshotModel):
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+        neuron_io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+        started = time.perf_counter()
+        self.network.instantiate_mesh()
+        rows = np.flatnonzero(snapshot.neuron_types != NeuronType.INTER)
+        lookup: dict[Neuron, int] = {}
+        sensors: dict[EncoderType, list[Sensor]] = {}
+        motors: dict[DecoderType, list[Motor]] = {}
+        neuron_data = zip(
+            rows.tolist(),
+            core.unpack_ids(snapshot.neuron_ids[rows]),
+            snapshot.neuron_types[rows].tolist(),
+            snapshot.neuron_groups[rows].tolist(),
+            snapshot.neuron_answers[rows].tolist()
+        )
+
+        for row, neuron_id, neuron_type, group, answer in neuron_data:
+            if neuron_type == NeuronType.SENSOR:
+                neuron = Sensor(encoder=EncoderType(group), id=neuron_id)
+                sensors.setdefault(neuron.encoder, []).append(neuron)
+            else:
+                neuron = Motor(answer=json.loads(answer), decoder=DecoderType(group), id=neuron_id)
+                motors.setdefault(neuron.decoder, []).append(neuron)
+            lookup[neuron] = row
+
+        for encoder_type, sensor_list in sensors.items():
+            neuron_io.set_neurons(neuron_list=sensor_list, transformer_name=encoder_type, transformer_type=TransformerTypes.ENCODER)
+
+        for decoder_type, motor_list in motors.items():
+            neuron_io.set_neurons(neuron_list=motor_list, transformer_name=decoder_type, transformer_type=TransformerTypes.DECODER)
+        started = self._lap("neurons", started)
+
+        registry.attach(strength=snapshot.strength, epsilon=snapshot.epsilon)
+        engine.attach(
+            lookup=lookup,
+            size=snapshot.neuron_types.size,
+            axons=snapshot.connector_axons,
+            dendrites=snapshot.connector_dendrites
+        )
+        self._lap("attach", started)
+        self._read_only = True
+
+    # releases the worker pool and shared memory, the model can still be used afterwards and will start a new pool on demand.
+    def close(self):
+        executor: Executor = Injector.resolve(GlobalTypes.EXECUTOR)
+        engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+        registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+        executor.shutdown()
+        engine.release()
+        registry.release()
+
+    def is_read_only(self) -> bool:
+        return self._read_only
+
+    # directory storage is written incrementally as the model changes, snapshots are written on request.
+    # saving a journaled model writes a fresh snapshot and truncates the journal.
+    # returns whether a snapshot was written, unpersisted models and directory storage write nothing here.
+    def save(self) -> bool:
+        if self._read_only:
+            raise ReadOnlyModelError()
+
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        if not core.is_persistent() or core.get_storage() == StorageType.DIRECTORY:
+            return False
+
+        core.save_snapshot(self._build_snapshot())
+        return True
+
+    def _build_snapshot(self) -> SnapshotModel:
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+        neuron_io: NeuronIO = Injector.resolve(GlobalTypes.NEURON_IO)
+        neurons: list[Neuron] = []
+        neurons.extend(self.network.get_all_neurons())
+        neurons.extend(neuron_io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.ENCODER))
+        neurons.extend(neuron_io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.DECODER))
+        lookup = {neuron: x for x, neuron in enumerate(neurons)}
+        groups: list[str] = []
+        answers: list[str] = []
+        connectors: list[Connector] = []
+        axons: list[int] = []
+
+        for x, neuron in enumerate(neurons):
+            if neuron.get_type() == NeuronType.INTER:
+                groups.append(neuron.mesh)
+                answers.append("")
+            elif neuron.get_type() == NeuronType.SENSOR:
+                groups.append(neuron.encoder)
+                answers.append("")
+            else:
+                groups.append(neuron.decoder)
+                answers.append(json.dumps(neuron.answer))
+
+            # connectors that were never registered are rebuilt by the decoders and are not persisted.
+            for c in neuron.get_connections():
+                if c._index is not None and c.get_dendrite() in lookup:
+                    connectors.append(c)
+                    axons.append(x)
+
+        indices = np.array([c._index for c in connectors], dtype=np.int64)
+        return SnapshotModel(
+            neuron_ids=core.pack_ids([neuron.get_id() for neuron in neurons]),
+            neuron_types=np.array([neuron.get_type() for neuron in neurons], dtype=str),
+            neuron_groups=np.array(groups, dtype=str),
+            neuron_answers=np.array(answers, dtype=str),
+            connector_ids=core.pack_ids([c.get_id() for c in connectors]),
+            connector_axons=np.array(axons, dtype=np.int64),
+            connector_dendrites=np.array([lookup[c.get_dendrite()] for c in connectors], dtype=np.int64),
+            connector_defaults=np.array([c.is_default for c in connectors], dtype=bool),
+            strength=registry._strength[indices].copy(),
+            epsilon=registry._epsilon[indices].copy()
+        )
 
     def _package_sensors(self, sensor_data: list[dict], encoder_type: EncoderType) -> list[NeuronPackageModel]:
         neurons = []
@@ -256,6 +595,10 @@ class Haze:
 
     
     def learn(self, reward: float = 0.9, reverse: bool = False):
+        if self._read_only:
+            raise ReadOnlyModelError()
+
+        started = self._stats.clock()
         reward = clamp(reward)
         registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
         auditor: Auditor = Injector.resolve(GlobalTypes.AUDITOR)
@@ -266,31 +609,45 @@ class Haze:
             registry.learn(reward=reward, confidence=0.1, reverse=True)
         else:
             registry.learn(reward=reward, confidence=auditor.get_confidence_score(), reverse=False)
+        started = self._stats.lap("learn.registry", started)
 
         aggregate_confidence = self.get_aggregate_confidence()
         growth: AuditResultsModel = auditor.stimulate_growth(reward=reward, confidence=aggregate_confidence)
+        started = self._stats.lap("learn.audit", started)
         self.network.handle_growth(growth)
+        started = self._stats.lap("learn.growth", started)
         # print(registry._strength)
 
+        # one threshold mask over the strength column, only connectors posted to an inter are pruned.
         all_neurons = self.network.get_all_neurons()
-        faulty_connections: list[Connector] = []
-
-        for c in registry._connectors:
-            if c.get_strength() * 0.9 <= config.signal_threshold:
-                faulty_connections.append(c)
-                for n in all_neurons:
-                    if c in n._connections:
-                        n.delete_connection(c)
-                
-        for c in faulty_connections:
-            core.remove_from_file(c.get_id(as_string=True), core._connection_path)
+        inters: dict[int, Inter] = {n.get_index(): n for n in all_neurons}
+        table = registry.get_table()
+        faulty_mask = registry.get_pruning_mask(config.signal_threshold)
+        faulty_mask &= np.isin(table.axons, np.fromiter(inters.keys(), dtype=np.int64, count=len(inters)))
+        faulty_rows = np.flatnonzero(faulty_mask)
 
+        if faulty_rows.size > 0:
+            for axon in np.unique(table.axons[faulty_rows]).tolist():
+                inters[axon].prune_connections(faulty_mask)
+
+        faulty_connections: list[Connector] = registry.remove_connectors(faulty_rows)
         for c in faulty_connections:
-            registry._connectors.remove(c)
+            core.remove_from_file(c.get_id(as_string=True), core._connection_path)
+        # a motor that lost a terminus connection is rewired by its decoder on the next set_outputs.
+        if any(isinstance(c.get_dendrite(), Motor) for c in faulty_connections):
+            self.network.touch_terminus()
+        self._stats.count("learn.pruned", len(faulty_connections))
+        started = self._stats.lap("learn.prune", started)
 
+        cleared: list[int] = []
+        # inters pruned down to one connection or none at all are rewired, so no part of the mesh stays cut off.
         for n in all_neurons:
-            if len(n._connections) < 2 and len(n._connections) > 0:
-                core.remove_from_file(n._connections[0].get_id(as_string=True), core._connection_path)
+            if len(n._connections) < 2:
+                self._stats.count("learn.rewired")
+                for connection in n._connections:
+                    core.remove_from_file(connection.get_id(as_string=True), core._connection_path)
+                    if connection._index is not None:
+                        cleared.append(connection._index)
                 n.clear_connections()
                 if n.mesh == MeshType.APERTURE:
                     self.network.mesh.aperature.connect_neurons([n])
@@ -299,7 +656,18 @@ class Haze:
                     self.network.mesh.nexus.connect_neurons([n])
                     self.network.connect_mesh([n], self.network.mesh.terminus.get_inters())
                 if n.mesh == MeshType.TERMINUS:
-                    self.network.mesh.terminus.connect_neurons(n)
+                    self.network.mesh.terminus.connect_neurons([n])
+                    self.network.touch_terminus()
+        registry.remove_connectors(np.array(cleared, dtype=np.int64))
+        started = self._stats.lap("learn.rewire", started)
+
+        # dead rows are dropped once they are a large enough share of the registry to be worth renumbering.
+        if registry.compact(config.compact_ratio) is not None:
+            started = self._stats.lap("learn.reindex", started)
+
+        if core.should_compact():
+            self.save()
+            self._stats.lap("learn.compact", started)
 
     def get_aggregate_confidence(self):
         last_decoders: list[Decoder] = [decoder_model.decoder for decoder_model in self._lexical_chain[-1].decoders]
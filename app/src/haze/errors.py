@@ -1,3 +1,17 @@
 class InvalidRewardError(Exception):
     def __init__(self):
-        super().__init__(self, "Reward must be a value between 0 and 1.")
\ No newline at end of file
+        super().__init__(self, "Reward must be a value between 0 and 1.")
+
+class ReadOnlyModelError(Exception):
+    def __init__(self):
+        super().__init__("This model was memory mapped for inference and cannot learn or be saved.")
+
+
+class UnconnectedSignalError(Exception):
+    def __init__(self):
+        super().__init__("Network did not connect signal to motors within the iteration limit.")
+
+
+class BatchNotSupportedError(Exception):
+    def __init__(self):
+        super().__init__("Only a single layer, non sequential lexical chain on a compiled engine can be observed as a batch.")
@@ -1,8 +1,9 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from ..neuron.core import Neuron
 from ..encoder.core import Encoder
 from ..encoder.enums import EncoderType
 from ..decoder.core import Decoder
+from ..core_io.enums import StorageType
 from typing import Any
 
 @dataclass
@@ -23,4 +24,12 @@ class DecoderModel:
 @dataclass
 class IdeaModel:
     encoders: list[Encoder]
-    decoders: list[DecoderModel]
\ No newline at end of file
+    decoders: list[DecoderModel]
+
+@dataclass
+class LoadReportModel:
+    storage: StorageType
+    neurons: int = 0
+    connectors: int = 0
+    total: float = 0.0
+    phases: dict[str, float] = field(default_factory=dict)
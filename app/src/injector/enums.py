@@ -6,4 +6,8 @@ class GlobalTypes(StrEnum):
     CONFIG = "config"
     CORE = "core"
     NETWORK = "network"
-    NEURON_IO = "neuron_io"
\ No newline at end of file
+    NEURON_IO = "neuron_io"
+    ENGINE = "engine"
+    EXECUTOR = "executor"
+    STATS = "stats"
+    ALLOCATOR = "allocator"
\ No newline at end of file
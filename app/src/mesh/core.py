@@ -36,18 +36,23 @@ class Mesh:
     
     def connect_neurons(self, neurons: list[Inter]):
         k = len(self._inters)
+        pairs: list[tuple[Inter, Connector]] = []
         for i in neurons:
             i.set_k(k)
-            reliable_inters = [inter for inter in self._inters if inter.get_id() != i.get_id()]
+            reliable_inters = [inter for inter in self._inters if inter.get_index() != i.get_index()]
             sample_size = min(i.get_k(), len(reliable_inters))
             sample = random.sample(reliable_inters, sample_size)
             for s in sample:
                 i.set_k(k)
-                connector = Connector(dendrite=s)
-                self.registry.add_connector(connector)
-                i.post_connection(connector)
-                connector.save_state()
-                
+                pairs.append((i, Connector(dendrite=s)))
+
+        self.registry.add_connectors([connector for _, connector in pairs])
+
+        for i, connector in pairs:
+            i.post_connection(connector)
+            connector.save_state()
+
+        for i in neurons:
             i.save_state()
 
     def record(self):
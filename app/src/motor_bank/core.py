@@ -0,0 +1,90 @@
+import numpy as np
+from numpy.typing import NDArray
+from threading import RLock
+
+# running sums and counts for a group of motors, one slot per motor.
+# a slot only counts when its stamp matches the current generation, so reset() clears every slot in O(1).
+class MotorBank:
+    def __init__(self):
+        self._size: int = 0
+        self._generation: int = 1
+        self._sum_store: NDArray = np.zeros(0)
+        self._count_store: NDArray = np.zeros(0, dtype=np.int64)
+        self._stamp_store: NDArray = np.zeros(0, dtype=np.int64)
+        self._lock = RLock()
+
+    def get_size(self) -> int:
+        return self._size
+
+    def allocate(self) -> int:
+        with self._lock:
+            if self._size == self._sum_store.size:
+                capacity = max(self._size * 2, 4)
+                self._sum_store = self._grow(self._sum_store, capacity)
+                self._count_store = self._grow(self._count_store, capacity)
+                self._stamp_store = self._grow(self._stamp_store, capacity)
+            slot = self._size
+            self._size += 1
+            return slot
+
+    def _grow(self, store: NDArray, capacity: int) -> NDArray:
+        grown = np.zeros(capacity, dtype=store.dtype)
+        grown[:self._size] = store[:self._size]
+        return grown
+
+    def _touch(self, slot: int) -> None:
+        if self._stamp_store[slot] != self._generation:
+            self._sum_store[slot] = 0.0
+            self._count_store[slot] = 0
+            self._stamp_store[slot] = self._generation
+
+    def add(self, slot: int, value: float) -> None:
+        with self._lock:
+            self._touch(slot)
+            self._sum_store[slot] += value
+            self._count_store[slot] += 1
+
+    def add_many(self, slot: int, values: NDArray) -> None:
+        with self._lock:
+            self._touch(slot)
+            self._sum_store[slot] += np.sum(values)
+            self._count_store[slot] += np.size(values)
+
+    def get_count(self, slot: int) -> int:
+        if self._stamp_store[slot] != self._generation:
+            return 0
+        return int(self._count_store[slot])
+
+    # a motor that received nothing in this step has a state of 0.
+    def get_state(self, slot: int) -> float:
+        count = self.get_count(slot)
+        if count == 0:
+            return 0.0
+        return float(self._sum_store[slot] / count)
+
+    def get_states(self, slots: NDArray) -> NDArray:
+        counts = np.where(self._stamp_store[slots] == self._generation, self._count_store[slots], 0)
+        return np.divide(self._sum_store[slots], counts, out=np.zeros(slots.size), where=counts > 0)
+
+    def clear(self, slot: int) -> None:
+        self._stamp_store[slot] = 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+    # moves motors from their current bank into this one, keeping whatever they accumulated this step.
+    def adopt(self, motors: list) -> None:
+        for motor in motors:
+            if motor.get_bank() is self:
+                continue
+
+            bank: MotorBank = motor.get_bank()
+            slot = self.allocate()
+            count = bank.get_count(motor.get_slot())
+            if count > 0:
+                with self._lock:
+                    self._touch(slot)
+                    self._sum_store[slot] = bank._sum_store[motor.get_slot()]
+                    self._count_store[slot] = count
+            motor.set_bank(self, slot)
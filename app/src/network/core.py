@@ -14,7 +14,6 @@ from ..injector.enums import GlobalTypes
 from ..auditor.models import AuditResultsModel
 from ..neuron_io.core import NeuronIO
 from ..neuron_io.enums import TransformerTypes
-from ..terminal.errors import IdenticalConnectionError
 
 class Network:
     def __init__(self) -> None:
@@ -23,6 +22,8 @@ class Network:
         self.state = []
         self._io: NeuronIO = Injector.resolve(name=GlobalTypes.NEURON_IO)
         self._registry: IRegistry = Injector.resolve(name=GlobalTypes.REGISTRY)
+        # bumped whenever terminus inters are added or lose connections to motors, decoders rewire only when it moves.
+        self._terminus_generation: int = 0
 
     def get_all_neurons(self) -> list[Inter]:
         neuron_list = []
@@ -31,6 +32,12 @@ class Network:
         neuron_list.extend(self.mesh.terminus.get_inters())
         return neuron_list
 
+    def get_terminus_generation(self) -> int:
+        return self._terminus_generation
+
+    def touch_terminus(self) -> None:
+        self._terminus_generation += 1
+
     def is_empty(self):
         if self.mesh is None:
             return True
@@ -38,25 +45,37 @@ class Network:
         return False
     
     def connect_motor(self, motor: Motor):
+        self.connect_motors([motor])
+
+    # each terminus inter takes its whole batch in one post and is saved once, not once per motor.
+    def connect_motors(self, motors: list[Motor]):
+        batches: list[tuple[Inter, list[Connector]]] = []
         for m in self.mesh.terminus.get_inters():
-            try:
-                connector = Connector(dendrite=motor)
-                m.post_connection(connector)
-                self._registry.add_connector(connector)
-            except IdenticalConnectionError:
-                continue
+            connectors = [Connector(dendrite=motor) for motor in motors if not motor.has_incoming(m.get_index())]
+            if len(connectors) > 0:
+                batches.append((m, connectors))
+        self._registry.add_connectors([c for _, connectors in batches for c in connectors])
+
+        for m, connectors in batches:
+            m.post_connections(connectors)
+            for connector in connectors:
+                connector.save_state()
             m.save_state()
 
-        motor.save_state()
+        for motor in motors:
+            motor.save_state()
 
     def connect_sensor(self, sensor: Sensor):
-        for a in self.mesh.aperature.get_inters():
-            try:
-                connector = Connector(dendrite=a)
-                sensor.post_connection(connector)
-                self._registry.add_connector(connector)
-            except IdenticalConnectionError:
-                continue
+        connected = set(c.get_dendrite() for c in sensor.get_connections())
+        connectors = [
+            Connector(dendrite=a) for a in self.mesh.aperature.get_inters()
+            if a not in connected
+        ]
+        self._registry.add_connectors(connectors)
+
+        for connector in connectors:
+            sensor.post_connection(connector)
+            connector.save_state()
 
         sensor.save_state()
 
@@ -74,6 +93,7 @@ class Network:
         self.connect_mesh(self.mesh.nexus.get_inters(), self.mesh.terminus.get_inters())
 
     def instantiate_mesh(self):
+        self.touch_terminus()
         self.mesh = MeshModel(
             aperature=Mesh(mesh=MeshType.APERTURE),
             nexus=Mesh(mesh=MeshType.NEXUS),
@@ -81,29 +101,32 @@ class Network:
         )
 
     def connect_mesh(self, axon_inters: list[Inter], dendrite_inters: list[Inter]):
+        pairs: list[tuple[Inter, Connector]] = []
         for n in axon_inters:
             sample_size = min(n.get_k(), len(dendrite_inters))
             samples = random.sample(dendrite_inters, sample_size)
             for s in samples:
-                connector = Connector(
-                    dendrite=s
-                )
-                self._registry.add_connector(connector)
-                n.post_connection(connector)
-                connector.save_state()
-                n.save_state()
+                pairs.append((n, Connector(dendrite=s)))
+
+        self._registry.add_connectors([connector for _, connector in pairs])
+
+        for n, connector in pairs:
+            n.post_connection(connector)
+            connector.save_state()
+            n.save_state()
 
     def handle_growth(self, auditor_results: AuditResultsModel):
         new_aperture_inters = self.mesh.aperature.add_neurons(auditor_results.aperture_growth)
         new_nexus_inters = self.mesh.nexus.add_neurons(auditor_results.nexus_growth)
-        self.mesh.terminus.add_neurons(auditor_results.terminus_growth)
+        new_terminus_inters = self.mesh.terminus.add_neurons(auditor_results.terminus_growth)
         self.connect_mesh(new_aperture_inters, self.mesh.nexus.get_inters())
         self.connect_mesh(new_nexus_inters, self.mesh.terminus.get_inters())
         sensors = self._io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.ENCODER)
-        motors = self._io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.DECODER)
 
         for sensor in sensors:
             self.connect_sensor(sensor)
-        
-        for motor in motors:
-            self.connect_motor(motor)
\ No newline at end of file
+
+        # motors only miss connections from the new terminus inters, motors pruned since are caught up by their decoders.
+        if len(new_terminus_inters) > 0:
+            self.connect_motors(self._io.get_all_neurons_by_transformer(transformer_type=TransformerTypes.DECODER))
+            self.touch_terminus()
\ No newline at end of file
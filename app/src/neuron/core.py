@@ -1,7 +1,6 @@
 from uuid import UUID
 from ..signal.core import Signal
 from .interface import INeuron
-from ..threader.core import Threader
 from typing import Union
 from ..entity.core import Entity
 from ..terminal.core import Terminal
@@ -18,6 +17,8 @@ from ..core_io.core import CoreIO
 from ..injector.core import Injector
 from ..injector.enums import GlobalTypes
 from ..config.core import Config
+from ..allocator.core import Allocator
+from ..motor_bank.core import MotorBank
 import os
 
 class Neuron(INeuron, Terminal, Entity):
@@ -30,10 +31,15 @@ class Neuron(INeuron, Terminal, Entity):
         self._type = type
         self._active = True
         self._k = 0
+        allocator: Allocator = Injector.resolve(GlobalTypes.ALLOCATOR)
+        self._index: int = allocator.allocate()
         self._config: Config = Injector.resolve(GlobalTypes.CONFIG) 
 
     def get_type(self):
         return self._type
+
+    def get_index(self) -> int:
+        return self._index
     
     def get_k(self):
         return self._k
@@ -83,6 +89,7 @@ class Sensor(Neuron):
             input_value: float
         ):
         
+        # only queues the outgoing signals, the observation drains the shared context once every sensor has transmitted.
         for c in self.get_connections():
             signal = Signal(
                 value=input_value
@@ -92,7 +99,6 @@ class Sensor(Neuron):
                 context=context
             )
             context.enqueue(c.transmit, egress)
-            context.run()
 
     def record(self):
         return {
@@ -105,44 +111,51 @@ class Sensor(Neuron):
         core: CoreIO = Injector.resolve(GlobalTypes.CORE)
         super().save_state(os.path.join(core._encoder_path, self.encoder, self.get_id(as_string=True)))
 
-class Motor(Neuron, Threader):
+# signals are summed into a slot of a motor bank, the decoder's bank once the motor is added to one.
+class Motor(Neuron):
     def __init__(self, 
             answer,
             decoder: DecoderType = None,
             id: Union[UUID, str] = None
         ):
-        Threader.__init__(self)
         Neuron.__init__(
             self,
             id=id,
             type=NeuronType.MOTOR
         )
         self.answer = answer
-        self.transmit = self.synchronized(self.transmit)
         self.decoder = decoder
-        self._signals: NDArray = np.array([])
+        self._bank: MotorBank = MotorBank()
+        self._slot: int = self._bank.allocate()
+
+    def get_bank(self) -> MotorBank:
+        return self._bank
+
+    def get_slot(self) -> int:
+        return self._slot
+
+    def set_bank(self, bank: MotorBank, slot: int) -> None:
+        self._bank = bank
+        self._slot = slot
 
     def transmit(self, ingress: Transmission):
-        self.enqueue(ingress)
-        while not self._queue.empty():
-            with self._lock:
-                egress: Transmission = self.dequeue()
-            signal: Signal = egress.get_signal()
-            self._signals = np.append(self._signals, signal.get_actual())
+        self._bank.add(self._slot, ingress.get_signal().get_actual())
+
+    def accumulate(self, signals: NDArray):
+        self._bank.add_many(self._slot, signals)
+
+    def get_signal_count(self) -> int:
+        return self._bank.get_count(self._slot)
 
     def get_state(self):
-        result = np.mean(self._signals)
-        if np.isnan(result):
-            raise ValueError("State of motor is NaN.")
-        
-        return result
+        return self._bank.get_state(self._slot)
     
     def save_state(self):
         core: CoreIO = Injector.resolve(GlobalTypes.CORE)
         super().save_state(os.path.join(core._decoder_path, self.decoder, self.get_id(as_string=True)))
     
     def reset_state(self):
-        self._state = 0
+        self._bank.clear(self._slot)
 
     def record(self):
         return {
@@ -151,47 +164,47 @@ class Motor(Neuron, Threader):
             "connections": [connection.get_id() for connection in self.get_connections()]
         }
 
-class Inter(Neuron, Threader):
+class Inter(Neuron):
     def __init__(
             self, 
             mesh: MeshType = None,
             id: Union[UUID, str] = None
         ):
-        Threader.__init__(self)
         Neuron.__init__(
             self,
             id=id,
             type=NeuronType.INTER
         )
         self.mesh = mesh
-        self._signal_buffer: list[Signal] = []
 
+    # signals are held on the context until every signal of the step has arrived, the neuron then fires once.
     def transmit(self, ingress: Transmission):
-        self.enqueue(ingress)
-
-        while not self._queue.empty():
-            with self._lock:
-                egress: Transmission = self.dequeue()
-            
-            self._signal_buffer.append(egress.get_signal())
+        context = ingress.get_context()
+        if context.buffer(self, ingress.get_signal()):
+            context.enqueue(self.fire, context)
 
-        total_value = sum(s.get_value() for s in self._signal_buffer)
+    def fire(self, context: Context):
+        signals = context.drain(self)
+        # arrivals add up towards the firing threshold, but the merged value is capped at the 1.0 a single signal can carry.
+        value = min(sum(s.get_value() for s in signals), 1.0)
 
-        if total_value >= self._config.neuron_firing_threshold:
-            merged_signal = Signal(
-                value=total_value,
-                path_length=max(s.get_path_length() for s in self._signal_buffer),
-                sum_log=sum(s.get_sums() for s in self._signal_buffer)
-            )
+        if value >= self._config.neuron_firing_threshold:
+            # the merged signal keeps the longest path and the average attenuation of its inputs.
+            path_length = max(s.get_path_length() for s in signals)
+            sum_log = sum(s.get_sums() for s in signals) / len(signals)
 
+            # every connection attenuates its own copy of the merged signal.
             for c in self.get_connections():
+                merged_signal = Signal(
+                    value=value,
+                    path_length=path_length,
+                    sum_log=sum_log
+                )
                 emission = Transmission(
-                    context=egress.get_context(),
+                    context=context,
                     signal=merged_signal
                 )
-                egress.get_context().enqueue(c.transmit, emission)
-
-        self._signal_buffer.clear()
+                context.enqueue(c.transmit, emission)
 
     def record(self):
         return {
@@ -11,6 +11,10 @@ class INeuron(ABC, Entity):
     def get_type(self) -> NeuronType:
         pass
 
+    @abstractmethod
+    def get_index(self) -> int:
+        pass
+
     @abstractmethod
     def get_active(self) -> bool:
         pass
\ No newline at end of file
@@ -1,4 +1,5 @@
 from ..neuron.core import Sensor, Motor
+from ..motor_bank.core import MotorBank
 from typing import Callable
 from ..core_io.core import CoreIO
 from ..encoder.enums import EncoderType
@@ -9,44 +10,60 @@ from typing import Union
 
 class NeuronIO:
     def __init__(self):
-        self._neuron_registry: list[NeuronState] = []
+        # keyed by transformer name so lookups do not scan every registered encoder and decoder.
+        self._neuron_registry: dict[Union[EncoderType, DecoderType], NeuronState] = {}
+        # one motor bank per decoder type, motors are moved into it when they are set.
+        self._banks: dict[DecoderType, MotorBank] = {}
 
     def set_neurons(self, neuron_list, transformer_name: Union[EncoderType, DecoderType], transformer_type: TransformerTypes):
-        if transformer_name not in [state.transformer_name for state in self._neuron_registry]:
-            self._neuron_registry.append(
-                NeuronState(
-                    neurons=neuron_list,
-                    transformer=transformer_type,
-                    transformer_name=transformer_name
-                )
+        if transformer_type == TransformerTypes.DECODER:
+            self.get_bank(transformer_name).adopt(neuron_list)
+
+        state = self._neuron_registry.get(transformer_name)
+        if state is None:
+            self._neuron_registry[transformer_name] = NeuronState(
+                neurons=neuron_list,
+                transformer=transformer_type,
+                transformer_name=transformer_name
             )
         else:
-            for state in self._neuron_registry:
-                if state.transformer_name == transformer_name:
-                    state.neurons = neuron_list
-                    state.is_dirty = True
+            state.neurons = neuron_list
+            state.is_dirty = True
+
+    # appends to the registered list in place, only the new neurons are adopted into the bank.
+    def add_neurons(self, neuron_list, transformer_name: Union[EncoderType, DecoderType], transformer_type: TransformerTypes):
+        state = self._neuron_registry.get(transformer_name)
+        if state is None:
+            self.set_neurons(list(neuron_list), transformer_name, transformer_type)
+            return
+
+        if transformer_type == TransformerTypes.DECODER:
+            self.get_bank(transformer_name).adopt(neuron_list)
+        state.neurons.extend(neuron_list)
+        state.is_dirty = True
 
     def get_neurons(self, transformer_name: Union[EncoderType, DecoderType]) -> list[Sensor]:
-        neuron_list = [state.neurons for state in self._neuron_registry if state.transformer_name == transformer_name]
-        if len(neuron_list) == 0:
+        state = self._neuron_registry.get(transformer_name)
+        if state is None:
             return []
-        if len(neuron_list) > 1:
-            raise ValueError("More than one instance of the encoder or decoder was found in the neuron registry.")
-        return neuron_list[0]
+        return state.neurons
     
     def get_neuron_total(self, transformer_type: TransformerTypes):
-        neurons = []
-        for n in self._neuron_registry:
-            if n.transformer == transformer_type:
-                neurons.extend(n.neurons)
-        return len(neurons)
+        return sum(len(n.neurons) for n in self._neuron_registry.values() if n.transformer == transformer_type)
     
     def get_all_neurons_by_transformer(self, transformer_type: TransformerTypes):
         neurons = []
-        for n in self._neuron_registry:
+        for n in self._neuron_registry.values():
             if n.transformer == transformer_type:
                 neurons.extend(n.neurons)
         return neurons
 
+    def get_bank(self, decoder_type: DecoderType) -> MotorBank:
+        bank = self._banks.get(decoder_type)
+        if bank is None:
+            bank = self._banks[decoder_type] = MotorBank()
+        return bank
+
     def clear(self):
-        self._neuron_registry.clear()
\ No newline at end of file
+        self._neuron_registry.clear()
+        self._banks.clear()
\ No newline at end of file
@@ -2,26 +2,46 @@ import numpy as np
 from numpy.typing import NDArray
 from .errors import UninstantiatedConnectionsError
 from ..connector.interface import IConnector
+from ..connector_table.core import ConnectorTable
+from ..terminal.core import Terminal
 from ..threader.core import Threader
 from ..config.core import Config
+from ..core_io.core import CoreIO
 from ..injector.core import Injector
 from ..injector.enums import GlobalTypes
+from ..shared.core import SharedArray
+from ..shared.models import SharedArrayModel
 import random
 
 class Registry(Threader):
     def __init__(self, threshold: float = 0.3):
         Threader.__init__(self)
-        self._strength: NDArray = np.array([])
-        self._epsilon: NDArray = np.array([])
-        self._status: NDArray = np.array([])
+        # the stores are over-allocated and doubled when full; _strength, _epsilon, _status and _live are views of the used rows.
+        # a removed connector leaves a dead row until compact() drops it and renumbers the rest.
+        self._size: int = 0
+        self._strength_store: NDArray = np.zeros(0)
+        self._epsilon_store: NDArray = np.zeros(0)
+        self._status_store: NDArray = np.zeros(0)
+        self._live_store: NDArray = np.zeros(0, dtype=bool)
+        self._strength: NDArray = self._strength_store[:0]
+        self._epsilon: NDArray = self._epsilon_store[:0]
+        self._status: NDArray = self._status_store[:0]
+        self._live: NDArray = self._live_store[:0]
         self._decay: NDArray = 0.9
         self._connectors: list[IConnector] = []
+        self._table: ConnectorTable = ConnectorTable()
+        self._dirty: set[int] = set()
+        self._shared: dict[str, SharedArray] = {}
         self._threshold: float = threshold
         self._config: Config = Injector.resolve(name=GlobalTypes.CONFIG)
 
     def get_strength(self, index: int):
         return self._strength[index]
     
+    def set_strength(self, index: int, strength: float):
+        self._strength[index] = strength
+        self._dirty.add(index)
+
     def get_threshold(self):
         return self._threshold
     
@@ -36,6 +56,9 @@ class Registry(Threader):
     
     def get_decay(self):
         return self._decay
+
+    def get_config(self) -> Config:
+        return self._config
     
     def activate_connector(self, index) -> None:
         self.enqueue(index)
@@ -44,15 +67,121 @@ class Registry(Threader):
                 saved_index: int = self.dequeue()
             self._status[saved_index] = 1
 
+    def activate_connectors(self, indices: NDArray) -> None:
+        with self._lock:
+            self._status[indices] = 1
+
+    def get_size(self) -> int:
+        return self._size
+
+    def get_table(self) -> ConnectorTable:
+        return self._table
+
+    def get_capacity(self) -> int:
+        return self._strength_store.size
+
+    def _reserve(self, count: int) -> None:
+        required = self._size + count
+        capacity = self._strength_store.size
+        if required <= capacity:
+            return
+
+        capacity = max(required, capacity * 2, 16)
+        self._strength_store = self._grow(self._strength_store, capacity)
+        self._epsilon_store = self._grow(self._epsilon_store, capacity)
+        self._status_store = self._grow(self._status_store, capacity)
+        self._live_store = self._grow(self._live_store, capacity)
+        if len(self._shared) > 0:
+            self.release()
+            self.share()
+
+    def _grow(self, store: NDArray, capacity: int) -> NDArray:
+        grown = np.zeros(capacity, dtype=store.dtype)
+        grown[:self._size] = store[:self._size]
+        return grown
+
+    def _set_size(self, size: int) -> None:
+        self._size = size
+        self._strength = self._strength_store[:size]
+        self._epsilon = self._epsilon_store[:size]
+        self._status = self._status_store[:size]
+        self._live = self._live_store[:size]
+
+    # moves the strength and epsilon stores into shared memory so worker processes read them without a copy.
+    # learning keeps writing to the same blocks, they are only replaced when the registry grows.
+    def share(self) -> dict[str, SharedArrayModel]:
+        with self._lock:
+            if len(self._shared) == 0:
+                self._shared = {
+                    "strength": SharedArray.from_array(self._strength_store),
+                    "epsilon": SharedArray.from_array(self._epsilon_store)
+                }
+                self._strength_store = self._shared["strength"].array
+                self._epsilon_store = self._shared["epsilon"].array
+                self._set_size(self._size)
+        return {name: array.describe() for name, array in self._shared.items()}
+
+    def is_shared(self) -> bool:
+        return len(self._shared) > 0
+
+    # copies the stores back into process memory before the shared blocks are unlinked.
+    def release(self) -> None:
+        with self._lock:
+            if len(self._shared) == 0:
+                return
+            self._strength_store = self._strength_store.copy()
+            self._epsilon_store = self._epsilon_store.copy()
+            self._set_size(self._size)
+            for array in self._shared.values():
+                array.release()
+            self._shared = {}
+
+    # adopts existing strength and epsilon columns, such as a mapped snapshot, without copying them.
+    def attach(self, strength: NDArray, epsilon: NDArray) -> None:
+        self.release()
+        with self._lock:
+            self._strength_store = strength
+            self._epsilon_store = epsilon
+            self._status_store = np.zeros(strength.size)
+            self._live_store = np.ones(strength.size, dtype=bool)
+            self._connectors = []
+            self._table = ConnectorTable()
+            self._dirty.clear()
+            self._set_size(strength.size)
+
     def add_connector(self, connector: IConnector, strength: float = None, epsilon: float = None):
         if strength is None:
             strength = random.uniform(0.4, 0.9)
 
-        self._connectors.append(connector)
-        self._strength = np.append(self._strength, strength)
-        self._epsilon = np.append(self._epsilon, epsilon or self._config.epsilon_start)
-        self._status = np.append(self._status, 0)
-        connector.set_index(len(self._strength)-1)
+        self.add_connectors([connector], strengths=[strength], epsilons=[epsilon or self._config.epsilon_start])
+
+    def add_connectors(self, connectors: list[IConnector], strengths: list[float] = None, epsilons: list[float] = None):
+        count = len(connectors)
+        if count == 0:
+            return
+
+        if strengths is None:
+            strengths = [random.uniform(0.4, 0.9) for _ in range(count)]
+
+        if epsilons is None:
+            epsilons = np.full(count, self._config.epsilon_start)
+
+        with self._lock:
+            start = self._size
+            self._reserve(count)
+            self._strength_store[start:start + count] = strengths
+            self._epsilon_store[start:start + count] = epsilons
+            self._status_store[start:start + count] = 0
+            self._live_store[start:start + count] = True
+            self._set_size(start + count)
+            self._connectors.extend(connectors)
+            self._table.append(
+                dendrites=[-1 if c.get_dendrite() is None else c.get_dendrite().get_index() for c in connectors],
+                defaults=[c.is_default for c in connectors]
+            )
+
+        for offset, connector in enumerate(connectors):
+            connector.set_index(start + offset, self)
         
     def learn(self, confidence: float, reward: float, reverse=False):
         if self._strength.size == 0 or self._epsilon.size == 0:
@@ -65,11 +194,68 @@ class Registry(Threader):
         deltas = self._epsilon[active_mask] * (reward - confidence)
         self._strength[active_mask] = np.clip(self._strength[active_mask] + deltas, 0.1, 0.9)
         self._epsilon[active_mask] *= self._config.epsilon_decay
+        self._dirty.update(np.flatnonzero(active_mask).tolist())
 
         self._reset_connectors()
+        self.flush()
+
+    # rows whose live connector has decayed below the point where it could ever pass a signal.
+    def get_pruning_mask(self, threshold: float) -> NDArray:
+        return self._live & (self._strength * 0.9 <= threshold)
+
+    def get_dead_count(self) -> int:
+        return self._size - int(np.count_nonzero(self._live))
+
+    def remove_connector(self, connector: IConnector) -> None:
+        self.remove_connectors(np.array([connector._index], dtype=np.int64))
+
+    # marks the rows dead in one pass and returns the connectors that held them.
+    def remove_connectors(self, rows: NDArray) -> list[IConnector]:
+        with self._lock:
+            rows = rows[self._live[rows]]
+            self._live[rows] = False
+            removed = [self._connectors[row] for row in rows.tolist()]
+            for row in rows.tolist():
+                self._connectors[row] = None
+                self._dirty.discard(row)
+        return removed
+
+    # drops dead rows once they make up at least ratio of the registry and renumbers the live connectors.
+    # returns the old to new row mapping, -1 for dropped rows, or None when nothing was compacted.
+    def compact(self, ratio: float = 0.0) -> NDArray:
+        with self._lock:
+            dead = self.get_dead_count()
+            if dead == 0 or dead < ratio * self._size:
+                return None
+
+            keep = np.flatnonzero(self._live)
+            remap = np.full(self._size, -1, dtype=np.int64)
+            remap[keep] = np.arange(keep.size)
+            self._strength_store[:keep.size] = self._strength[keep]
+            self._epsilon_store[:keep.size] = self._epsilon[keep]
+            self._status_store[:keep.size] = self._status[keep]
+            self._live_store[:keep.size] = True
+            self._table.compact(keep)
+            self._connectors = [self._connectors[row] for row in keep.tolist()]
+            self._dirty = set(remap[sorted(self._dirty)].tolist()) if len(self._dirty) > 0 else set()
+            self._set_size(keep.size)
+
+        for index, connector in enumerate(self._connectors):
+            connector.set_index(index, self)
+
+        # compiled graphs hold registry rows and have to be rebuilt.
+        Terminal.invalidate()
+        return remap
+
+    def flush(self) -> None:
+        core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+        dirty = sorted(self._dirty)
+        self._dirty.clear()
+        if not core.is_incremental():
+            return
 
-        for c in self._connectors:
-            c.save_state()
+        connectors = [self._connectors[i] for i in dirty]
+        core.save_files([c.get_state_file() for c in connectors if c is not None])
 
     def _reset_connectors(self) -> None:
-        self._status = np.zeros_like(self._status)
\ No newline at end of file
+        self._status[:] = 0
\ No newline at end of file
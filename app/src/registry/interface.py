@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from numpy.typing import NDArray
 from ..connector.interface import IConnector
+from ..connector_table.core import ConnectorTable
+from ..config.core import Config
 
 
 class IRegistry(ABC):
@@ -34,6 +36,16 @@ class IRegistry(ABC):
         """Returns the decay value for this connection's network."""
         pass
 
+    @abstractmethod
+    def get_config(self) -> Config:
+        """Returns the config the registry was created with."""
+        pass
+
+    @abstractmethod
+    def get_table(self) -> ConnectorTable:
+        """Returns the table holding the endpoints and default flag of every registered connector."""
+        pass
+
     @abstractmethod
     def activate_connector(self, index: int) -> None:
         """Activates the connector at the specified index."""
@@ -44,6 +56,11 @@ class IRegistry(ABC):
         """Adds a new connector to the registry."""
         pass
 
+    @abstractmethod
+    def add_connectors(self, connectors: list[IConnector], strengths: list[float], epsilons: list[float]) -> None:
+        """Adds a batch of connectors to the registry in a single allocation."""
+        pass
+
     @abstractmethod
     def learn(self, confidence: float, reward: float) -> None:
         """Performs the learning process, updating strengths and epsilons."""
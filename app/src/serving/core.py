@@ -0,0 +1,145 @@
+# an asyncio facade over a single model, propogation runs on one worker thread so the event loop stays free.
+# requests arriving within a window are batched, a model that can batch propogates them in one compiled pass.
+from ..haze.core import Haze
+from ..haze.models import InputModel
+from ..encoder.core import Encoder
+from .models import RequestModel, ServingStatsModel
+from .errors import ServingClosedError
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+import asyncio
+
+class AsyncHaze:
+    def __init__(
+            self,
+            haze: Haze,
+            window: float = 0.002,
+            max_batch: int = 32,
+            max_queue: int = 1024
+        ):
+        self._haze = haze
+        self._window = window
+        self._max_batch = max_batch
+        self._max_queue = max_queue
+        self._queue: asyncio.Queue[RequestModel] = None
+        self._batcher: asyncio.Task = None
+        # the model is not thread safe, so every batch runs on the same single thread.
+        self._pool: ThreadPoolExecutor = None
+        self._stats = ServingStatsModel()
+
+    def get_haze(self) -> Haze:
+        return self._haze
+
+    def get_stats(self) -> ServingStatsModel:
+        self._stats.queue_depth = 0 if self._queue is None else self._queue.qsize()
+        return self._stats
+
+    def _start(self) -> None:
+        if self._batcher is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue)
+            self._pool = ThreadPoolExecutor(max_workers=1)
+            self._batcher = asyncio.get_running_loop().create_task(self._run())
+
+    # a full queue suspends the caller until the batcher catches up.
+    async def observe_and_predict(self, input_data: list[Any], encoder: Encoder, limit: int = None) -> dict[str, list]:
+        self._start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(RequestModel(input_data=input_data, encoder=encoder, limit=limit, future=future))
+        return await future
+
+    # requests arriving within the window of the first one are answered by the same hand off to the worker thread.
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            self._record(len(batch))
+            try:
+                results = await loop.run_in_executor(self._pool, self._run_batch, batch)
+            except asyncio.CancelledError:
+                self._fail(batch)
+                raise
+
+            for request, (result, error) in zip(batch, results):
+                if request.future.done():
+                    continue
+                if error is not None:
+                    self._stats.errors += 1
+                    request.future.set_exception(error)
+                else:
+                    request.future.set_result(result)
+
+    # the whole batch is propogated in one pass and each request is decoded from its own motor signals.
+    # a model that cannot batch, or a batch that fails as a whole, is answered one request at a time
+    # so every error reaches the request that caused it.
+    def _run_batch(self, batch: list[RequestModel]) -> list[tuple[Any, Exception]]:
+        observations = [InputModel(input_data=request.input_data, encoder=request.encoder) for request in batch]
+        if len(batch) > 1 and self._haze.can_batch():
+            try:
+                observed = self._haze.observe_batch(observations)
+            except Exception:
+                observed = None
+
+            if observed is not None:
+                self._stats.combined_batches += 1
+                results: list[tuple[Any, Exception]] = []
+                for request, observation, result in zip(batch, observations, observed):
+                    try:
+                        results.append((self._haze.predict_observed(observation, result, limit=request.limit), None))
+                    except Exception as error:
+                        results.append((None, error))
+                return results
+
+        results = []
+        for request in batch:
+            try:
+                self._haze.observe(input_data=request.input_data, encoder=request.encoder)
+                results.append((self._haze.predict(limit=request.limit), None))
+            except Exception as error:
+                results.append((None, error))
+        return results
+
+    def _record(self, size: int) -> None:
+        self._stats.requests += size
+        self._stats.batches += 1
+        self._stats.max_batch_size = max(self._stats.max_batch_size, size)
+        self._stats.batch_sizes[size] = self._stats.batch_sizes.get(size, 0) + 1
+
+    def _fail(self, batch: list[RequestModel]) -> None:
+        for request in batch:
+            if not request.future.done():
+                request.future.set_exception(ServingClosedError())
+
+    # pending requests are failed rather than dropped, the wrapped model stays usable.
+    async def close(self) -> None:
+        if self._batcher is None:
+            return
+
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+
+        pending: list[RequestModel] = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending)
+        self._pool.shutdown(wait=True)
+        self._batcher = None
+        self._queue = None
+        self._pool = None
@@ -0,0 +1,3 @@
+class ServingClosedError(Exception):
+    def __init__(self):
+        super().__init__("The serving facade was closed before the request was answered.")
@@ -0,0 +1,28 @@
+from dataclasses import dataclass, field
+from asyncio import Future
+from typing import Any
+from ..encoder.core import Encoder
+
+@dataclass
+class RequestModel:
+    input_data: list[Any]
+    encoder: Encoder
+    limit: int
+    future: Future
+
+@dataclass
+class ServingStatsModel:
+    queue_depth: int = 0
+    requests: int = 0
+    errors: int = 0
+    batches: int = 0
+    # batches of more than one request that were propogated in a single pass rather than one request at a time.
+    combined_batches: int = 0
+    max_batch_size: int = 0
+    # number of batches seen for each batch size.
+    batch_sizes: dict[int, int] = field(default_factory=dict)
+
+    def get_mean_batch_size(self) -> float:
+        if self.batches == 0:
+            return 0.0
+        return self.requests / self.batches
@@ -0,0 +1,57 @@
+from multiprocessing.shared_memory import SharedMemory
+from numpy.typing import NDArray, DTypeLike
+from .models import SharedArrayModel
+import numpy as np
+import weakref
+
+# a numpy array backed by a named shared memory block, the creating process owns the block and unlinks it.
+class SharedArray:
+    # blocks opened by this process through attach, kept open so the arrays stay valid between calls.
+    _attached: dict[str, tuple[SharedMemory, NDArray]] = {}
+
+    def __init__(self, shape: tuple[int, ...], dtype: DTypeLike):
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        self._memory = SharedMemory(create=True, size=size)
+        self.array: NDArray = np.ndarray(shape, dtype=dtype, buffer=self._memory.buf)
+        self._finalizer = weakref.finalize(self, SharedArray._release, self._memory)
+
+    @classmethod
+    def from_array(cls, array: NDArray) -> "SharedArray":
+        shared = cls(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    def describe(self) -> SharedArrayModel:
+        return SharedArrayModel(name=self._memory.name, shape=self.array.shape, dtype=self.array.dtype.str)
+
+    def release(self) -> None:
+        self.array = None
+        self._finalizer()
+
+    @staticmethod
+    def _release(memory: SharedMemory) -> None:
+        try:
+            memory.close()
+        except BufferError:
+            # an exported view is still alive, the mapping goes away with the process instead.
+            pass
+        memory.unlink()
+
+    @classmethod
+    def attach(cls, model: SharedArrayModel) -> NDArray:
+        attached = cls._attached.get(model.name)
+        if attached is None:
+            memory = SharedMemory(name=model.name)
+            attached = (memory, np.ndarray(model.shape, dtype=np.dtype(model.dtype), buffer=memory.buf))
+            cls._attached[model.name] = attached
+        return attached[1]
+
+    @classmethod
+    def detach_all(cls, keep: set[str] = frozenset()) -> None:
+        for name in [name for name in cls._attached.keys() if name not in keep]:
+            memory, _ = cls._attached.pop(name)
+            try:
+                memory.close()
+            except BufferError:
+                pass
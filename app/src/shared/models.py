@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+# enough to re-open a shared array in another process.
+@dataclass(frozen=True)
+class SharedArrayModel:
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
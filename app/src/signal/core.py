@@ -1,14 +1,15 @@
-from ..entity.core import Entity
 import math
 
-class Signal(Entity):
+# signals are created on every hop, so they carry no id and no instance dict.
+class Signal:
+    __slots__ = ("_value", "_path_length", "_sum_log")
+
     def __init__(
             self, 
             value: float, 
             path_length: int = 0,
             sum_log: float = 0
         ):
-        Entity.__init__(self)
         self._value: float = value
         self._path_length = path_length
         self._sum_log = sum_log
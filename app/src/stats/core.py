@@ -0,0 +1,64 @@
+from .models import StatsModel, TimerModel
+from typing import Callable
+from dataclasses import replace
+import time
+
+# stage timers and counters for one model, stages are named "<method>.<stage>".
+# when disabled clock() returns 0.0 and lap() and count() return straight away, so the cost is one attribute check.
+class Stats:
+    def __init__(self, enabled: bool = False, callback: Callable[[str, float], None] = None):
+        self._enabled = enabled
+        self._callback = callback
+        self._timers: dict[str, TimerModel] = {}
+        self._counters: dict[str, int] = {}
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def set_enabled(self, enabled: bool) -> None:
+        self._enabled = enabled
+
+    # the callback receives the stage and its seconds every time a lap is recorded.
+    def set_callback(self, callback: Callable[[str, float], None]) -> None:
+        self._callback = callback
+
+    def clock(self) -> float:
+        if not self._enabled:
+            return 0.0
+        return time.perf_counter()
+
+    # records the time since started and returns the current clock for the next stage.
+    def lap(self, stage: str, started: float) -> float:
+        if not self._enabled:
+            return 0.0
+
+        now = time.perf_counter()
+        elapsed = now - started
+        timer = self._timers.get(stage)
+        if timer is None:
+            timer = self._timers[stage] = TimerModel()
+        timer.count += 1
+        timer.total += elapsed
+        if elapsed > timer.max:
+            timer.max = elapsed
+
+        if self._callback is not None:
+            self._callback(stage, elapsed)
+        return now
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        if not self._enabled:
+            return
+        self._counters[counter] = self._counters.get(counter, 0) + amount
+
+    # a copy, so later stages do not change a snapshot that was already taken.
+    def snapshot(self) -> StatsModel:
+        return StatsModel(
+            enabled=self._enabled,
+            timers={stage: replace(timer) for stage, timer in self._timers.items()},
+            counters=dict(self._counters)
+        )
+
+    def reset(self) -> None:
+        self._timers.clear()
+        self._counters.clear()
@@ -0,0 +1,19 @@
+from dataclasses import dataclass, field
+
+# seconds are wall clock totals across every call of the stage.
+@dataclass
+class TimerModel:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def get_mean(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self.total / self.count
+
+@dataclass
+class StatsModel:
+    enabled: bool = False
+    timers: dict[str, TimerModel] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
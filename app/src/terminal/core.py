@@ -1,16 +1,40 @@
 from ..connector.core import Connector
+from numpy.typing import NDArray
 from .errors import NoMatchingConnectionError
 from.errors import IdenticalConnectionError
 
 class Terminal():
+    # bumped on every change to any connection list so compiled views of the graph know when to rebuild.
+    _revision: int = 0
+
     def __init__(self):
         super().__init__()
         self._connections: list[Connector] = []
+        # the reverse index, connectors pointing at this neuron keyed by the index of their axon.
+        self._incoming: dict[int, Connector] = {}
+
+    @classmethod
+    def get_revision(cls) -> int:
+        return Terminal._revision
+
+    @classmethod
+    def _touch(cls) -> None:
+        Terminal._revision += 1
 
+    # for changes made outside any connection list, such as renumbering registry rows, that compiled graphs still depend on.
+    @classmethod
+    def invalidate(cls) -> None:
+        cls._touch()
+
+    # uuids are compared as objects and dendrites by index, neither is formatted as a string.
     def put_connection(self, connection: Connector) -> None:
+        connection_id = connection.get_id(as_string=False)
         for x, c in enumerate(self._connections):
-            if c.get_id() == connection.get_id():
+            if c.get_id(as_string=False) == connection_id:
+                self._detach(c)
                 self._connections[x] = connection
+                self._attach(connection)
+                self._touch()
                 return
 
         raise NoMatchingConnectionError(f"Error: there is no connection with the id: {connection.get_id()} found in connection list.")
@@ -18,30 +42,89 @@ class Terminal():
     def get_connections(self) -> list[Connector]:
         return self._connections
 
-    def post_connection(self, connection: Connector) -> None:
-        new_dendrite = connection.get_dendrite()
+    def get_incoming(self) -> list[Connector]:
+        return list(self._incoming.values())
+
+    def has_incoming(self, axon_index: int) -> bool:
+        return axon_index in self._incoming
 
+    def _attach(self, connection: Connector) -> None:
+        connection.set_axon(self.get_index())
+        dendrite = connection.get_dendrite()
+        if dendrite is not None:
+            dendrite._incoming[self.get_index()] = connection
+
+    def _detach(self, connection: Connector) -> None:
+        connection.set_axon(-1)
+        dendrite = connection.get_dendrite()
+        if dendrite is not None and dendrite._incoming.get(self.get_index()) is connection:
+            del dendrite._incoming[self.get_index()]
+
+    # a duplicate dendrite is found through the dendrite's reverse index instead of scanning the list.
+    def post_connection(self, connection: Connector) -> None:
+        connection_id = connection.get_id(as_string=False)
         for c in self._connections:
-            if c.get_id() == connection.get_id():
+            if c.get_id(as_string=False) == connection_id:
                 raise IdenticalConnectionError(f"Error: there is already a connection with the id of {connection.get_id()} registered to the connection list.")
-            
-            existing_dendrite = c.get_dendrite()
-            if existing_dendrite.get_id() == new_dendrite.get_id():
-                raise IdenticalConnectionError(f"Error: this connection would add a duplicate signal to an existing dendritic connection.")
+
+        if connection.get_dendrite().has_incoming(self.get_index()):
+            raise IdenticalConnectionError(f"Error: this connection would add a duplicate signal to an existing dendritic connection.")
         
         self._connections.append(connection)
+        self._attach(connection)
+        self._touch()
+        self.choose_default()
+
+    # validates the whole batch against the list once instead of once per connection.
+    def post_connections(self, connections: list[Connector]) -> None:
+        ids = set(c.get_id(as_string=False) for c in self._connections)
+        dendrite_indices = set(c.get_dendrite().get_index() for c in self._connections)
+
+        for connection in connections:
+            connection_id = connection.get_id(as_string=False)
+            if connection_id in ids:
+                raise IdenticalConnectionError(f"Error: there is already a connection with the id of {connection.get_id()} registered to the connection list.")
+
+            dendrite_index = connection.get_dendrite().get_index()
+            if dendrite_index in dendrite_indices:
+                raise IdenticalConnectionError(f"Error: this connection would add a duplicate signal to an existing dendritic connection.")
+
+            ids.add(connection_id)
+            dendrite_indices.add(dendrite_index)
+
+        self._connections.extend(connections)
+        for connection in connections:
+            self._attach(connection)
+        self._touch()
         self.choose_default()
 
     def delete_connection(self, connection: Connector) -> None:
+        connection_id = connection.get_id(as_string=False)
         for x, c in enumerate(self._connections):
-            if c.get_id() == connection.get_id():
+            if c.get_id(as_string=False) == connection_id:
+                self._detach(c)
                 del self._connections[x]
+                self._touch()
                 return
         
         raise NoMatchingConnectionError(f"Error: there is no connection with the id: {connection.get_id()} found in connection list.")
     
+    # drops every registered connection whose registry row is set in the mask and returns them.
+    def prune_connections(self, mask: NDArray) -> list[Connector]:
+        pruned = [c for c in self._connections if c._index is not None and mask[c._index]]
+        for c in pruned:
+            self._detach(c)
+
+        if len(pruned) > 0:
+            self._connections = [c for c in self._connections if c._index is None or not mask[c._index]]
+            self._touch()
+        return pruned
+
     def clear_connections(self):
+        for c in self._connections:
+            self._detach(c)
         self._connections = []
+        self._touch()
     
     def choose_default(self):
         x = 0
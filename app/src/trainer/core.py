@@ -1,20 +1,116 @@
-from ..network.core import Network
+from ..haze.core import Haze
+from ..haze.errors import UnconnectedSignalError
+from ..encoder.core import Encoder
+from .models import TrainingReportModel
+from .errors import SinglePassDatasetError
+from typing import Any, Callable, Iterable, Union
+import time
 
+# rows are (input, expected) pairs read lazily, so a dataset is never held in memory.
+# the reward function scores the expected value against the results returned by Haze.predict.
 class Trainer:
-    def __init__(self):
-        pass
+    def __init__(
+            self,
+            haze: Haze,
+            encoder: Encoder,
+            reward: Callable[[Any, dict[str, list]], float],
+            limit: int = None,
+            checkpoint_steps: int = None,
+            checkpoint_seconds: float = None,
+            verbose: bool = False,
+            report_every: int = 1000
+        ):
+        self._haze = haze
+        self._encoder = encoder
+        self._reward = reward
+        self._limit = limit
+        self._checkpoint_steps = checkpoint_steps
+        self._checkpoint_seconds = checkpoint_seconds
+        self._verbose = verbose
+        self._report_every = report_every
+        self._report = TrainingReportModel()
+        self._last_checkpoint_step: int = 0
+        self._last_checkpoint_time: float = time.perf_counter()
+
+    def get_report(self) -> TrainingReportModel:
+        return self._report
 
     # training on a dataset for multiple epochs
-    def practice(self):
-        pass
+    # rows can be a re-iterable or a function returning a new iterable for each epoch.
+    def practice(self, rows: Union[Iterable[tuple[Any, Any]], Callable[[], Iterable[tuple[Any, Any]]]], epochs: int = 1) -> TrainingReportModel:
+        if epochs > 1 and not callable(rows) and iter(rows) is rows:
+            raise SinglePassDatasetError()
+
+        for _ in range(epochs):
+            self.epoch(rows() if callable(rows) else rows)
+        return self._report
 
     # training on a dataset for a single epoch
-    def epoch(self):
-        pass
+    def epoch(self, rows: Iterable[tuple[Any, Any]]) -> TrainingReportModel:
+        started = time.perf_counter()
+        for input_data, expected in rows:
+            self.step(input_data, expected)
+            if self._verbose and self._report.rows % self._report_every == 0:
+                self._print()
+
+        self._report.epochs += 1
+        self._report.elapsed += time.perf_counter() - started
+        if self._verbose:
+            self._print()
+        return self._report
 
     # training and adjustment for a single row
-    def step(self):
-        # make a prediction
-        # check its accuracy
-        # make adjustments based on how accurate the answer was.
-        pass
\ No newline at end of file
+    def step(self, input_data: list[Any], expected: Any) -> float:
+        started = time.perf_counter()
+        self._haze.observe(input_data=input_data, encoder=self._encoder)
+        started = self._lap("observe", started)
+        try:
+            results = self._haze.predict(self._limit)
+        except UnconnectedSignalError:
+            results = None
+        started = self._lap("predict", started)
+
+        # predict already relearned while retrying, so an unconnected row is only counted.
+        if results is None:
+            reward = 0.0
+            self._report.unconnected += 1
+        else:
+            reward = self._reward(expected, results)
+            started = self._lap("reward", started)
+            self._haze.learn(reward=reward)
+            started = self._lap("learn", started)
+
+        self._report.rows += 1
+        self._report.reward_total += reward
+        if self._should_checkpoint(started):
+            self.checkpoint()
+            self._lap("checkpoint", started)
+        return reward
+
+    # a model that writes nothing on save is counted as skipped rather than checkpointed.
+    def checkpoint(self) -> bool:
+        saved = self._haze.save()
+        if saved:
+            self._report.checkpoints += 1
+        else:
+            self._report.skipped_checkpoints += 1
+        self._last_checkpoint_step = self._report.rows
+        self._last_checkpoint_time = time.perf_counter()
+        return saved
+
+    def _should_checkpoint(self, now: float) -> bool:
+        if self._checkpoint_steps is not None and self._report.rows - self._last_checkpoint_step >= self._checkpoint_steps:
+            return True
+        return self._checkpoint_seconds is not None and now - self._last_checkpoint_time >= self._checkpoint_seconds
+
+    def _lap(self, stage: str, started: float) -> float:
+        now = time.perf_counter()
+        self._report.stages[stage] = self._report.stages.get(stage, 0.0) + now - started
+        return now
+
+    def _print(self) -> None:
+        report = self._report
+        stages = " ".join(f"{stage}={seconds:.2f}s" for stage, seconds in report.stages.items())
+        elapsed = report.elapsed if report.elapsed > 0 else sum(report.stages.values())
+        rate = report.rows / elapsed if elapsed > 0 else 0.0
+        print(f"epoch {report.epochs} rows {report.rows} {rate:.1f} rows/s reward {report.get_mean_reward():.3f} {stages}")
@@ -0,0 +1,3 @@
+class SinglePassDatasetError(Exception):
+    def __init__(self):
+        super().__init__("An iterator can only be read once, pass a re-iterable or a function that returns a new iterator for each epoch.")
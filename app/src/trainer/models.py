@@ -0,0 +1,25 @@
+from dataclasses import dataclass, field
+
+# stage times are totals in seconds, rewards are kept as a running sum rather than a list.
+@dataclass
+class TrainingReportModel:
+    rows: int = 0
+    epochs: int = 0
+    checkpoints: int = 0
+    # checkpoints due on a model with nothing to write, unpersisted or stored as a directory.
+    skipped_checkpoints: int = 0
+    # rows whose signal never reached a motor, they are scored 0 and not learned from.
+    unconnected: int = 0
+    elapsed: float = 0.0
+    reward_total: float = 0.0
+    stages: dict[str, float] = field(default_factory=dict)
+
+    def get_rows_per_second(self) -> float:
+        if self.elapsed == 0:
+            return 0.0
+        return self.rows / self.elapsed
+
+    def get_mean_reward(self) -> float:
+        if self.rows == 0:
+            return 0.0
+        return self.reward_total / self.rows
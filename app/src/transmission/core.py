@@ -2,6 +2,8 @@ from ..context.core import Context
 from ..signal.core import Signal
 
 class Transmission:
+    __slots__ = ("_context", "_signal")
+
     def __init__(self, context: Context, signal: Signal):
         self._context: Context = context
         self._signal: Signal = signal
@@ -2,7 +2,9 @@ from app.src.connector.core import Connector
 from app.src.neuron.core import Inter, Motor, Sensor
 from app.src.context.core import Context
 from app.src.transmission.core import Transmission
+from app.src.signal.core import Signal
 from app.src.core_io.core import CoreIO
+from app.src.allocator.core import Allocator
 from unittest.mock import MagicMock, patch
 from app.src.registry.core import Registry
 from app.src.injector.core import Injector
@@ -35,10 +37,12 @@ def test_transmit_handlesSingleBranch():
     registry.add_connector(inter_con)
     sensor.post_connection(sensor_con)
     inter.post_connection(inter_con)
+    context = Context()
     sensor.transmit(
-        context=Context(),
+        context=context,
         input_value=1
     )
+    context.run()
     motor_state = motor.get_state()
     assert motor_state != 1
 
@@ -75,10 +79,12 @@ def test_transmit_handlesMultipleBranches():
     inter_2.post_connection(connection=connection_list[6])
     inter_2.post_connection(connection=connection_list[7])
 
+    context = Context()
     sensor.transmit(
-        context=Context(),
+        context=context,
         input_value=1
     )
+    context.run()
 
     results = [motor_1.get_state(), motor_2.get_state(), motor_3.get_state()]
 
@@ -110,10 +116,12 @@ def test_transmit_doesNotCauseRecursion():
     inter_3.post_connection(connection_list[3])
 
     try:
+        context = Context()
         sensor.transmit(
             input_value=1,
-            context=Context()
+            context=context
         )
+        context.run()
     except RecursionError:
         pytest.fail("RecursionError occurred during signal transmission")
 
@@ -165,3 +173,33 @@ def test_saveState_doesReturnExpectedStateInFile():
         connector.record(),
         f"mock_connection_path/{connector.get_id(as_string=True)}"
     )
+
+def test_transmit_doesOnlyCrossOncePerContext():
+    Injector.register(GlobalTypes.CONFIG, instance=Config(signal_threshold=0.1))
+    Injector.register(GlobalTypes.ALLOCATOR, instance=Allocator())
+    Injector.register(GlobalTypes.CORE, instance=CoreIO())
+    Injector.register(GlobalTypes.REGISTRY, instance=Registry())
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    motor = Motor(answer='test')
+    connector = Connector(dendrite=motor)
+    registry.add_connector(connector)
+    contexts = [Context(), Context()]
+
+    for context in contexts + contexts:
+        connector.transmit(Transmission(context=context, signal=Signal(value=1)))
+        context.run()
+
+    assert motor.get_signal_count() == 2
+    assert all(context._visited == {connector._index} for context in contexts)
+
+def test_getStrength_doesReadTheRegistryThatOwnsTheRow():
+    Injector.register(GlobalTypes.CONFIG, instance=Config())
+    Injector.register(GlobalTypes.ALLOCATOR, instance=Allocator())
+    Injector.register(GlobalTypes.CORE, instance=CoreIO())
+    owner = Registry()
+    connector = Connector(dendrite=Inter())
+    owner.add_connector(connector, strength=0.8)
+    Injector.register(GlobalTypes.REGISTRY, instance=Registry())
+
+    assert connector.get_strength() == 0.8
+    assert connector._registry is owner
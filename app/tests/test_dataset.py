@@ -0,0 +1,41 @@
+from app.src.dataset.core import generate, iter_rows, write_npy, read_npy, get_chunk_rows, generate_binary_sequence
+from app.src.dataset.enums import DatasetType
+from app.src.dataset.errors import EmptyDatasetError
+import numpy as np
+import pytest
+
+def test_generate_doesRepeatWithSeed():
+    first = list(generate(DatasetType.MULTICLASS, rows=100, width=4, seed=3))
+    second = list(generate(DatasetType.MULTICLASS, rows=100, width=4, seed=3))
+
+    assert all(np.array_equal(a.inputs, b.inputs) and np.array_equal(a.targets, b.targets) for a, b in zip(first, second))
+
+def test_generate_doesStayUnderMemoryLimit():
+    chunks = list(generate(DatasetType.PARITY, rows=1000, width=8, memory_limit=1600))
+
+    assert len(chunks) == 10
+    assert all(chunk.inputs.shape == (100, 8) for chunk in chunks)
+    assert all(np.array_equal(chunk.targets, chunk.inputs.sum(axis=1) % 2) for chunk in chunks)
+
+def test_iterRows_doesYieldInputAndTarget():
+    rows = list(iter_rows(generate(DatasetType.COPY, rows=5, width=3)))
+
+    assert len(rows) == 5
+    assert all(input_data == expected and len(input_data) == 3 for input_data, expected in rows)
+    assert len(generate_binary_sequence(dataset_size=5, row_size=3)) == 5
+
+def test_readNpy_doesReplayWrittenDataset(tmp_path):
+    path = str(tmp_path / "regression")
+    written = write_npy(path, generate(DatasetType.REGRESSION, rows=250, width=4, seed=1, memory_limit=4000), rows=250)
+
+    replayed = list(read_npy(path, memory_limit=4000))
+    expected = list(generate(DatasetType.REGRESSION, rows=250, width=4, seed=1, memory_limit=4000))
+
+    assert written == 250
+    assert sum(chunk.inputs.shape[0] for chunk in replayed) == 250
+    assert np.array_equal(np.concatenate([c.inputs for c in replayed]), np.concatenate([c.inputs for c in expected]))
+    assert np.array_equal(np.concatenate([c.targets for c in replayed]), np.concatenate([c.targets for c in expected]))
+
+def test_writeNpy_raisesErrorWhenEmpty(tmp_path):
+    with pytest.raises(EmptyDatasetError):
+        write_npy(str(tmp_path / "empty"), iter([]), rows=10)
@@ -0,0 +1,142 @@
+from app.src.haze.core import Haze
+from app.src.config.core import Config
+from app.src.context.core import Context
+from app.src.engine.core import Engine
+from app.src.engine.enums import EngineType
+from app.src.executor.enums import ExecutorType
+from app.src.encoder.core import NumericEncoder
+from app.src.decoder.core import ArgMax
+from app.src.haze.models import IdeaModel, DecoderModel
+from app.src.registry.core import Registry
+from app.src.injector.core import Injector
+from app.src.injector.enums import GlobalTypes
+import numpy as np
+import pytest
+
+@pytest.fixture
+def haze() -> Haze:
+    haze = Haze(
+        persist=False,
+        config=Config(signal_threshold=0.1, neuron_firing_threshold=0.1),
+        engine=EngineType.COMPILED
+    )
+    haze.load(aperature_size=6, nexus_size=8, terminus_size=4)
+    return haze
+
+def _prepare(haze: Haze, input_data: list[float], outputs: list):
+    encoder = NumericEncoder()
+    decoder = ArgMax()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=decoder, outputs=outputs)])])
+    decoder.set_outputs(outputs)
+    encoder.check_sensors(input_data)
+    return encoder, decoder
+
+def _clear(decoder: ArgMax, registry: Registry):
+    decoder._reset_motors()
+    registry._reset_connectors()
+
+def test_propogate_doesMatchGraphMotorStates(haze: Haze):
+    input_data = [0.9, 0.2, 0.7, 0.5]
+    encoder, decoder = _prepare(haze, input_data, outputs=["foo", "bar", "baz"])
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+    _clear(decoder, registry)
+
+    context = Context()
+    for value, sensor in zip(input_data, encoder.get_sensors()):
+        sensor.transmit(context=context, input_value=value)
+    context.run()
+    graph_signals = [(m.get_signal_count(), m.get_state()) for m in decoder.get_motors()]
+    graph_status = registry._status.copy()
+    _clear(decoder, registry)
+
+    engine.propogate(sensors=encoder.get_sensors(), input_data=input_data)
+    compiled_signals = [(m.get_signal_count(), m.get_state()) for m in decoder.get_motors()]
+
+    assert any(count > 0 for count, _ in graph_signals)
+    for expected, actual in zip(graph_signals, compiled_signals):
+        assert actual == pytest.approx(expected)
+    assert np.array_equal(graph_status, registry._status)
+
+def test_propogate_doesSkipInactiveMotors(haze: Haze):
+    input_data = [0.9, 0.8]
+    encoder, decoder = _prepare(haze, input_data, outputs=["foo", "bar"])
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+    _clear(decoder, registry)
+    inactive = decoder.get_motors()[0]
+    inactive.set_active(False)
+
+    engine.propogate(sensors=encoder.get_sensors(), input_data=input_data)
+
+    assert inactive.get_signal_count() == 0
+
+def test_getGraph_doesRecompileWhenConnectionsChange(haze: Haze):
+    engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+    graph = engine.get_graph()
+    inter = haze.network.mesh.nexus.get_inters()[0]
+    inter.delete_connection(inter.get_connections()[0])
+
+    recompiled = engine.get_graph()
+
+    assert recompiled is not graph
+    assert recompiled.dendrites.size == graph.dendrites.size - 1
+
+def _propogate_each(engine: Engine, encoder: NumericEncoder, decoder: ArgMax, registry: Registry, rows: list[list[float]]):
+    signals, status = [], np.zeros(registry.get_size())
+    for row in rows:
+        _clear(decoder, registry)
+        engine.propogate(sensors=encoder.get_sensors(), input_data=row)
+        signals.append([(m.get_signal_count(), m.get_state()) for m in decoder.get_motors()])
+        status = np.maximum(status, registry._status)
+    _clear(decoder, registry)
+    return signals, status
+
+def _deliver_each(engine: Engine, decoder: ArgMax, results: list) -> list:
+    signals = []
+    for result in results:
+        decoder._reset_motors()
+        engine.deliver(result)
+        signals.append([(m.get_signal_count(), m.get_state()) for m in decoder.get_motors()])
+    return signals
+
+def test_propogateBatch_doesMatchSingleObservations(haze: Haze):
+    rows = [[0.9, 0.2, 0.7, 0.5], [0.1, 0.8, 0.3, 0.9], [0.5, 0.5, 0.9, 0.1]]
+    encoder, decoder = _prepare(haze, rows[0], outputs=["foo", "bar", "baz"])
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+    expected, expected_status = _propogate_each(engine, encoder, decoder, registry, rows)
+
+    results = engine.propogate_batch([(encoder.get_sensors(), row) for row in rows])
+    status = registry._status.copy()
+
+    assert all(any(count > 0 for count, _ in signals) for signals in expected)
+    assert np.allclose(_deliver_each(engine, decoder, results), expected)
+    assert np.array_equal(status, expected_status)
+
+def test_propogateBatch_doesSplitObservationsAcrossProcesses():
+    haze = Haze(
+        persist=False,
+        config=Config(signal_threshold=0.1, neuron_firing_threshold=0.1),
+        engine=EngineType.SHARDED,
+        executor=ExecutorType.PROCESS,
+        workers=2
+    )
+    haze.load(aperature_size=6, nexus_size=8, terminus_size=4)
+    rows = [[0.9, 0.2, 0.7, 0.5], [0.1, 0.8, 0.3, 0.9], [0.5, 0.5, 0.9, 0.1], [0.3, 0.9, 0.2, 0.6]]
+    encoder, decoder = _prepare(haze, rows[0], outputs=["foo", "bar", "baz"])
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    engine: Engine = Injector.resolve(GlobalTypes.ENGINE)
+    expected, expected_status = _propogate_each(engine, encoder, decoder, registry, rows)
+
+    results = engine.propogate_batch([(encoder.get_sensors(), row) for row in rows])
+    status = registry._status.copy()
+    shared = registry.is_shared()
+    signals = _deliver_each(engine, decoder, results)
+    haze.close()
+
+    assert shared
+    assert not registry.is_shared()
+    assert all(any(count > 0 for count, _ in observation) for observation in expected)
+    assert np.allclose(signals, expected)
+    assert np.array_equal(status, expected_status)
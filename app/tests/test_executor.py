@@ -0,0 +1,27 @@
+from app.src.executor.core import Executor
+from app.src.executor.enums import ExecutorType
+from app.src.executor.errors import ExecutionError
+import pytest
+
+def _fail_on_odd(value: int) -> int:
+    if value % 2 == 1:
+        raise ValueError(f"odd value {value}")
+    return value
+
+def test_map_doesKeepOrderAcrossThreads():
+    executor = Executor(type=ExecutorType.THREAD, workers=4, inline_below=0)
+
+    results = executor.map(lambda value: value * 2, list(range(100)))
+    executor.shutdown()
+
+    assert results == [value * 2 for value in range(100)]
+
+def test_map_doesRaiseTaskErrors():
+    executor = Executor(type=ExecutorType.THREAD, workers=2, inline_below=0)
+
+    with pytest.raises(ExecutionError) as error:
+        executor.map(_fail_on_odd, [0, 1, 2, 3])
+    executor.shutdown()
+
+    assert len(error.value.errors) == 2
+    assert isinstance(error.value.__cause__, ValueError)
@@ -11,7 +11,15 @@ from app.src.encoder.core import NumericEncoder, TextEncoder
 from app.src.encoder.enums import EncoderType
 from app.src.decoder.core import ArgMax, Regressor
 from app.src.haze.models import InputModel, IdeaModel, DecoderModel
+from app.src.core_io.enums import StorageType
+from app.src.engine.enums import EngineType
+from app.src.haze.errors import ReadOnlyModelError, BatchNotSupportedError
+from app.src.decoder.enums import DecoderType
+from app.src.neuron_io.enums import TransformerTypes
+from app.src.allocator.core import Allocator
+from app.src.config.core import Config
 import pytest
+import os
 
 @pytest.fixture
 def haze() -> Haze:
@@ -149,4 +157,288 @@ def test_learn_doesClearConnectionsWhenNeuronIsUnderConnected(haze: Haze):
     haze.observe(input_data=numeric_input_data, encoder=lexical_set[0].encoders[0])
     haze.predict()
     haze.learn(reward=0.1)
-    assert len(underconnected_inter._connections) > 1
\ No newline at end of file
+    assert len(underconnected_inter._connections) > 1
+
+def test_learn_doesReconnectFullyPrunedInter(haze: Haze):
+    haze.load()
+    network: Network = Injector.resolve(GlobalTypes.NETWORK)
+    pruned_inter = Inter(mesh=MeshType.NEXUS)
+    network.mesh.nexus._inters.append(pruned_inter)
+    lexical_set = [IdeaModel(encoders=[NumericEncoder()], decoders=[DecoderModel(decoder=Regressor(), outputs=[1, 10])])]
+    haze.set_lexical_chain(lexical_chain=lexical_set)
+    haze.observe(input_data=[1,2,3,4,5,6,7,8,9], encoder=lexical_set[0].encoders[0])
+    haze.predict()
+    haze.learn(reward=0.1)
+    assert len(pruned_inter._connections) > 1
+
+def test_learn_doesKeepMotorStatesWithinUnitRange(haze: Haze):
+    haze.load()
+    encoder = NumericEncoder()
+    decoder = ArgMax()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=decoder, outputs=[0, 1])])])
+    decoder_id = decoder.get_id(as_string=True)
+
+    # the bits of 1..20, a constant row normalizes below the signal threshold and never reaches the motors.
+    for row in [[(x >> bit) & 1 for bit in range(8)] for x in range(1, 21)]:
+        haze.observe(input_data=row, encoder=encoder)
+        assert all(0 <= m.get_state() <= 1 for m in decoder.get_motors())
+        result = haze.predict()[decoder_id][0]
+        assert 0 <= decoder.get_last_confidence() <= 1
+        haze.learn(reward=1.0 if result == row[0] else 0.0)
+
+def _train_rows(haze: Haze, rows: int) -> None:
+    haze.load()
+    encoder = NumericEncoder()
+    decoder = ArgMax()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=decoder, outputs=[0, 1])])])
+    decoder_id = decoder.get_id(as_string=True)
+
+    for x in range(1, rows + 1):
+        row = [(x >> bit) & 1 for bit in range(8)]
+        if len(set(row)) == 1:
+            continue
+        haze.observe(input_data=row, encoder=encoder)
+        result = haze.predict(limit=1)[decoder_id][0]
+        haze.learn(reward=1.0 if result == row[0] else 0.0)
+
+def test_predict_doesRecoverAcrossManyRows():
+    _train_rows(Haze(persist=False), 120)
+
+def test_predict_doesRecoverAcrossManyRowsWhenCompiled():
+    _train_rows(Haze(persist=False, engine=EngineType.COMPILED), 120)
+
+def _predict_rows(rows: list[list[int]], batch: bool) -> list[tuple[list, float]]:
+    haze = Haze(persist=False, engine=EngineType.COMPILED, config=Config(signal_threshold=0.1, neuron_firing_threshold=0.1))
+    haze.load()
+    encoder = NumericEncoder()
+    decoder = ArgMax()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=decoder, outputs=["a", "b", "c"])])])
+    decoder_id = decoder.get_id(as_string=True)
+    observations = [InputModel(input_data=row, encoder=encoder) for row in rows]
+
+    results = []
+    if batch:
+        for observation, observed in zip(observations, haze.observe_batch(observations)):
+            results.append((haze.predict_observed(observation, observed)[decoder_id], decoder.get_last_confidence()))
+    else:
+        for observation in observations:
+            haze.observe(input_data=observation.input_data, encoder=encoder)
+            results.append((haze.predict()[decoder_id], decoder.get_last_confidence()))
+    return results
+
+def test_predictObserved_doesMatchSerialPredictions():
+    rows = [[(x >> bit) & 1 for bit in range(8)] for x in range(1, 9)]
+
+    serial = _predict_rows(rows, batch=False)
+    batched = _predict_rows(rows, batch=True)
+
+    assert [answer for answer, _ in batched] == [answer for answer, _ in serial]
+    assert [confidence for _, confidence in batched] == pytest.approx([confidence for _, confidence in serial])
+
+def test_observeBatch_raisesErrorWhenModelCannotBatch(haze: Haze):
+    haze.load()
+    encoder = NumericEncoder()
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=ArgMax(), outputs=["a", "b"])])])
+
+    with pytest.raises(BatchNotSupportedError):
+        haze.observe_batch([InputModel(input_data=[1, 2, 3], encoder=encoder)])
+
+def _train_persisted(model_path: str, storage: StorageType) -> Haze:
+    haze = Haze(model_path=model_path, persist=True, storage=storage)
+    haze.load()
+    lexical_set = [
+        IdeaModel(
+            encoders=[NumericEncoder()],
+            decoders=[DecoderModel(decoder=ArgMax(), outputs=["foo", "bar"])]
+        )
+    ]
+    haze.set_lexical_chain(lexical_chain=lexical_set)
+    haze.observe(input_data=[1,3,5,7,9], encoder=lexical_set[0].encoders[0])
+    return haze
+
+def _connection_map(haze: Haze) -> dict[str, set]:
+    neurons = haze.network.get_all_neurons()
+    neurons.extend(Injector.resolve(GlobalTypes.NEURON_IO).get_all_neurons_by_transformer(TransformerTypes.ENCODER))
+    return {
+        n.get_id(): set((c.get_id(), c.get_dendrite().get_id()) for c in n.get_connections() if c._index is not None)
+        for n in neurons
+    }
+
+def test_save_doesRoundTripSnapshot(tmp_path):
+    haze = _train_persisted(str(tmp_path), StorageType.SNAPSHOT)
+    haze.save()
+    expected_connections = _connection_map(haze)
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    expected_strengths = {c.get_id(): c.get_strength() for c in registry._connectors if c is not None and c._index is not None}
+
+    assert os.listdir(tmp_path) == ["model.npz"]
+
+    loaded = Haze(model_path=str(tmp_path), persist=True, storage=StorageType.SNAPSHOT)
+    loaded.load()
+    registry = Injector.resolve(GlobalTypes.REGISTRY)
+    motors = Injector.resolve(GlobalTypes.NEURON_IO).get_neurons(DecoderType.ARGMAX)
+
+    assert _connection_map(loaded) == expected_connections
+    assert {c.get_id(): c.get_strength() for c in registry._connectors} == expected_strengths
+    assert sorted(m.answer for m in motors) == ["bar", "foo"]
+
+def test_load_doesConvertDirectoryToSnapshot(tmp_path):
+    haze = _train_persisted(str(tmp_path), StorageType.DIRECTORY)
+    expected_connections = _connection_map(haze)
+
+    converted = Haze(model_path=str(tmp_path), persist=True, storage=StorageType.SNAPSHOT)
+    converted.load()
+
+    assert os.path.exists(os.path.join(tmp_path, "model.npz"))
+    assert _connection_map(converted) == expected_connections
+
+def test_load_doesMapSnapshotForInference(tmp_path):
+    haze = _train_persisted(str(tmp_path), StorageType.SNAPSHOT)
+    haze.save()
+    input_data = [1,3,5,7,9]
+
+    loaded = Haze(model_path=str(tmp_path), persist=True, storage=StorageType.SNAPSHOT, engine=EngineType.COMPILED)
+    loaded.load()
+    encoder = NumericEncoder()
+    encoder.propogate(input_data)
+    expected = {m.answer: m.get_state() for m in Injector.resolve(GlobalTypes.NEURON_IO).get_neurons(DecoderType.ARGMAX)}
+
+    mapped = Haze(model_path=str(tmp_path), persist=True, storage=StorageType.SNAPSHOT)
+    mapped.load(mmap=True)
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    encoder = NumericEncoder()
+    encoder.propogate(input_data)
+    actual = {m.answer: m.get_state() for m in Injector.resolve(GlobalTypes.NEURON_IO).get_neurons(DecoderType.ARGMAX)}
+
+    assert isinstance(registry._strength, np.memmap)
+    assert len(mapped.network.get_all_neurons()) == 0
+    assert actual == pytest.approx(expected)
+    with pytest.raises(ReadOnlyModelError):
+        mapped.learn(reward=0.5)
+
+def test_load_doesReplayJournal(tmp_path):
+    haze = _train_persisted(str(tmp_path), StorageType.JOURNAL)
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    changed = next(c for c in registry._connectors if c is not None)
+    changed.set_strength(0.75)
+    expected_connections = _connection_map(haze)
+    expected_strengths = {c.get_id(): c.get_strength() for c in registry._connectors if c is not None}
+    with open(os.path.join(tmp_path, "journal.log"), "a") as file:
+        file.write('{"op":"put","key":"conn')
+
+    assert os.listdir(tmp_path) == ["journal.log"]
+
+    loaded = Haze(model_path=str(tmp_path), persist=True, storage=StorageType.JOURNAL)
+    loaded.load()
+    registry = Injector.resolve(GlobalTypes.REGISTRY)
+
+    assert os.path.getsize(os.path.join(tmp_path, "journal.log")) == 0
+    assert _connection_map(loaded) == expected_connections
+    assert {c.get_id(): c.get_strength() for c in registry._connectors} == pytest.approx(expected_strengths)
+
+def test_load_doesReportPhaseTimings(tmp_path):
+    haze = _train_persisted(str(tmp_path), StorageType.DIRECTORY)
+    expected_connections = _connection_map(haze)
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    expected_size = registry.get_size()
+
+    loaded = Haze(model_path=str(tmp_path), persist=True)
+    loaded.load()
+    report = loaded.get_load_report()
+
+    assert _connection_map(loaded) == expected_connections
+    assert list(report.phases.keys()) == ["read", "neurons", "connectors", "wiring"]
+    assert report.connectors == expected_size
+    assert report.total >= sum(report.phases.values())
+
+def test_load_doesReadDirectoryWithWorkers(tmp_path):
+    haze = _train_persisted(str(tmp_path), StorageType.DIRECTORY)
+    expected_connections = _connection_map(haze)
+
+    loaded = Haze(model_path=str(tmp_path), persist=True)
+    loaded.load(workers=4)
+
+    assert _connection_map(loaded) == expected_connections
+
+def test_stats_doesTimeObserveAndLearnStages():
+    haze = Haze(persist=False, stats=True)
+    haze.load()
+    lexical_set = [IdeaModel(encoders=[NumericEncoder()], decoders=[DecoderModel(decoder=ArgMax(), outputs=["foo", "bar"])])]
+    haze.set_lexical_chain(lexical_chain=lexical_set)
+    stages = []
+    haze.set_stats_callback(lambda stage, seconds: stages.append(stage))
+
+    haze.observe(input_data=[1, 3, 5, 7, 9], encoder=lexical_set[0].encoders[0])
+    haze.predict()
+    haze.learn(reward=0.8)
+    stats = haze.stats()
+
+    for stage in ["observe.propogate", "call_decoders", "learn.registry", "learn.audit", "learn.growth", "learn.prune", "learn.rewire"]:
+        assert stats.timers[stage].count >= 1
+        assert stage in stages
+    assert not Haze(persist=False).stats().timers
+
+def test_setOutputs_doesIndexMotorsByAnswer(haze: Haze):
+    haze.load()
+    decoder = ArgMax()
+    decoder.set_outputs(["foo", "bar", "baz"])
+    decoder.set_outputs(["baz", "qux"])
+    motors = decoder.get_motors()
+
+    assert [m.answer for m in motors] == ["foo", "bar", "baz", "qux"]
+    assert decoder.get_motor("qux") is motors[3]
+    assert decoder.get_motor("missing") is None
+    assert [m.answer for m in decoder.get_active_motors()] == ["baz", "qux"]
+    assert [m.get_active() for m in motors] == [False, False, True, True]
+    assert not decoder._index_motors()
+
+def test_setOutputs_doesNoticeOutputsChangedInPlace(haze: Haze):
+    haze.load()
+    encoder = NumericEncoder()
+    decoder = ArgMax()
+    outputs = ["a", "b"]
+    haze.set_lexical_chain([IdeaModel(encoders=[encoder], decoders=[DecoderModel(decoder=decoder, outputs=outputs)])])
+    haze.observe(input_data=[1, 3, 5, 7, 9], encoder=encoder)
+    haze.predict()
+
+    outputs.append("c")
+    outputs.remove("a")
+    haze.observe(input_data=[1, 3, 5, 7, 9], encoder=encoder)
+
+    assert [m.answer for m in decoder.get_active_motors()] == ["b", "c"]
+    assert decoder.get_motor("c") is not None
+    assert not decoder.get_motor("a").get_active()
+
+def test_checkTerminus_doesOnlyWireWhenTerminusChanges(haze: Haze, monkeypatch):
+    haze.load()
+    decoder = ArgMax()
+    decoder.set_outputs(["foo", "bar"])
+    wired = []
+    connect_motors = haze.network.connect_motors
+    monkeypatch.setattr(haze.network, "connect_motors", lambda motors: wired.append(motors) or connect_motors(motors))
+
+    decoder.set_outputs(["foo", "bar"])
+    assert wired == []
+
+    inter = haze.network.mesh.terminus.get_inters()[0]
+    motor = decoder.get_motor("foo")
+    inter.delete_connection(next(c for c in inter.get_connections() if c.get_dendrite() is motor))
+    haze.network.touch_terminus()
+    decoder.set_outputs(["foo", "bar"])
+
+    assert wired == [[motor]]
+    assert motor.has_incoming(inter.get_index())
+    assert motor.get_incoming()[-1]._index is not None
+
+def test_init_doesGiveEachModelItsOwnAllocator():
+    first = Haze(persist=False)
+    first.load()
+    allocator: Allocator = Injector.resolve(GlobalTypes.ALLOCATOR)
+    size = allocator.get_size()
+    indices = [n.get_index() for n in first.network.get_all_neurons()]
+
+    Haze(persist=False).load()
+
+    assert Injector.resolve(GlobalTypes.ALLOCATOR) is not allocator
+    assert allocator.get_size() == size
+    assert [n.get_index() for n in first.network.get_all_neurons()] == indices
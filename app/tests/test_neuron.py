@@ -10,11 +10,14 @@ from app.src.decoder.enums import DecoderType
 from app.src.encoder.enums import EncoderType
 from app.src.mesh.enums import MeshType
 from app.src.core_io.core import CoreIO
+from app.src.allocator.core import Allocator
 from app.src.registry.core import Registry
 from app.src.injector.core import Injector
 from app.src.injector.enums import GlobalTypes
 from app.src.config.core import Config
+from app.src.motor_bank.core import MotorBank
 from uuid import uuid4
+import numpy as np
 
 @pytest.fixture(autouse=True)
 def reset_injector():
@@ -22,6 +25,14 @@ def reset_injector():
     yield
     Injector._instances.clear()
 
+@pytest.fixture
+def registry() -> Registry:
+    Injector.register(GlobalTypes.CONFIG, instance=Config())
+    Injector.register(GlobalTypes.ALLOCATOR, instance=Allocator())
+    Injector.register(GlobalTypes.CORE, instance=CoreIO())
+    Injector.register(GlobalTypes.REGISTRY, instance=Registry())
+    return Injector.resolve(GlobalTypes.REGISTRY)
+
 def test_setConnectionStrength_doesRaiseErrorWhenConnectionNotFound():
     Injector.register(GlobalTypes.REGISTRY, instance=Registry())
     Injector.register(GlobalTypes.CONFIG, instance=Config())
@@ -248,4 +259,60 @@ def test_inter_save_state():
     mock_core.save_to_file.assert_called_once_with(
         inter.record(),
         f"mock_mesh_path/aperture/{inter.get_id(as_string=True)}"
-    )
\ No newline at end of file
+    )
+
+def test_postConnections_doesRaiseErrorWhenBatchDuplicatesDendrite(registry: Registry):
+    dendrite = Inter()
+    connections = [Connector(dendrite=Inter()), Connector(dendrite=dendrite), Connector(dendrite=dendrite)]
+    registry.add_connectors(connections)
+    node = Inter()
+
+    node.post_connections(connections[:2])
+
+    assert node.get_connections() == connections[:2]
+    with pytest.raises(IdenticalConnectionError):
+        node.post_connections(connections[2:])
+
+def test_pruneConnections_doesDropMaskedConnections(registry: Registry):
+    registry.add_connectors([Connector(dendrite=Inter())])
+    connections = [Connector(dendrite=Inter()) for _ in range(3)]
+    registry.add_connectors(connections, strengths=[0.9, 0.1, 0.9], epsilons=[0.7, 0.7, 0.7])
+    node = Inter()
+    node.post_connections(connections)
+
+    pruned = node.prune_connections(registry.get_pruning_mask(threshold=0.3))
+
+    assert pruned == [connections[1]]
+    assert node.get_connections() == [connections[0], connections[2]]
+    assert len(set(n.get_index() for n in [node] + [c.get_dendrite() for c in connections])) == 4
+
+def test_getIncoming_doesTrackConnectionsToDendrite(registry: Registry):
+    dendrite = Inter()
+    axons = [Inter() for _ in range(3)]
+    connections = [Connector(dendrite=dendrite) for _ in axons]
+    for axon, connection in zip(axons, connections):
+        axon.post_connection(connection)
+
+    axons[0].delete_connection(connections[0])
+    axons[1].clear_connections()
+
+    assert dendrite.get_incoming() == [connections[2]]
+    assert dendrite.has_incoming(axons[2].get_index())
+    assert not dendrite.has_incoming(axons[0].get_index())
+    with pytest.raises(IdenticalConnectionError):
+        axons[2].post_connection(Connector(dendrite=dendrite))
+
+def test_reset_doesClearMotorStates(registry: Registry):
+    bank = MotorBank()
+    motors = [Motor(answer=x) for x in range(3)]
+    bank.adopt(motors)
+    motors[0].accumulate(np.array([0.2, 0.4]))
+    motors[1].transmit(Transmission(Context(), Signal(0.5)))
+
+    assert np.allclose(bank.get_states(np.array([m.get_slot() for m in motors])), [0.3, 0.5, 0.0])
+    assert motors[0].get_signal_count() == 2
+
+    bank.reset()
+
+    assert [m.get_state() for m in motors] == [0.0, 0.0, 0.0]
+    assert motors[0].get_signal_count() == 0
@@ -5,7 +5,11 @@ from app.src.injector.core import Injector
 from app.src.injector.enums import GlobalTypes
 from app.src.config.core import Config
 from app.src.core_io.core import CoreIO
+from app.src.allocator.core import Allocator
+from app.src.terminal.core import Terminal
+import numpy as np
 import pytest
+import os
 
 # what does registry need to do?
 # registry needs to store connection strengths and epsilons
@@ -19,6 +23,14 @@ def reset_injector():
     yield
     Injector._instances.clear()
 
+@pytest.fixture
+def registry() -> Registry:
+    Injector.register(GlobalTypes.CONFIG, instance=Config())
+    Injector.register(GlobalTypes.ALLOCATOR, instance=Allocator())
+    Injector.register(GlobalTypes.CORE, instance=CoreIO())
+    Injector.register(GlobalTypes.REGISTRY, instance=Registry())
+    return Injector.resolve(GlobalTypes.REGISTRY)
+
 def test_addConnection_doesAddConnection():
     Injector.register(GlobalTypes.REGISTRY, instance=Registry())
     Injector.register(GlobalTypes.CONFIG, instance=Config())
@@ -52,4 +64,75 @@ def test_addConnection_addsMultipleConnections():
     assert len(registry._epsilon) == 2
     assert len(registry._status) == 2
     assert registry._status[1] == 0
-    assert registry._epsilon[1] == 0.5
\ No newline at end of file
+    assert registry._epsilon[1] == 0.5
+
+def test_addConnectors_doesAddBatchOfConnections(registry: Registry):
+    connectors = [Connector(dendrite=Inter()) for _ in range(5)]
+    registry.add_connectors(connectors, strengths=[0.5, 0.6, 0.7, 0.8, 0.9], epsilons=[0.2] * 5)
+    assert [c._index for c in connectors] == [0, 1, 2, 3, 4]
+    assert len(registry._connectors) == 5
+    assert list(registry._strength) == [0.5, 0.6, 0.7, 0.8, 0.9]
+    assert list(registry._epsilon) == [0.2] * 5
+    assert list(registry._status) == [0] * 5
+
+def test_addConnector_doesGrowCapacityGeometrically(registry: Registry):
+    capacities = set()
+    for _ in range(100):
+        registry.add_connector(Connector(dendrite=Inter()), 0.8, 0.5)
+        capacities.add(registry.get_capacity())
+    registry.activate_connectors([99])
+    assert registry.get_size() == 100
+    assert len(registry._strength) == 100
+    assert len(capacities) <= 4
+    assert registry._status[99] == 1
+    assert registry._strength_store[99] == 0.8
+
+def test_learn_doesOnlySaveActiveConnectors(tmp_path):
+    Injector.register(GlobalTypes.CONFIG, instance=Config())
+    Injector.register(GlobalTypes.ALLOCATOR, instance=Allocator())
+    Injector.register(GlobalTypes.CORE, instance=CoreIO(path=str(tmp_path), persist=True))
+    Injector.register(GlobalTypes.REGISTRY, instance=Registry())
+    registry: Registry = Injector.resolve(GlobalTypes.REGISTRY)
+    core: CoreIO = Injector.resolve(GlobalTypes.CORE)
+    connectors = [Connector(dendrite=Inter()) for _ in range(4)]
+    registry.add_connectors(connectors)
+    registry.activate_connector(2)
+    registry.learn(confidence=0.5, reward=0.9)
+    saved = sorted(os.listdir(core._connection_path))
+    assert saved == [f"{connectors[2].get_id(as_string=True)}.json"]
+    assert len(registry._dirty) == 0
+
+def test_getTable_doesTrackConnectorEndpoints(registry: Registry):
+    axon = Inter()
+    dendrites = [Inter(), Inter()]
+    connectors = [Connector(dendrite=d) for d in dendrites]
+    registry.add_connectors(connectors, strengths=[0.5, 0.8], epsilons=[0.7, 0.7])
+    table = registry.get_table()
+
+    assert table.axons.tolist() == [-1, -1]
+
+    axon.post_connections(connectors)
+    axon.delete_connection(connectors[0])
+
+    assert table.axons.tolist() == [-1, axon.get_index()]
+    assert table.dendrites.tolist() == [d.get_index() for d in dendrites]
+    assert table.defaults.tolist() == [False, True]
+    assert connectors[1].is_default
+
+def test_compact_doesRemapLiveConnectors(registry: Registry):
+    dendrites = [Inter() for _ in range(4)]
+    connectors = [Connector(dendrite=d) for d in dendrites]
+    registry.add_connectors(connectors, strengths=[0.5, 0.6, 0.7, 0.8])
+
+    removed = registry.remove_connectors(np.array([0, 2]))
+    revision = Terminal.get_revision()
+    remap = registry.compact()
+
+    assert removed == [connectors[0], connectors[2]]
+    assert remap.tolist() == [-1, 0, -1, 1]
+    assert registry.get_size() == 2
+    assert [c._index for c in registry._connectors] == [0, 1]
+    assert registry._strength.tolist() == [0.6, 0.8]
+    assert registry.get_table().dendrites.tolist() == [dendrites[1].get_index(), dendrites[3].get_index()]
+    assert registry.get_dead_count() == 0
+    assert Terminal.get_revision() > revision
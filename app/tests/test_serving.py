@@ -0,0 +1,59 @@
+from app.src.haze.core import Haze
+from app.src.encoder.core import NumericEncoder
+from app.src.decoder.core import ArgMax
+from app.src.haze.models import IdeaModel, DecoderModel
+from app.src.serving.core import AsyncHaze
+from app.src.engine.enums import EngineType
+from app.src.decoder.errors import IncorrectOutputType
+import asyncio
+import pytest
+
+@pytest.fixture
+def haze() -> Haze:
+    haze = Haze(persist=False, engine=EngineType.COMPILED)
+    haze.load()
+    return haze
+
+def _lexical_set(outputs: list) -> list[IdeaModel]:
+    return [IdeaModel(encoders=[NumericEncoder()], decoders=[DecoderModel(decoder=ArgMax(), outputs=outputs)])]
+
+def test_observeAndPredict_doesBatchConcurrentRequests(haze: Haze):
+    outputs = ["foo", "bar"]
+    lexical_set = _lexical_set(outputs)
+    haze.set_lexical_chain(lexical_chain=lexical_set)
+    decoder_id = lexical_set[0].decoders[0].decoder.get_id(as_string=True)
+    serving = AsyncHaze(haze, window=0.05, max_batch=8)
+
+    async def serve():
+        requests = [serving.observe_and_predict([1, 3, 5, 7, x], encoder=lexical_set[0].encoders[0]) for x in range(8)]
+        results = await asyncio.gather(*requests)
+        await serving.close()
+        return results
+
+    results = asyncio.run(serve())
+    stats = serving.get_stats()
+
+    assert all(result[decoder_id][0] in outputs for result in results)
+    assert stats.requests == 8
+    assert stats.errors == 0
+    assert stats.batches < 8
+    assert stats.combined_batches >= 1
+    assert sum(size * count for size, count in stats.batch_sizes.items()) == 8
+    assert stats.queue_depth == 0
+
+def test_observeAndPredict_doesRaiseRequestErrors(haze: Haze):
+    lexical_set = _lexical_set([0.5, 1.5])
+    haze.set_lexical_chain(lexical_chain=lexical_set)
+    serving = AsyncHaze(haze)
+
+    async def serve():
+        try:
+            await serving.observe_and_predict([1, 3, 5], encoder=lexical_set[0].encoders[0])
+        finally:
+            await serving.close()
+
+    # argmax does not take float outputs.
+    with pytest.raises(IncorrectOutputType):
+        asyncio.run(serve())
+    assert serving.get_stats().errors == 1
+    assert serving.get_stats().batches == 1
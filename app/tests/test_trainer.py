@@ -0,0 +1,57 @@
+from app.src.haze.core import Haze
+from app.src.encoder.core import NumericEncoder
+from app.src.decoder.core import ArgMax
+from app.src.haze.models import IdeaModel, DecoderModel
+from app.src.trainer.core import Trainer
+from app.src.trainer.errors import SinglePassDatasetError
+from app.src.core_io.enums import StorageType
+import pytest
+import os
+
+@pytest.fixture
+def haze() -> Haze:
+    haze = Haze(persist=False)
+    haze.load()
+    return haze
+
+def _trainer(haze: Haze, **kwargs) -> Trainer:
+    outputs = ["foo", "bar"]
+    lexical_set = [IdeaModel(encoders=[NumericEncoder()], decoders=[DecoderModel(decoder=ArgMax(), outputs=outputs)])]
+    haze.set_lexical_chain(lexical_chain=lexical_set)
+    decoder_id = lexical_set[0].decoders[0].decoder.get_id(as_string=True)
+    reward = lambda expected, prediction: 1.0 if prediction[decoder_id][0] == expected else 0.0
+    return Trainer(haze=haze, encoder=lexical_set[0].encoders[0], reward=reward, **kwargs)
+
+def _rows(count: int):
+    for x in range(count):
+        yield [1, 3, 5, 7, x], "foo" if x % 2 == 0 else "bar"
+
+def test_practice_doesStreamEpochsAndCheckpoint(tmp_path):
+    haze = Haze(model_path=str(tmp_path), persist=True, storage=StorageType.SNAPSHOT)
+    haze.load()
+    trainer = _trainer(haze, checkpoint_steps=3)
+
+    report = trainer.practice(lambda: _rows(4), epochs=2)
+
+    assert report.rows == 8
+    assert report.epochs == 2
+    assert report.checkpoints == 2
+    assert report.skipped_checkpoints == 0
+    assert os.path.exists(os.path.join(str(tmp_path), "model.npz"))
+    assert set(report.stages.keys()) >= {"observe", "predict", "reward", "learn", "checkpoint"}
+    assert 0.0 <= report.get_mean_reward() <= 1.0
+    assert report.get_rows_per_second() > 0
+
+def test_practice_doesSkipCheckpointsWhenNothingIsSaved(haze: Haze):
+    trainer = _trainer(haze, checkpoint_steps=3)
+
+    report = trainer.practice(lambda: _rows(4), epochs=2)
+
+    assert report.checkpoints == 0
+    assert report.skipped_checkpoints == 2
+
+def test_practice_raisesErrorWhenIteratorIsReused(haze: Haze):
+    trainer = _trainer(haze)
+
+    with pytest.raises(SinglePassDatasetError):
+        trainer.practice(_rows(4), epochs=2)